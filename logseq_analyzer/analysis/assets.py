@@ -1,14 +1,17 @@
 """Logseq Assets Analysis Module."""
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import unquote
 
 import logseq_analyzer.patterns.content as content_patterns
 
+from ..utils.aho_corasick import AhoCorasick
 from ..utils.enums import CritContent, CritEmb, FileType, Output
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
     from ..logseq_file.file import LogseqFile
     from .index import FileIndex
@@ -111,50 +114,71 @@ class LogseqAssets:
         self.process()
 
     def process(self) -> None:
-        """Handle assets for the Logseq Analyzer."""
-        asset_mentions = set()
-        update_mentions = asset_mentions.update
-        clear_mentions = asset_mentions.clear
-        asset_criteria = LogseqAssets._ASSET_CRITERIA
-        update_asset_backlink = LogseqAssets.update_asset_backlink
+        """Handle assets for the Logseq Analyzer.
+
+        Unlinked asset names are compiled once into an Aho-Corasick automaton, so every
+        mention is scanned a single time instead of being compared against each asset.
+        """
         yield_assets = self.yield_assets
-        index = self.index
+        unlinked = LogseqAssets.group_by_name(yield_assets(backlinked=False))
+        if unlinked:
+            self.match_mentions(unlinked)
 
-        for f in index:
-            asset_file_processed = False
-            if not (f_data := f.data):
-                continue
+        self.backlinked.update(yield_assets(backlinked=True))
+        self.not_backlinked.update(yield_assets(backlinked=False))
+
+    def match_mentions(self, unlinked: dict[str, list[LogseqFile]]) -> None:
+        """Mark unlinked assets as backlinked when their name occurs in an asset mention."""
+        automaton = AhoCorasick(unlinked)
+        find_names = automaton.find_all
+        pop_unlinked = unlinked.pop
+        mark_backlinked = LogseqAssets.mark_backlinked
+        iter_mentions = LogseqAssets.iter_asset_mentions
 
-            get_data = f_data.get
-            for criteria in asset_criteria:
-                update_mentions(get_data(criteria, []))
+        for f in self.index:
+            if not unlinked:
+                break
 
-            if not asset_mentions:
+            if not (mentions := set(iter_mentions(f))):
                 continue
 
             f_name = f.path.name
-            for asset_file in yield_assets(backlinked=False):
-                update_asset_backlink(asset_mentions, asset_file, f_name)
-                asset_file_processed = True
-
-            if not asset_file_processed:
+            if any(f_name in mention for mention in mentions):
+                for asset_files in unlinked.values():
+                    mark_backlinked(asset_files)
+                unlinked.clear()
                 break
 
-            clear_mentions()
+            for mention in mentions:
+                for name in find_names(mention):
+                    mark_backlinked(pop_unlinked(name, ()))
 
-        del asset_mentions
+    @staticmethod
+    def iter_asset_mentions(f: LogseqFile) -> Generator[str]:
+        """Yield the asset mentions of a file, plus their URL-decoded form when it differs."""
+        if not (f_data := f.data):
+            return
+
+        get_data = f_data.get
+        for criteria in LogseqAssets._ASSET_CRITERIA:
+            for mention in get_data(criteria, []):
+                yield mention
+                if (decoded := unquote(mention)) != mention:
+                    yield decoded
 
-        self.backlinked.update(yield_assets(backlinked=True))
-        self.not_backlinked.update(yield_assets(backlinked=False))
+    @staticmethod
+    def group_by_name(asset_files: Iterable[LogseqFile]) -> dict[str, list[LogseqFile]]:
+        """Group asset files by their name, as several files may share a stem."""
+        by_name = defaultdict(list)
+        for asset_file in asset_files:
+            by_name[asset_file.path.name].append(asset_file)
+        return by_name
 
     @staticmethod
-    def update_asset_backlink(asset_mentions: set[str], asset_file: LogseqFile, filename: str) -> None:
-        """Update the asset backlink information."""
-        names = (asset_file.path.name, filename)
-        for asset_mention in asset_mentions:
-            if any(name in asset_mention for name in names):
-                asset_file.node.backlinked = True
-                return
+    def mark_backlinked(asset_files: Iterable[LogseqFile]) -> None:
+        """Mark the asset files as backlinked."""
+        for asset_file in asset_files:
+            asset_file.node.backlinked = True
 
     def yield_assets(self, *, backlinked: bool | None = None) -> Generator[LogseqFile]:
         """Yield all asset files from the index."""
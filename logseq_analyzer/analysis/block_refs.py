@@ -0,0 +1,122 @@
+"""Resolve block references and block embeds against the block UUID index."""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ..utils.enums import CritContent, CritDblCurly, CritDblParen, Output
+from ..utils.helpers import get_count_and_foundin_data, sort_dict_by_value
+
+if TYPE_CHECKING:
+    from .index import FileIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class LogseqBlockRefs:
+    """Class to resolve `((uuid))` block references and embeds in the graph."""
+
+    index: FileIndex
+    block_index: dict[str, tuple[str, int]] = field(default_factory=dict)
+    duplicate_ids: dict[str, list[str]] = field(default_factory=dict)
+    broken: dict[str, dict[str, Any]] = field(default_factory=dict)
+    referenced: dict[str, dict[str, Any]] = field(default_factory=dict)
+    cross_page: dict[str, Counter[str]] = field(default_factory=dict)
+    summary: dict[str, int] = field(default_factory=dict)
+
+    _REF_CRITERIA: ClassVar[tuple[str, ...]] = (CritDblParen.BLOCK_REFS, CritDblCurly.BLOCK_EMBEDS)
+    _UUID_LENGTH: ClassVar[int] = 36
+    _TOP_REFERENCED: ClassVar[int] = 100
+
+    def __post_init__(self) -> None:
+        """Initialize the LogseqBlockRefs instance."""
+        self.build_block_index()
+        self.resolve_refs()
+
+    def build_block_index(self) -> None:
+        """Build the UUID to (file name, block offset) index from the parsed `id::` properties."""
+        block_index = self.block_index
+        duplicate_ids = self.duplicate_ids
+        for f in self.index:
+            if not (block_ids := f.data.get(CritContent.BLOCK_IDS)):
+                continue
+            f_name = f.path.name
+            for block_uuid, offset in block_ids.items():
+                if (existing := block_index.get(block_uuid)) is None:
+                    block_index[block_uuid] = (f_name, offset)
+                    continue
+                duplicate_ids.setdefault(block_uuid, [existing[0]]).append(f_name)
+
+    def resolve_refs(self) -> None:
+        """Resolve every block reference and block embed with a single index lookup each."""
+        get_block = self.block_index.get
+        broken = self.broken
+        cross_page = self.cross_page
+        ref_counts = Counter()
+        referenced_from: dict[str, Counter[str]] = {}
+        uuid_length = LogseqBlockRefs._UUID_LENGTH
+        total = same_page = 0
+        for f in self.index:
+            f_data = f.data
+            f_name = f.path.name
+            for criteria in LogseqBlockRefs._REF_CRITERIA:
+                if not (refs := f_data.get(criteria)):
+                    continue
+                block_uuids = [LogseqBlockRefs.ref_to_uuid(ref, uuid_length) for ref in refs]
+                total += len(block_uuids)
+                broken_uuids = []
+                for block_uuid in block_uuids:
+                    if (target := get_block(block_uuid)) is None:
+                        broken_uuids.append(block_uuid)
+                        continue
+                    ref_counts[block_uuid] += 1
+                    referenced_from.setdefault(block_uuid, Counter())[f_name] += 1
+                    if target[0] == f_name:
+                        same_page += 1
+                    else:
+                        cross_page.setdefault(target[0], Counter())[f_name] += 1
+                if broken_uuids:
+                    get_count_and_foundin_data(broken, broken_uuids, f_name)
+
+        block_index = self.block_index
+        self.referenced = {
+            block_uuid: {
+                "count": count,
+                "file": block_index[block_uuid][0],
+                "block": block_index[block_uuid][1],
+                "found_in": referenced_from[block_uuid],
+            }
+            for block_uuid, count in ref_counts.most_common(LogseqBlockRefs._TOP_REFERENCED)
+        }
+        self.broken = sort_dict_by_value(broken, value="count", reverse=True)
+        broken_count = sum(v["count"] for v in broken.values())
+        self.summary = {
+            "block_ids": len(block_index),
+            "duplicate_block_ids": len(self.duplicate_ids),
+            "references": total,
+            "resolved": total - broken_count,
+            "broken": broken_count,
+            "same_page": same_page,
+            "cross_page": total - broken_count - same_page,
+        }
+        if broken:
+            logger.info("Found %d broken block references", broken_count)
+
+    @staticmethod
+    def ref_to_uuid(ref: str, uuid_length: int = _UUID_LENGTH) -> str:
+        """Return the lowercased UUID inside a `((uuid))` reference or `{{embed ((uuid))}}` embed."""
+        start = ref.find("((") + 2
+        return ref[start : start + uuid_length].lower()
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Generate a report of the block reference analysis."""
+        return {
+            Output.BLOCK_IDS_DUPLICATE: self.duplicate_ids,
+            Output.BLOCK_REFS_BROKEN: self.broken,
+            Output.BLOCK_REFS_CROSS_PAGE: self.cross_page,
+            Output.BLOCK_REFS_MOST_REFERENCED: self.referenced,
+            Output.BLOCK_REFS_SUMMARY: self.summary,
+        }
@@ -0,0 +1,126 @@
+"""Detect duplicate and near-duplicate blocks across the graph."""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import logseq_analyzer.patterns.content as content_patterns
+
+from ..utils.enums import FileType, Output
+from ..utils.minhash import MinHashLSH
+
+if TYPE_CHECKING:
+    from .index import FileIndex
+
+
+@dataclass(slots=True)
+class LogseqDuplicateBlocks:
+    """Class to find duplicated bullets by content hash and by MinHash similarity.
+
+    Bullets are normalized (properties removed, casefolded, whitespace collapsed) and
+    grouped by a hash of the normalized text; only digests, signatures and block
+    locations are kept, never the text itself.
+    """
+
+    index: FileIndex
+    lsh: MinHashLSH = field(default_factory=MinHashLSH)
+    locations: dict[bytes, list[tuple[str, int]]] = field(default_factory=dict)
+    exact: dict[str, dict[str, Any]] = field(default_factory=dict)
+    near: list[dict[str, Any]] = field(default_factory=list)
+    summary: dict[str, int] = field(default_factory=dict)
+
+    _FILE_TYPES: ClassVar[frozenset[str]] = frozenset({FileType.JOURNAL, FileType.PAGE})
+    _MIN_CHARS: ClassVar[int] = 24
+    _MIN_WORDS: ClassVar[int] = 5
+    _DIGEST_SIZE: ClassVar[int] = 16
+
+    def __post_init__(self) -> None:
+        """Initialize the LogseqDuplicateBlocks instance."""
+        self.process()
+
+    def process(self) -> None:
+        """Hash every bullet and collect exact and near-duplicate clusters."""
+        lsh_digests = self.hash_bullets()
+        self.collect_exact()
+        self.collect_near(lsh_digests)
+        self.summary = {
+            "unique_blocks": len(self.locations),
+            "exact_clusters": len(self.exact),
+            "exact_duplicate_blocks": sum(v["count"] for v in self.exact.values()),
+            "near_clusters": len(self.near),
+            "near_duplicate_blocks": sum(v["count"] for v in self.near),
+            "lsh_oversized_buckets": self.lsh.oversized_buckets,
+        }
+
+    def hash_bullets(self) -> list[bytes]:
+        """Group bullets by normalized-content digest and add each new text to the LSH index.
+
+        Returns:
+            list[bytes]: The digest of each LSH item id.
+
+        """
+        locations = self.locations
+        lsh_add = self.lsh.add
+        lsh_digests = []
+        file_types = LogseqDuplicateBlocks._FILE_TYPES
+        min_chars = LogseqDuplicateBlocks._MIN_CHARS
+        min_words = LogseqDuplicateBlocks._MIN_WORDS
+        digest_size = LogseqDuplicateBlocks._DIGEST_SIZE
+        strip_properties = content_patterns.PROPERTY_VALUE.sub
+        blake2b = hashlib.blake2b
+        for f in self.index:
+            if f.path.file_type not in file_types or not f.info.size.has_content:
+                continue
+            f_name = f.path.name
+            for offset, bullet in enumerate(f.bullets.all_bullets):
+                if len(bullet) < min_chars:
+                    continue
+                words = strip_properties("", bullet).casefold().split()
+                normalized = " ".join(words)
+                if len(normalized) < min_chars:
+                    continue
+                digest = blake2b(normalized.encode(), digest_size=digest_size).digest()
+                if (blocks := locations.get(digest)) is None:
+                    locations[digest] = blocks = []
+                    if len(words) >= min_words:
+                        lsh_add(words)
+                        lsh_digests.append(digest)
+                blocks.append((f_name, offset))
+        return lsh_digests
+
+    def collect_exact(self) -> None:
+        """Collect the clusters of bullets with identical normalized content."""
+        exact = {
+            digest.hex(): LogseqDuplicateBlocks.blocks_report(blocks)
+            for digest, blocks in self.locations.items()
+            if len(blocks) > 1
+        }
+        self.exact = dict(sorted(exact.items(), key=lambda item: item[1]["count"], reverse=True))
+
+    def collect_near(self, lsh_digests: list[bytes]) -> None:
+        """Collect the clusters of bullets with similar but not identical content."""
+        locations = self.locations
+        near = []
+        for items in self.lsh.clusters():
+            blocks = [block for item in items for block in locations[lsh_digests[item]]]
+            cluster = LogseqDuplicateBlocks.blocks_report(blocks)
+            cluster["variants"] = len(items)
+            near.append(cluster)
+        self.near = sorted(near, key=lambda cluster: cluster["count"], reverse=True)
+
+    @staticmethod
+    def blocks_report(blocks: list[tuple[str, int]]) -> dict[str, Any]:
+        """Summarize block locations as a count and the bullet offsets per file."""
+        found_in: dict[str, list[int]] = {}
+        for f_name, offset in blocks:
+            found_in.setdefault(f_name, []).append(offset)
+        return {"count": len(blocks), "found_in": found_in}
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Generate a report of the duplicate block analysis."""
+        return {
+            Output.DUPLICATES_EXACT: self.exact,
+            Output.DUPLICATES_NEAR: self.near,
+            Output.DUPLICATES_SUMMARY: self.summary,
+        }
@@ -0,0 +1,229 @@
+"""Graph-theoretic metrics over the page-reference graph."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from ..utils.enums import FileType, Output
+
+if TYPE_CHECKING:
+    from .index import FileIndex
+
+
+@dataclass(slots=True)
+class ReferenceGraph:
+    """Sparse adjacency of the page-reference graph with integer node ids."""
+
+    names: list[str] = field(default_factory=list)
+    node_ids: dict[str, int] = field(default_factory=dict)
+    out_adj: list[set[int]] = field(default_factory=list)
+    in_adj: list[list[int]] = field(default_factory=list)
+    edges: int = 0
+
+    def node(self, name: str) -> int:
+        """Return the id of a node, adding it if missing."""
+        if (node_id := self.node_ids.get(name)) is None:
+            node_id = len(self.names)
+            self.node_ids[name] = node_id
+            self.names.append(name)
+            self.out_adj.append(set())
+        return node_id
+
+    def build_in_adjacency(self) -> None:
+        """Build the reverse adjacency lists from the forward edges."""
+        in_adj = [[] for _ in self.names]
+        edges = 0
+        for source, targets in enumerate(self.out_adj):
+            edges += len(targets)
+            for target in targets:
+                in_adj[target].append(source)
+        self.in_adj = in_adj
+        self.edges = edges
+
+
+@dataclass(slots=True)
+class LogseqGraphMetrics:
+    """Class to compute components, PageRank and degree distributions of the graph.
+
+    Nodes are pages, journals and every referenced name; an edge points from the file
+    containing a reference to the referenced page, as collected by LogseqGraph.
+    """
+
+    index: FileIndex
+    all_linked_refs: dict[str, dict[str, Any]]
+    graph: ReferenceGraph = field(default_factory=ReferenceGraph)
+    pagerank: dict[str, float] = field(default_factory=dict)
+    components: list[list[str]] = field(default_factory=list)
+    degrees: dict[str, dict[int, int]] = field(default_factory=dict)
+    hubs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    summary: dict[str, Any] = field(default_factory=dict)
+
+    _NODE_FILE_TYPES: ClassVar[frozenset[str]] = frozenset({FileType.JOURNAL, FileType.PAGE})
+    _DAMPING: ClassVar[float] = 0.85
+    _MAX_ITERATIONS: ClassVar[int] = 100
+    _TOLERANCE: ClassVar[float] = 1.0e-6
+    _TOP_HUBS: ClassVar[int] = 100
+
+    def __post_init__(self) -> None:
+        """Initialize the LogseqGraphMetrics instance."""
+        self.process()
+
+    def process(self) -> None:
+        """Build the reference graph and compute its metrics."""
+        self.build_graph()
+        graph = self.graph
+        if not graph.names:
+            return
+
+        out_degree = [len(targets) for targets in graph.out_adj]
+        in_degree = [len(sources) for sources in graph.in_adj]
+        ranks, iterations = LogseqGraphMetrics.compute_pagerank(graph.in_adj, out_degree)
+        roots = LogseqGraphMetrics.compute_components(graph.out_adj)
+        self.collect_components(roots)
+        self.collect_pagerank(ranks)
+        self.collect_degrees(in_degree, out_degree)
+        self.collect_hubs(ranks, in_degree, out_degree)
+        self.summary = {
+            "nodes": len(graph.names),
+            "edges": graph.edges,
+            "components": len(self.components),
+            "largest_component": len(self.components[0]),
+            "isolated_nodes": sum(1 for component in self.components if len(component) == 1),
+            "pagerank_iterations": iterations,
+        }
+
+    def build_graph(self) -> None:
+        """Build the sparse page-reference graph from the linked references."""
+        graph = self.graph
+        node = graph.node
+        out_adj = graph.out_adj
+        node_file_types = LogseqGraphMetrics._NODE_FILE_TYPES
+        for f in self.index:
+            if f.path.file_type in node_file_types:
+                node(f.path.name)
+
+        # Sorted so that node ids, and with them the float summation order of
+        # PageRank, do not depend on the order the references were collected in.
+        for target_name, values in sorted(self.all_linked_refs.items()):
+            target = node(target_name)
+            for source_name in sorted(values.get("found_in", {})):
+                source = node(source_name)
+                if source != target:
+                    out_adj[source].add(target)
+        graph.build_in_adjacency()
+
+    @staticmethod
+    def compute_pagerank(
+        in_adj: list[list[int]],
+        out_degree: list[int],
+        damping: float = _DAMPING,
+        max_iterations: int = _MAX_ITERATIONS,
+        tolerance: float = _TOLERANCE,
+    ) -> tuple[list[float], int]:
+        """Compute PageRank by power iteration over the reverse adjacency lists.
+
+        Rank held by nodes without outgoing edges is redistributed uniformly.
+
+        Returns:
+            tuple[list[float], int]: The rank per node id and the number of iterations run.
+
+        """
+        n = len(in_adj)
+        ranks = [1.0 / n] * n
+        teleport = (1.0 - damping) / n
+        dangling_nodes = [node for node, degree in enumerate(out_degree) if not degree]
+        inverse_degree = [1.0 / degree if degree else 0.0 for degree in out_degree]
+        iterations = 0
+        while iterations < max_iterations:
+            iterations += 1
+            share = [rank * inverse for rank, inverse in zip(ranks, inverse_degree, strict=True)]
+            get_share = share.__getitem__
+            dangling_mass = sum(ranks[node] for node in dangling_nodes)
+            base = teleport + damping * dangling_mass / n
+            new_ranks = [base + damping * sum(map(get_share, sources)) for sources in in_adj]
+            error = sum(abs(new - old) for new, old in zip(new_ranks, ranks, strict=True))
+            ranks = new_ranks
+            if error < n * tolerance:
+                break
+        return ranks, iterations
+
+    @staticmethod
+    def compute_components(out_adj: list[set[int]]) -> list[int]:
+        """Find weakly connected components with union-find (path halving, union by size).
+
+        Returns:
+            list[int]: The root node id of the component of each node.
+
+        """
+        parent = list(range(len(out_adj)))
+        size = [1] * len(out_adj)
+        for source, targets in enumerate(out_adj):
+            for target in targets:
+                a = source
+                while parent[a] != a:
+                    parent[a] = parent[parent[a]]
+                    a = parent[a]
+                b = target
+                while parent[b] != b:
+                    parent[b] = parent[parent[b]]
+                    b = parent[b]
+                if a == b:
+                    continue
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size[b]
+
+        roots = []
+        for node in range(len(parent)):
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            roots.append(root)
+        return roots
+
+    def collect_components(self, roots: list[int]) -> None:
+        """Group node names by component, largest component first."""
+        names = self.graph.names
+        groups: dict[int, list[str]] = {}
+        for node, root in enumerate(roots):
+            groups.setdefault(root, []).append(names[node])
+        self.components = sorted(
+            (sorted(group) for group in groups.values()), key=lambda group: (-len(group), group[0])
+        )
+
+    def collect_pagerank(self, ranks: list[float]) -> None:
+        """Map PageRank scores to node names, highest first and ties by name."""
+        ranked = sorted(zip(self.graph.names, ranks, strict=True), key=lambda item: (-item[1], item[0]))
+        self.pagerank = {name: round(rank, 8) for name, rank in ranked}
+
+    def collect_degrees(self, in_degree: list[int], out_degree: list[int]) -> None:
+        """Build the in-degree and out-degree distributions."""
+        self.degrees = {
+            "in_degree": dict(sorted(Counter(in_degree).items())),
+            "out_degree": dict(sorted(Counter(out_degree).items())),
+        }
+
+    def collect_hubs(self, ranks: list[float], in_degree: list[int], out_degree: list[int]) -> None:
+        """Collect the top pages by PageRank with their degrees."""
+        names = self.graph.names
+        top = sorted(range(len(ranks)), key=lambda node: (-ranks[node], names[node]))[: LogseqGraphMetrics._TOP_HUBS]
+        self.hubs = {
+            names[node]: {
+                "pagerank": round(ranks[node], 8),
+                "in_degree": in_degree[node],
+                "out_degree": out_degree[node],
+            }
+            for node in top
+        }
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Generate a report of the graph metrics."""
+        return {
+            Output.GRAPH_COMPONENTS: self.components,
+            Output.GRAPH_DEGREE_DISTRIBUTION: self.degrees,
+            Output.GRAPH_HUBS: self.hubs,
+            Output.GRAPH_METRICS_SUMMARY: self.summary,
+            Output.GRAPH_PAGERANK: self.pagerank,
+        }
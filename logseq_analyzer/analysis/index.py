@@ -4,7 +4,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Self
+from typing import TYPE_CHECKING, Any
 
 from ..logseq_file.file import LogseqFile
 from ..utils.enums import Output
@@ -24,24 +24,13 @@ class FileIndex:
     _name_to_files: dict[str, list[LogseqFile]] = field(default_factory=lambda: defaultdict(list))
     _path_to_file: dict[Path, LogseqFile] = field(default_factory=dict)
 
-    _instance: ClassVar[FileIndex | None] = None
-    write_graph: ClassVar[bool] = False
-
-    def __new__(cls) -> Self:
-        """Ensure only one instance of FileIndex is created."""
-        if isinstance(cls._instance, cls):
-            return cls._instance
-
-        cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __len__(self) -> int:
         """Return the number of files in the index."""
         return len(self._files)
 
     def __iter__(self) -> Iterator[LogseqFile]:
-        """Iterate over the files in the index."""
-        return iter(self._files)
+        """Iterate over the files in the index in the order they were added."""
+        return iter(self._path_to_file.values())
 
     def __getitem__(self, f: Any) -> Any:
         """Get a file by its key."""
@@ -69,7 +58,9 @@ class FileIndex:
         raise TypeError(msg)
 
     def add(self, f: LogseqFile) -> None:
-        """Add a file to the index."""
+        """Add a file to the index, replacing a previously indexed version of the same path."""
+        if f in self._files:
+            self._remove_file(f)
         self._files.add(f)
         self._name_to_files[f.path.name].append(f)
         self._path_to_file[f.path.file] = f
@@ -127,14 +118,18 @@ class FileIndex:
     @property
     def report(self) -> dict[str, Any]:
         """Generate a report of the indexed files."""
-        report = {
+        return {
             Output.GRAPH_CONTENT_DATA: self.graph_content_data,
             Output.GRAPH_DATA: self.graph_data,
-            Output.IDX_FILES: self._files,
+            Output.IDX_FILES: list(self),
             Output.IDX_NAME_TO_FILES: self._name_to_files,
             Output.IDX_PATH_TO_FILE: self._path_to_file,
         }
-        if FileIndex.write_graph:
-            report[Output.GRAPH_CONTENT] = {f: f.bullets.content for f in self}
-            report[Output.GRAPH_BULLETS] = {f: f.bullets.all_bullets for f in self}
-        return report
+
+    @property
+    def content_report(self) -> dict[str, Any]:
+        """Generate a report of the full graph content."""
+        return {
+            Output.GRAPH_CONTENT: {f: f.bullets.content for f in self},
+            Output.GRAPH_BULLETS: {f: f.bullets.all_bullets for f in self},
+        }
@@ -1,8 +1,10 @@
 """Process logseq journals."""
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
 
 from ..utils.date_utilities import DateUtilities
 from ..utils.enums import FileType, Output
@@ -29,12 +31,11 @@ class LogseqJournals:
 
     index: FileIndex
     dangling_links: set[str]
+    journal_page_format: str = ""
     sets: JournalSets = field(default_factory=JournalSets)
     dangling: dict[str, list[datetime]] = field(default_factory=lambda: defaultdict(list))
     timeline_stats: dict[str, Any] = field(default_factory=dict)
 
-    journal_page_format: ClassVar[str] = ""
-
     def __post_init__(self) -> None:
         """Initialize the LogseqJournals class."""
         self.process()
@@ -45,52 +46,49 @@ class LogseqJournals:
 
     def process(self) -> None:
         """Process journal keys to build the complete timeline and detect missing entries."""
-        dangling = sorted(DateUtilities.journals_to_datetime(self.dangling_links, LogseqJournals.journal_page_format))
+        page_format = self.journal_page_format
+        dangling = sorted(DateUtilities.journals_to_datetime(self.dangling_links, page_format))
         journals = (f.path.name for f in self.index if f.path.file_type == FileType.JOURNAL)
-        self.sets.existing.extend(
-            sorted(DateUtilities.journals_to_datetime(journals, LogseqJournals.journal_page_format))
-        )
+        self.sets.existing.extend(sorted(DateUtilities.journals_to_datetime(journals, page_format)))
         self.build_complete_timeline(dangling)
         self.get_dangling_journals_outside_range(dangling)
 
     def build_complete_timeline(self, dangling_journals: list[datetime]) -> None:
-        """Build a complete timeline of journal entries, filling in any missing dates."""
-        existing = self.sets.existing
-        timeline = self.sets.timeline
-        append_missing = self.sets.missing.append
-        append_timeline = timeline.append
+        """Build a complete timeline of journal entries, filling in any missing dates.
+
+        Dates are handled as ordinal days: the timeline is the day range between the
+        first and last journal, and missing days come from the gaps between consecutive
+        journals minus the days linked by dangling journal references.
+        """
+        existing_days = sorted({date.toordinal() for date in self.sets.existing})
+        dangling_days = {date.toordinal() for date in dangling_journals}
+        missing_days = []
+        extend_missing = missing_days.extend
+        for day, next_day in pairwise(existing_days):
+            if next_day - day > 1:
+                extend_missing(sorted(set(range(day + 1, next_day)).difference(dangling_days)))
+
+        timeline_days = range(existing_days[0], existing_days[-1] + 1) if existing_days else range(0)
+        self.sets.timeline = [DateUtilities.from_ordinal(day) for day in timeline_days]
+        self.sets.missing = [DateUtilities.from_ordinal(day) for day in missing_days]
+        self.sets.all_journals = sorted(self.sets.timeline + dangling_journals)
         get_stats = DateUtilities.stats
-        next_date = DateUtilities.next
-        for i, date in enumerate(existing):
-            append_timeline(date)
-            next_expected = next_date(date)
-            next_existing = existing[i + 1] if i + 1 < len(existing) else None
-            while next_existing and next_expected < next_existing:
-                append_timeline(next_expected)
-                if next_expected not in dangling_journals:
-                    append_missing(next_expected)
-                next_expected = next_date(next_expected)
-        self.sets.all_journals = sorted(timeline + dangling_journals)
         self.timeline_stats = {
-            "timeline": get_stats(timeline),
+            "timeline": get_stats(self.sets.timeline[:1] + self.sets.timeline[-1:]),
             "dangling": get_stats(dangling_journals),
-            "total": get_stats(self.sets.all_journals),
+            "total": get_stats(self.sets.all_journals[:1] + self.sets.all_journals[-1:]),
         }
 
     def get_dangling_journals_outside_range(self, dangling_journals: list[datetime]) -> None:
-        """Check for dangling journals that are outside the range of the complete timeline."""
-        append_dangling_past = self.dangling["past"].append
-        append_dangling_future = self.dangling["future"].append
-        append_dangling_inside = self.dangling["inside"].append
-        first_date = self.timeline_stats["timeline"]["first"]
-        last_date = self.timeline_stats["timeline"]["last"]
-        for link in dangling_journals:
-            if link < first_date:
-                append_dangling_past(link)
-            elif link > last_date:
-                append_dangling_future(link)
-            else:
-                append_dangling_inside(link)
+        """Split the sorted dangling journals into those before, inside and after the timeline."""
+        dangling = self.dangling
+        if not (timeline := self.sets.timeline):
+            return
+        past_end = bisect_left(dangling_journals, timeline[0])
+        future_start = bisect_right(dangling_journals, timeline[-1], lo=past_end)
+        dangling["past"].extend(dangling_journals[:past_end])
+        dangling["future"].extend(dangling_journals[future_start:])
+        dangling["inside"].extend(dangling_journals[past_end:future_start])
 
     @property
     def report(self) -> dict[str, Any]:
@@ -39,6 +39,65 @@ class NamespaceConflicts:
     parent_unique: dict[tuple[str, int], set[str]] = field(default_factory=lambda: defaultdict(set))
 
 
+@dataclass(slots=True)
+class NamespaceNode:
+    """Node of the namespace trie with subtree rollups."""
+
+    name: str = ""
+    full_name: str = ""
+    level: int = 0
+    children: dict[str, NamespaceNode] = field(default_factory=dict)
+    size: int = 0
+    bullets: int = 0
+    direct_children: int = 0
+    descendants: int = 0
+    total_size: int = 0
+    total_bullets: int = 0
+
+    def child(self, part: str) -> NamespaceNode:
+        """Return the child node for a part, adding it if missing.
+
+        Children are keyed by the lowercased part, like page names in Logseq, and
+        keep the casing of the first page that created them.
+        """
+        key = part.lower()
+        if (node := self.children.get(key)) is None:
+            full_name = f"{self.full_name}{Core.NS_SEP}{part}" if self.level else part
+            node = NamespaceNode(name=part, full_name=full_name, level=self.level + 1)
+            self.children[key] = node
+        return node
+
+    def compute_rollups(self) -> None:
+        """Compute the subtree counts of every node in a single post-order traversal."""
+        order = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            children = node.children.values()
+            node.direct_children = len(children)
+            node.descendants = node.direct_children + sum(c.descendants for c in children)
+            node.total_size = node.size + sum(c.total_size for c in children)
+            node.total_bullets = node.bullets + sum(c.total_bullets for c in children)
+
+    def as_tree(self) -> dict[str, Any]:
+        """Return the hierarchy below this node as nested dictionaries keyed by part."""
+        return {node.name: node.as_tree() for node in self.children.values()}
+
+    @property
+    def rollup(self) -> dict[str, int]:
+        """Return the subtree counts of this node."""
+        return {
+            "level": self.level,
+            "direct_children": self.direct_children,
+            "descendants": self.descendants,
+            "total_size": self.total_size,
+            "total_bullets": self.total_bullets,
+        }
+
+
 @dataclass(slots=True)
 class NamespaceStructure:
     """Class to hold namespace structure data."""
@@ -46,7 +105,8 @@ class NamespaceStructure:
     data: dict[str, Any] = field(default_factory=dict)
     details: dict[str, Any] = field(default_factory=dict)
     parts: dict[str, Any] = field(default_factory=dict)
-    tree: dict[str, Any] = field(default_factory=dict)
+    root: NamespaceNode = field(default_factory=NamespaceNode)
+    nodes: dict[str, NamespaceNode] = field(default_factory=dict)
     unique_ns_per_level: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
     unique_parts: set[str] = field(default_factory=set)
 
@@ -58,7 +118,8 @@ class LogseqNamespaces:
     index: FileIndex
     dangling_links: set[str]
     _part_levels: defaultdict[str, set[int]] = field(default_factory=lambda: defaultdict(set))
-    _part_entries: defaultdict[str, list[dict[str, Any]]] = field(default_factory=lambda: defaultdict(list))
+    _part_level_entries: defaultdict[tuple[str, int], list[str]] = field(default_factory=lambda: defaultdict(list))
+    _part_level_parents: defaultdict[tuple[str, int], set[str]] = field(default_factory=lambda: defaultdict(set))
     conflicts: NamespaceConflicts = field(default_factory=NamespaceConflicts)
     structure: NamespaceStructure = field(default_factory=NamespaceStructure)
     queries: dict[str, dict[str, Any]] = field(default_factory=dict)
@@ -75,19 +136,24 @@ class LogseqNamespaces:
         self.detect_parent_depth_conflicts()
 
     def init_ns_parts(self) -> None:
-        """Create namespace parts from the data."""
+        """Create namespace parts and the namespace trie from the data."""
         _structure = self.structure
         details = _structure.details
         unique_parts_add = _structure.unique_parts.add
         unique_ns_per_level = _structure.unique_ns_per_level
         data = _structure.data
         part_levels = self._part_levels
-        part_entries = self._part_entries
+        part_level_entries = self._part_level_entries
+        part_level_parents = self._part_level_parents
+        join_to_ns_sep = Core.NS_SEP.join
+        nodes = _structure.nodes
         level_distribution = Counter()
+        root_pages = []
         for f in self.index:
             if not f.info.namespace.is_namespace:
+                root_pages.append(f)
                 continue
-            current_level = _structure.tree
+            current_node = _structure.root
             f_name = f.path.name
             data[f_name] = {
                 k: getattr(f.info.namespace, k) for k in f.info.namespace.__slots__ if hasattr(f.info.namespace, k)
@@ -95,19 +161,39 @@ class LogseqNamespaces:
             if not (parts := data[f_name].get("parts")):
                 continue
             _structure.parts[f_name] = parts
-            for part, level in parts.items():
+            name_parts = f_name.split(Core.NS_SEP)
+            for level, part in enumerate(name_parts, start=1):
                 unique_parts_add(part)
                 unique_ns_per_level[level].add(part)
                 level_distribution[level] += 1
-                current_level.setdefault(part, {})
-                current_level = current_level[part]
+                current_node = current_node.child(part)
+                nodes.setdefault(current_node.full_name.lower(), current_node)
                 part_levels[part].add(level)
-                part_entries[part].append({"entry": f_name, "level": level})
+                part_level_entries[part, level].append(f_name)
+                part_level_parents[part, level].add(join_to_ns_sep(name_parts[:level]))
+            current_node.size = f.info.size.size
+            current_node.bullets = f.info.bullet.bullets
+        for f in root_pages:
+            if node := nodes.get(f.path.name.lower()):
+                node.size = f.info.size.size
+                node.bullets = f.info.bullet.bullets
+        _structure.root.compute_rollups()
         details["level_distribution"] = dict(level_distribution)
+        details["size_per_level"] = self.rollup_per_level()
+
+    def rollup_per_level(self) -> dict[int, dict[str, int]]:
+        """Sum the pages, bytes and bullets of the namespace nodes at each level."""
+        per_level: dict[int, dict[str, int]] = {}
+        for node in self.structure.nodes.values():
+            level = per_level.setdefault(node.level, {"nodes": 0, "size": 0, "bullets": 0})
+            level["nodes"] += 1
+            level["size"] += node.size
+            level["bullets"] += node.bullets
+        return dict(sorted(per_level.items()))
 
     def analyze_ns_queries(self) -> None:
         """Analyze namespace queries."""
-        get_structure = self.structure.data.get
+        get_node = self.structure.nodes.get
         search_page_ref_pattern = content_patterns.PAGE_REFERENCE.search
         find_all_page_ref_pattern = content_patterns.PAGE_REFERENCE.findall
         ns_queries = self.queries
@@ -134,7 +220,10 @@ class LogseqNamespaces:
                 ns_queries.setdefault(query, {})
                 ns_queries[query].setdefault("found_in", []).append(f_path.name)
                 ns_queries[query]["namespace"] = page_ref
-                ns_queries[query]["size"] = get_structure(page_ref, {}).get("size", 0)
+                node = get_node(page_ref.lower())
+                ns_queries[query]["size"] = node.descendants if node else 0
+                ns_queries[query]["total_size"] = node.total_size if node else 0
+                ns_queries[query]["total_bullets"] = node.total_bullets if node else 0
                 ns_queries[query]["uri"] = f_path.uri
                 ns_queries[query]["logseq_url"] = f_path.logseq_url
         self.queries = sort_dict_by_value(ns_queries, value="size", reverse=True)
@@ -153,32 +242,22 @@ class LogseqNamespaces:
         intersect_dangling = potential_dangling.intersection
 
         for entry, parts in parts_items:
-            for part in intersect_non_ns(parts):
+            for part in sorted(intersect_non_ns(parts)):
                 non_ns_conflicts[part].append(entry)
-            for part in intersect_dangling(parts):
+            for part in sorted(intersect_dangling(parts)):
                 dangling_conflicts[part].append(entry)
 
     def detect_parent_depth_conflicts(self) -> None:
         """Identify namespace parts that appear at different depths (levels) across entries."""
-        part_levels = self._part_levels.items()
-        part_entries = self._part_entries
+        part_levels = self._part_levels
+        part_level_parents = self._part_level_parents
         parent_depth_conflicts = self.conflicts.parent_depth
         parent_unique_conflicts = self.conflicts.parent_unique
-        join_to_ns_sep = Core.NS_SEP.join
-        for part, levels in part_levels:
-            if len(levels) < 2:
+        for key, entries in self._part_level_entries.items():
+            if len(part_levels[key[0]]) < 2:
                 continue
-
-            details = part_entries[part]
-
-            for level in levels:
-                key = (part, level)
-                entries = (d["entry"] for d in details if d["level"] == level)
-
-                for entry in entries:
-                    up_to_level = entry.split(Core.NS_SEP)[:level]
-                    parent_unique_conflicts[key].add(join_to_ns_sep(up_to_level))
-                    parent_depth_conflicts[key].append(entry)
+            parent_depth_conflicts[key] = entries
+            parent_unique_conflicts[key] = part_level_parents[key]
 
     @property
     def report(self) -> dict[str, Any]:
@@ -190,8 +269,9 @@ class LogseqNamespaces:
             Output.NS_CONFLICTS_PARENT_UNIQUE: self.conflicts.parent_unique,
             Output.NS_DATA: self.structure.data,
             Output.NS_DETAILS: self.structure.details,
-            Output.NS_HIERARCHY: self.structure.tree,
+            Output.NS_HIERARCHY: self.structure.root.as_tree(),
             Output.NS_PARTS: self.structure.parts,
+            Output.NS_ROLLUPS: {name: node.rollup for name, node in self.structure.nodes.items()},
             Output.NS_QUERIES: self.queries,
             Output.NS_UNIQUE_PARTS: self.structure.unique_parts,
             Output.NS_UNIQUE_PER_LEVEL: self.structure.unique_ns_per_level,
@@ -0,0 +1,101 @@
+"""Aggregate task markers, priorities and scheduling across the graph."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any
+
+from ..patterns.tasks import CLOSED_MARKERS
+from ..utils.enums import CritTask, Output
+from ..utils.helpers import get_count_and_foundin_data, sort_dict_by_value
+
+if TYPE_CHECKING:
+    from .index import FileIndex
+
+
+@dataclass(slots=True)
+class LogseqTasks:
+    """Class to report task states, overdue tasks and deadline load from the parsed task data.
+
+    Open tasks past their DEADLINE are overdue; open tasks SCHEDULED before
+    today are reported separately, as scheduling is a start date, not a due date.
+    """
+
+    index: FileIndex
+    now_ts: float
+    markers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    priorities: dict[str, dict[str, Any]] = field(default_factory=dict)
+    overdue: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    scheduled_past: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    deadline_load: dict[str, int] = field(default_factory=dict)
+    scheduled_load: dict[str, int] = field(default_factory=dict)
+    summary: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Initialize the LogseqTasks instance."""
+        self.process()
+
+    def process(self) -> None:
+        """Aggregate the task data of every file."""
+        today = datetime.fromtimestamp(self.now_ts, tz=UTC).date()
+        markers = self.markers
+        priorities = self.priorities
+        overdue = self.overdue
+        scheduled_past = self.scheduled_past
+        deadline_load = Counter()
+        scheduled_load = Counter()
+        for f in self.index:
+            f_data = f.data
+            f_name = f.path.name
+            if f_markers := f_data.get(CritTask.MARKERS):
+                get_count_and_foundin_data(markers, f_markers, f_name)
+            if f_priorities := f_data.get(CritTask.PRIORITIES):
+                get_count_and_foundin_data(priorities, f_priorities, f_name)
+            for kind, load, past in (
+                (CritTask.DEADLINES, deadline_load, overdue),
+                (CritTask.SCHEDULED, scheduled_load, scheduled_past),
+            ):
+                for iso_date, marker in f_data.get(kind, ()):
+                    if marker in CLOSED_MARKERS:
+                        continue
+                    load[iso_date] += 1
+                    if (days := LogseqTasks.days_overdue(iso_date, today)) > 0:
+                        past.setdefault(f_name, []).append({"date": iso_date, "marker": marker, "days_past": days})
+
+        self.markers = sort_dict_by_value(markers, value="count", reverse=True)
+        self.priorities = dict(sorted(priorities.items()))
+        self.deadline_load = dict(sorted(deadline_load.items()))
+        self.scheduled_load = dict(sorted(scheduled_load.items()))
+        self.overdue = dict(sorted(overdue.items()))
+        self.scheduled_past = dict(sorted(scheduled_past.items()))
+        open_tasks = sum(v["count"] for k, v in markers.items() if k not in CLOSED_MARKERS)
+        self.summary = {
+            "tasks": sum(v["count"] for v in markers.values()),
+            "open": open_tasks,
+            "closed": sum(v["count"] for k, v in markers.items() if k in CLOSED_MARKERS),
+            "overdue": sum(len(items) for items in overdue.values()),
+            "scheduled_past": sum(len(items) for items in scheduled_past.values()),
+            "open_with_deadline": sum(deadline_load.values()),
+            "open_with_scheduled": sum(scheduled_load.values()),
+        }
+
+    @staticmethod
+    def days_overdue(iso_date: str, today: date) -> int:
+        """Return how many days before today a date is, or 0 for invalid or future dates."""
+        try:
+            return (today - date.fromisoformat(iso_date)).days
+        except ValueError:
+            return 0
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Generate a report of the task analysis."""
+        return {
+            Output.TASKS_DEADLINE_LOAD: self.deadline_load,
+            Output.TASKS_MARKERS: self.markers,
+            Output.TASKS_OVERDUE: self.overdue,
+            Output.TASKS_PRIORITIES: self.priorities,
+            Output.TASKS_SCHEDULED_LOAD: self.scheduled_load,
+            Output.TASKS_SCHEDULED_PAST: self.scheduled_past,
+            Output.TASKS_SUMMARY: self.summary,
+        }
@@ -0,0 +1,265 @@
+"""Full-text inverted index over the blocks of the graph."""
+
+import logging
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+from ..utils.enums import FileType
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ..logseq_file.file import LogseqFile
+    from .index import FileIndex
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the pickled layout changes, so a cached index in an older layout is rebuilt.
+INDEX_VERSION = 2
+# Block keys hold the file id above the block offset.
+OFFSET_BITS = 32
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+TOKEN = re.compile(r"\w+")
+QUERY_TERM = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into casefolded word tokens."""
+    return TOKEN.findall(text.casefold())
+
+
+def intersect(first: Sequence[int], second: Sequence[int]) -> list[int]:
+    """Return the keys found in both sorted sequences.
+
+    Each key of the shorter sequence is looked up in the longer one by galloping
+    forward from the previous position and bisecting the last step, so long posting
+    lists are probed rather than scanned. Keys are unique within a sequence.
+    """
+    small, large = (first, second) if len(first) <= len(second) else (second, first)
+    found = []
+    append = found.append
+    size = len(large)
+    lo = 0
+    for key in small:
+        if lo == size:
+            break
+        if large[lo] < key:
+            step = 1
+            hi = lo + 1
+            while hi < size and large[hi] < key:
+                lo = hi + 1
+                hi = lo + step
+                step <<= 1
+            lo = bisect_left(large, key, lo, min(hi, size))
+            if lo == size:
+                break
+        if large[lo] == key:
+            append(key)
+            lo += 1
+    return found
+
+
+@dataclass(slots=True)
+class QueryClause:
+    """A conjunction of required and excluded terms; each term is a token sequence."""
+
+    required: list[list[str]] = field(default_factory=list)
+    excluded: list[list[str]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TextIndex:
+    """Inverted index mapping tokens to the blocks that contain them.
+
+    Each posting list is an unsigned 64-bit array of block keys, the file id in the
+    high and the block offset in the low 32 bits. Files get increasing ids and their
+    blocks are added in order, so every posting list is sorted and queries intersect
+    them with a galloping search instead of building sets. Re-indexing a modified
+    file retires its old file id and appends postings under a new one; retired ids
+    are filtered at query time until `compact` drops them and renumbers the live
+    files, which `sync` does once it has applied the changes.
+    """
+
+    postings: dict[str, array] = field(default_factory=dict)
+    paths: list[str | None] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    file_ids: dict[str, int] = field(default_factory=dict)
+    mtimes: dict[str, float] = field(default_factory=dict)
+    retired: set[int] = field(default_factory=set)
+    version: int = INDEX_VERSION
+
+    _FILE_TYPES: ClassVar[frozenset[str]] = frozenset(
+        {FileType.JOURNAL, FileType.PAGE, FileType.SUB_JOURNAL, FileType.SUB_PAGE}
+    )
+
+    def __len__(self) -> int:
+        """Return the number of indexed files."""
+        return len(self.file_ids)
+
+    def add_file(self, f: LogseqFile) -> None:
+        """Index the blocks of a file, replacing any previous version of it."""
+        path = str(f.path.file)
+        self.remove(path)
+        if f.path.file_type not in TextIndex._FILE_TYPES:
+            return
+        file_id = len(self.paths)
+        self.paths.append(path)
+        self.names.append(f.path.name)
+        self.file_ids[path] = file_id
+        self.mtimes[path] = f.path.stat.st_mtime
+        postings = self.postings
+        base = file_id << OFFSET_BITS
+        for offset, bullet in enumerate(f.bullets.all_bullets):
+            for token in set(tokenize(bullet)):
+                if (posting := postings.get(token)) is None:
+                    postings[token] = posting = array("Q")
+                posting.append(base | offset)
+
+    def remove(self, path: str) -> None:
+        """Retire the postings of a file."""
+        if (file_id := self.file_ids.pop(path, None)) is None:
+            return
+        self.mtimes.pop(path, None)
+        self.paths[file_id] = None
+        self.retired.add(file_id)
+        if len(self.retired) > len(self.file_ids):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop the postings of retired file ids and renumber the live files in their current order."""
+        if not self.retired:
+            return
+        remap = {}
+        paths: list[str | None] = []
+        names = []
+        for file_id, path in enumerate(self.paths):
+            if path is not None:
+                remap[file_id] = len(paths)
+                paths.append(path)
+                names.append(self.names[file_id])
+        postings = self.postings
+        for token, posting in list(postings.items()):
+            kept = array(
+                "Q",
+                (
+                    remap[key >> OFFSET_BITS] << OFFSET_BITS | key & OFFSET_MASK
+                    for key in posting
+                    if key >> OFFSET_BITS in remap
+                ),
+            )
+            if kept:
+                postings[token] = kept
+            else:
+                del postings[token]
+        self.paths = paths
+        self.names = names
+        self.file_ids = {path: remap[file_id] for path, file_id in self.file_ids.items()}
+        self.retired.clear()
+        logger.debug("Compacted text index to %d files and %d tokens", len(paths), len(postings))
+
+    def sync(self, index: FileIndex) -> None:
+        """Index new or modified files of the file index, drop files no longer in it and compact."""
+        seen = set()
+        get_mtime = self.mtimes.get
+        for f in index:
+            if f.path.file_type not in TextIndex._FILE_TYPES:
+                continue
+            path = str(f.path.file)
+            seen.add(path)
+            if get_mtime(path) != f.path.stat.st_mtime:
+                self.add_file(f)
+        for path in self.file_ids.keys() - seen:
+            self.remove(path)
+        self.compact()
+
+    def lookup(self, token: str) -> Sequence[int]:
+        """Return the sorted keys of the live blocks containing a token."""
+        if (posting := self.postings.get(token)) is None:
+            return ()
+        if retired := self.retired:
+            return [key for key in posting if key >> OFFSET_BITS not in retired]
+        return posting
+
+    @staticmethod
+    def parse_query(query: str) -> list[QueryClause]:
+        """Parse a query into OR-separated clauses.
+
+        Terms in a clause are ANDed; quoted terms are phrases; a leading `-` or a
+        preceding `NOT` excludes a term.
+        """
+        clauses = [QueryClause()]
+        negate = False
+        for match in QUERY_TERM.finditer(query):
+            minus, phrase, word = match.groups()
+            if word in ("OR", "|"):
+                clauses.append(QueryClause())
+                continue
+            if word == "AND":
+                continue
+            if word == "NOT":
+                negate = True
+                continue
+            if word and word.startswith("-") and len(word) > 1:
+                minus, word = "-", word[1:]
+            if tokens := tokenize(phrase if word is None else word):
+                target = clauses[-1].excluded if minus or negate else clauses[-1].required
+                target.append(tokens)
+            negate = False
+        return [clause for clause in clauses if clause.required]
+
+    def search(self, query: str, index: FileIndex | None = None) -> list[tuple[str, int]]:
+        """Run a boolean query and return the matching (page name, block offset) pairs, sorted.
+
+        Multi-token terms must appear as consecutive tokens in the block; this check
+        reads the block text from the file index and is skipped without one.
+        """
+        results: set[int] = set()
+        for clause in TextIndex.parse_query(query):
+            results.update(self.match_clause(clause, index))
+        names = self.names
+        return sorted((names[key >> OFFSET_BITS], key & OFFSET_MASK) for key in results)
+
+    def match_clause(self, clause: QueryClause, index: FileIndex | None) -> Sequence[int]:
+        """Return the sorted keys of the blocks matching every required term and no excluded term."""
+        blocks = None
+        for tokens in sorted(clause.required, key=lambda t: min(len(self.postings.get(x, ())) for x in t)):
+            blocks = self.match_term(tokens, index, within=blocks)
+            if not blocks:
+                return ()
+        for tokens in clause.excluded:
+            if excluded := set(self.match_term(tokens, index, within=blocks)):
+                blocks = [key for key in blocks if key not in excluded]
+        return blocks or ()
+
+    def match_term(
+        self, tokens: list[str], index: FileIndex | None, within: Sequence[int] | None = None
+    ) -> Sequence[int]:
+        """Return the sorted keys of the blocks containing all tokens, consecutively if there are several."""
+        blocks = within
+        for token in tokens:
+            posting = self.lookup(token)
+            blocks = posting if blocks is None else intersect(blocks, posting)
+            if not blocks:
+                return ()
+        if len(tokens) > 1 and index is not None:
+            blocks = [key for key in blocks if self.has_phrase(key, tokens, index)]
+        return blocks
+
+    def has_phrase(self, key: int, tokens: list[str], index: FileIndex) -> bool:
+        """Check that the tokens appear consecutively in the text of a block."""
+        file_id, offset = key >> OFFSET_BITS, key & OFFSET_MASK
+        if (path := self.paths[file_id]) is None or (f := index[Path(path)]) is None:
+            return False
+        block_tokens = tokenize(f.bullets.all_bullets[offset])
+        size = len(tokens)
+        first = tokens[0]
+        return any(
+            block_tokens[i : i + size] == tokens
+            for i, token in enumerate(block_tokens[: len(block_tokens) - size + 1])
+            if token == first
+        )
@@ -0,0 +1,104 @@
+"""Detect plain-text mentions of existing pages that are not linked."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import logseq_analyzer.patterns.content as content_patterns
+
+from ..utils.aho_corasick import AhoCorasick
+from ..utils.enums import CritContent, FileType, Output
+from ..utils.helpers import get_count_and_foundin_data, sort_dict_by_value
+
+if TYPE_CHECKING:
+    from ..logseq_file.file import LogseqFile
+    from .index import FileIndex
+
+LINKED_REGION_MASKING = (
+    content_patterns.MASKED_PLACEHOLDER.sub,
+    content_patterns.TAGGED_BACKLINK.sub,
+    content_patterns.PAGE_REFERENCE.sub,
+    content_patterns.TAG.sub,
+    content_patterns.PROPERTY_VALUE.sub,
+)
+
+
+@dataclass(slots=True)
+class LogseqUnlinkedReferences:
+    """Class to find unlinked references to pages and aliases across the graph.
+
+    All page names and aliases are compiled once into an Aho-Corasick automaton and every
+    file is scanned a single time, so the cost grows with the content size only. Code,
+    advanced commands and URLs are already masked by LogseqFile; page references, tags
+    and property lines are blanked before scanning.
+    """
+
+    index: FileIndex
+    aliases: set[str]
+    names: dict[str, str] = field(default_factory=dict)
+    unlinked_refs: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    _NAME_FILE_TYPES: ClassVar[frozenset[str]] = frozenset({FileType.JOURNAL, FileType.PAGE})
+    _MIN_NAME_LENGTH: ClassVar[int] = 2
+
+    def __post_init__(self) -> None:
+        """Initialize the LogseqUnlinkedReferences instance."""
+        self.process()
+
+    def process(self) -> None:
+        """Find unlinked references in every file of the graph."""
+        self.collect_names()
+        if not (names := self.names):
+            return
+
+        automaton = AhoCorasick(names)
+        iter_matches = automaton.iter_matches
+        get_searchable_text = LogseqUnlinkedReferences.get_searchable_text
+        is_whole_word = LogseqUnlinkedReferences.is_whole_word
+        unlinked_refs = self.unlinked_refs
+        for f in self.index:
+            if not (text := get_searchable_text(f)):
+                continue
+
+            own_names = {f.path.name.lower(), *f.data.get(CritContent.ALIASES, [])}
+            found = [
+                names[name]
+                for start, name in iter_matches(text)
+                if name not in own_names and is_whole_word(text, start, start + len(name))
+            ]
+            if found:
+                get_count_and_foundin_data(unlinked_refs, found, f.path.name)
+
+        for values in unlinked_refs.values():
+            values["found_in"] = sort_dict_by_value(values["found_in"], reverse=True)
+        self.unlinked_refs = sort_dict_by_value(unlinked_refs, value="count", reverse=True)
+
+    def collect_names(self) -> None:
+        """Collect lowercased page names and aliases, mapped to their display form."""
+        names = self.names
+        min_length = LogseqUnlinkedReferences._MIN_NAME_LENGTH
+        name_file_types = LogseqUnlinkedReferences._NAME_FILE_TYPES
+        page_names = (f.path.name for f in self.index if f.path.file_type in name_file_types)
+        for name in (*page_names, *self.aliases):
+            if len(name) >= min_length:
+                names.setdefault(name.lower(), name)
+
+    @staticmethod
+    def get_searchable_text(f: LogseqFile) -> str:
+        """Return the lowercased masked content of a file with linked regions blanked out."""
+        if not (text := f.masked.content):
+            return ""
+        for sub_regex in LINKED_REGION_MASKING:
+            text = sub_regex("\n", text)
+        return text.lower()
+
+    @staticmethod
+    def is_whole_word(text: str, start: int, end: int) -> bool:
+        """Check that a match is not part of a longer word."""
+        if start and (text[start - 1].isalnum() or text[start - 1] == "_"):
+            return False
+        return not (end < len(text) and (text[end].isalnum() or text[end] == "_"))
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Generate a report of the unlinked references."""
+        return {Output.UNLINKED_REFERENCES: self.unlinked_refs}
@@ -1,17 +1,24 @@
 """Module for main application logic for the Logseq analyzer."""
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from .analysis.assets import LogseqAssets, LogseqAssetsHls
+from .analysis.block_refs import LogseqBlockRefs
+from .analysis.duplicates import LogseqDuplicateBlocks
 from .analysis.graph import LogseqGraph
-from .analysis.index import FileIndex
+from .analysis.graph_metrics import LogseqGraphMetrics
 from .analysis.journals import LogseqJournals
 from .analysis.namespaces import LogseqNamespaces
 from .analysis.summarizers import LogseqContentSummarizer, LogseqFileSummarizer
+from .analysis.tasks import LogseqTasks
+from .analysis.unlinked_refs import LogseqUnlinkedReferences
 from .config.arguments import Args
+from .config.context import AnalyzerContext
 from .config.graph_config import (
     ConfigEdns,
     get_default_logseq_config,
@@ -20,6 +27,7 @@ from .config.graph_config import (
     get_page_title_format,
     get_target_dirs,
 )
+from .io.bundle import BUNDLE_FORMATS, ReportBundle
 from .io.cache import Cache
 from .io.filesystem import (
     AnalyzerDeleteDirs,
@@ -39,11 +47,14 @@ from .io.filesystem import (
     PagesDirectory,
     RecycleDirectory,
     WhiteboardsDirectory,
+    graph_cache_file,
+    graph_output_dir,
 )
-from .io.report_writer import ReportWriter
-from .logseq_file.file import LogseqFile, LogseqPath
+from .io.manifest import OutputManifest
+from .io.report_writer import ReportBatch
+from .io.table_export import TableExport
+from .logseq_file.file import LogseqFile
 from .logseq_file.info import JournalFormats
-from .logseq_file.stats import LogseqFileName
 from .utils.date_utilities import DateUtilities
 from .utils.enums import Constant, LogseqGraphStructure, Moved, Output, OutputDir, TargetDir
 from .utils.helpers import (
@@ -51,9 +62,15 @@ from .utils.helpers import (
     yield_asset_paths,
     yield_bak_rec_paths,
 )
+from .utils.profiling import CallProfiler, MemoryProfiler, PatternProfiler, StageProfiler
+from .utils.progress import ConsoleProgress, FileProgress
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+
+    from .analysis.index import FileIndex
+    from .analysis.text_index import TextIndex
+    from .utils.progress import ProgressCallback
 
 log_file = LogFile(Path(Constant.LOG_FILE))
 logging.basicConfig(
@@ -84,9 +101,9 @@ class GUIInstanceDummy:
         """Return a string representation of the dummy GUI instance."""
         return f"{self.__class__.__name__}"
 
-    def update_progress(self, percentage: int) -> None:
+    def update_progress(self, percentage: int, label: str = "") -> None:
         """Simulate updating progress in a GUI."""
-        logger.info("Updating progress: %d%%", percentage)
+        logger.info("Updating progress: %d%% %s", percentage, label)
 
 
 def setup_logseq_paths(args: Args) -> tuple[LogseqAnalyzerDirs, ConfigEdns]:
@@ -99,7 +116,8 @@ def setup_logseq_paths(args: Args) -> tuple[LogseqAnalyzerDirs, ConfigEdns]:
         graph_dirs=graph_dirs,
         delete_dirs=AnalyzerDeleteDirs(),
         target_dirs=target_dirs,
-        output_dir=OutputDirectory(Path(Constant.OUTPUT_DIR)),
+        output_dir=OutputDirectory(graph_output_dir(graph_dirs.graph_dir.path)),
+        cache_file=CacheFile(graph_cache_file(graph_dirs.graph_dir.path)),
     )
 
     logger.debug("setup_logseq_paths")
@@ -170,53 +188,78 @@ def setup_journal_formats(config_edns: ConfigEdns) -> JournalFormats:
     )
 
 
-def init_configs(args: Args) -> tuple[LogseqAnalyzerDirs, ConfigEdns, JournalFormats]:
-    """Initialize configurations for the Logseq analyzer."""
+def init_context(args: Args, profiler: StageProfiler | None = None) -> AnalyzerContext:
+    """Initialize the analyzer context for a single run."""
     analyzer_dirs, config_edns = setup_logseq_paths(args)
     journal_formats = setup_journal_formats(config_edns)
-    logger.debug("init_configs")
-    return analyzer_dirs, config_edns, journal_formats
+    logger.debug("init_context")
+    return AnalyzerContext(
+        args=args,
+        analyzer_dirs=analyzer_dirs,
+        config_edns=config_edns,
+        journal_formats=journal_formats,
+        profiler=profiler or StageProfiler(),
+    )
 
 
-def setup_cache() -> tuple[Cache, FileIndex]:
+def setup_cache(ctx: AnalyzerContext) -> tuple[Cache, FileIndex]:
     """Set up cache for the Logseq Analyzer."""
-    cache_file = CacheFile(Path(Constant.CACHE_FILE))
-    cache = Cache(cache_file.path)
+    cache = Cache(ctx.cache_file)
     cache.open()
-    index = cache.initialize()
+    index = cache.initialize(ctx)
     logger.debug("setup_cache")
     return cache, index
 
 
-def configure_analyzer_settings(
-    args: Args,
-    analyzer_dirs: LogseqAnalyzerDirs,
-    config_edns: ConfigEdns,
-    journal_formats: JournalFormats,
+def process_graph(
+    ctx: AnalyzerContext,
+    index: FileIndex,
+    cache: Cache,
+    text_index: TextIndex | None = None,
+    progress: FileProgress | None = None,
 ) -> None:
-    """Set up the attributes for the LogseqAnalyzer."""
-    Cache.configure(args, analyzer_dirs)
-    FileIndex.write_graph = args.write_graph
-    LogseqJournals.journal_page_format = journal_formats.page
-    LogseqPath.configure(analyzer_dirs)
-    LogseqFileName.configure(analyzer_dirs, journal_formats, config_edns)
-    ReportWriter.configure(args, analyzer_dirs)
-    logger.debug("configure_analyzer_settings")
-
-
-def process_graph(index: FileIndex, cache: Cache) -> None:
-    """Process all files in the Logseq graph folder."""
-    for path in cache.iter_modified_files():
+    """Process all files in the Logseq graph folder.
+
+    The modified files are discovered first so progress can be reported against
+    their total. With profiling enabled, each file's parse time is recorded and
+    the rest of the loop is timed as file discovery (graph walk and cache checks).
+    """
+    profiler = ctx.profiler
+    timed = profiler.enabled
+    loop_start = perf_counter()
+    parse_total = 0.0
+    paths = list(cache.iter_modified_files(ctx))
+    if progress is not None:
+        progress.discover(len(paths))
+    for path in paths:
+        start = perf_counter()
         file = LogseqFile(path)
-        file.process()
+        file.process(ctx)
+        if timed:
+            seconds = perf_counter() - start
+            profiler.record_file(seconds)
+            parse_total += seconds
         index.add(file)
+        if text_index is not None:
+            text_index.add_file(file)
+        if progress is not None:
+            progress.advance(file.info.size.size)
+    if progress is not None:
+        progress.finish()
+    if timed:
+        profiler.add("discover files", perf_counter() - loop_start - parse_total)
+        profiler.add("parse files", parse_total)
+    if text_index is not None:
+        with profiler.timer("sync text index"):
+            text_index.sync(index)
     logger.debug("process_graph")
 
 
-def setup_file_mover(args: Args, lsa: LogseqAssets, analyzer_dirs: LogseqAnalyzerDirs) -> dict[str, Any]:
+def setup_file_mover(ctx: AnalyzerContext, lsa: LogseqAssets) -> dict[str, Any]:
     """Set up LogseqFileMover for moving files and directories."""
-    dd = analyzer_dirs.delete_dirs
-    gd = analyzer_dirs.graph_dirs
+    args = ctx.args
+    dd = ctx.analyzer_dirs.delete_dirs
+    gd = ctx.analyzer_dirs.graph_dirs
     target_asset = dd.delete_assets_dir.path
     target_bak = dd.delete_bak_dir.path
     target_rec = dd.delete_recycle_dir.path
@@ -232,48 +275,56 @@ def setup_file_mover(args: Args, lsa: LogseqAssets, analyzer_dirs: LogseqAnalyze
     return {Output.MOVED_FILES: moved_files_report}
 
 
-def report_configurations(
-    args: Args,
-    analyzer_dirs: LogseqAnalyzerDirs,
-    config_edns: ConfigEdns,
-) -> Iterator[tuple[str, Any]]:
+def report_configurations(ctx: AnalyzerContext) -> Iterator[tuple[str, Any]]:
     """Yield configuration data reports."""
-    yield OutputDir.META, args.report
-    yield OutputDir.META, config_edns.report
-    yield OutputDir.META, analyzer_dirs.report
+    yield OutputDir.META, ctx.args.report
+    yield OutputDir.META, ctx.config_edns.report
+    yield OutputDir.META, ctx.analyzer_dirs.report
 
 
-def analyze(
-    args: Args,
-    index: FileIndex,
-    analyzer_dirs: LogseqAnalyzerDirs,
-) -> Iterator[tuple[str, Any]]:
+def analyze(ctx: AnalyzerContext, index: FileIndex) -> Iterator[tuple[str, Any]]:
     """Perform core analysis on the Logseq graph."""
-    logseq_graph = LogseqGraph(index)
+    call = ctx.profiler.call
+    logseq_graph = call(LogseqGraph, index)
     yield OutputDir.GRAPH, logseq_graph.report
 
-    logseq_namespaces = LogseqNamespaces(index, logseq_graph.dangling_links)
+    logseq_graph_metrics = call(LogseqGraphMetrics, index, logseq_graph.all_linked_refs)
+    yield OutputDir.GRAPH, logseq_graph_metrics.report
+
+    logseq_unlinked_refs = call(LogseqUnlinkedReferences, index, logseq_graph.unique.aliases)
+    yield OutputDir.UNLINKED_REFERENCES, logseq_unlinked_refs.report
+
+    logseq_block_refs = call(LogseqBlockRefs, index)
+    yield OutputDir.BLOCK_REFS, logseq_block_refs.report
+
+    logseq_duplicates = call(LogseqDuplicateBlocks, index)
+    yield OutputDir.DUPLICATES, logseq_duplicates.report
+
+    logseq_tasks = call(LogseqTasks, index, ctx.now_ts)
+    yield OutputDir.TASKS, logseq_tasks.report
+
+    logseq_namespaces = call(LogseqNamespaces, index, logseq_graph.dangling_links)
     yield OutputDir.NAMESPACES, logseq_namespaces.report
 
-    logseq_journals = LogseqJournals(index, logseq_graph.dangling_links)
+    logseq_journals = call(LogseqJournals, index, logseq_graph.dangling_links, ctx.journal_formats.page)
     yield OutputDir.JOURNALS, logseq_journals.report
 
-    logseq_assets_hls = LogseqAssetsHls(index)
+    logseq_assets_hls = call(LogseqAssetsHls, index)
     yield OutputDir.MOVED_FILES_HLS_ASSETS, logseq_assets_hls.report
 
-    logseq_assets = LogseqAssets(index)
+    logseq_assets = call(LogseqAssets, index)
     yield OutputDir.MOVED_FILES_ASSETS, logseq_assets.report
 
-    moved_files = setup_file_mover(args, logseq_assets, analyzer_dirs)
+    moved_files = call(setup_file_mover, ctx, logseq_assets)
     yield OutputDir.MOVED_FILES, moved_files
 
-    logseq_file_summarizer = LogseqFileSummarizer(index)
+    logseq_file_summarizer = call(LogseqFileSummarizer, index)
     yield OutputDir.SUMMARY_FILES_GENERAL, logseq_file_summarizer.general
     yield OutputDir.SUMMARY_FILES_FILE, logseq_file_summarizer.filetypes
     yield OutputDir.SUMMARY_FILES_NODE, logseq_file_summarizer.nodetypes
     yield OutputDir.SUMMARY_FILES_EXTENSIONS, logseq_file_summarizer.extensions
 
-    logseq_content_summarizer = LogseqContentSummarizer(index)
+    logseq_content_summarizer = call(LogseqContentSummarizer, index)
     yield OutputDir.SUMMARY_CONTENT, logseq_content_summarizer.report
     yield OutputDir.SUMMARY_CONTENT_INFO, logseq_content_summarizer.size_report
     yield OutputDir.SUMMARY_CONTENT_INFO, logseq_content_summarizer.timestamp_report
@@ -281,20 +332,32 @@ def analyze(
     yield OutputDir.SUMMARY_CONTENT_INFO, logseq_content_summarizer.bullet_report
 
     yield OutputDir.INDEX, index.report
+    if ctx.args.write_graph:
+        yield OutputDir.INDEX, index.content_report
     logger.debug("analyze")
 
 
-def write_reports(data_reports: Iterator[tuple[str, Any]]) -> None:
-    """Write reports to the specified output directories."""
+def write_reports(
+    ctx: AnalyzerContext, data_reports: Iterable[tuple[str, Any]], manifest: OutputManifest | None = None
+) -> None:
+    """Write reports to the specified output directories, skipping those the manifest finds unchanged."""
+    bundled = ctx.args.report_format.lstrip(".") in BUNDLE_FORMATS
+    batch = ReportBundle(ctx, manifest) if bundled else ReportBatch(ctx, manifest)
+    measure = ctx.profiler.measure
     for subdir, reports in data_reports:
-        for prefix, data in reports.items():
-            ReportWriter(prefix, data, subdir).write()
+        for name, report in reports.items():
+            measure(f"{subdir}/{name}", report)
+        batch.add(subdir, reports)
+    with ctx.profiler.timer("write reports"):
+        batch.write()
     logger.debug("write_reports")
 
 
 def run_app(**gui_args: Any) -> None:
     """Run the Logseq analyzer."""
-    progress = gui_args.pop("progress_callback", GUIInstanceDummy().update_progress)
+    progress = gui_args.pop("progress_callback", None)
+    if progress is None:
+        progress = ConsoleProgress().update if sys.stderr.isatty() else GUIInstanceDummy().update_progress
 
     progress(10, "Starting Logseq Analyzer...")
     args = Args()
@@ -303,25 +366,62 @@ def run_app(**gui_args: Any) -> None:
     else:
         args.set_cli_args()
 
-    progress(30, "Setting up Logseq Analyzer configurations...")
-    analyzer_dirs, config_edns, journal_formats = init_configs(args)
-
-    progress(40, "Configure Logseq Analyzer settings...")
-    configure_analyzer_settings(args, analyzer_dirs, config_edns, journal_formats)
-
-    progress(50, "Setup cache...")
-    cache, index = setup_cache()
+    call_profiler = CallProfiler(enabled=args.cprofile)
+    with call_profiler.profiling():
+        output_dir = run_pipeline(args, progress)
+    call_profiler.write(output_dir)
 
-    progress(60, "Process Logseq graph...")
-    process_graph(index, cache)
-
-    progress(70, "Write meta reports...")
-    write_reports(report_configurations(args, analyzer_dirs, config_edns))
-
-    progress(80, "Running core analysis on Logseq graph...")
-    write_reports(analyze(args, index, analyzer_dirs))
+    progress(100, "Logseq Analyzer completed successfully.")
 
-    progress(90, "Finalizing analysis...")
-    cache.close(index)
 
-    progress(100, "Logseq Analyzer completed successfully.")
+def run_pipeline(args: Args, progress: ProgressCallback) -> Path:
+    """Configure, process, analyze and write the reports of a graph and return the output directory."""
+    progress(15, "Setting up Logseq Analyzer configurations...")
+    memory = MemoryProfiler() if args.profile_memory else None
+    if memory is not None:
+        memory.start()
+    profiler = StageProfiler(enabled=args.profile, memory=memory)
+    with profiler.timer("config"):
+        ctx = init_context(args, profiler)
+
+    progress(20, "Setup cache...")
+    with profiler.timer("open cache"):
+        cache, index = setup_cache(ctx)
+        text_index = cache.load_text_index() if args.text_index else None
+
+    progress(25, "Discovering files in the Logseq graph...")
+    file_progress = FileProgress(progress, start_percent=25, end_percent=75)
+    pattern_profiler = PatternProfiler(enabled=args.profile_patterns)
+    with pattern_profiler.instrument(), profiler.memory_stage("process graph"):
+        process_graph(ctx, index, cache, text_index, file_progress)
+    profiler.measure("FileIndex", index)
+    if text_index is not None:
+        profiler.measure("TextIndex", text_index)
+
+    # The graph is processed, so the index and the modification times are saved
+    # together even if writing a report fails.
+    try:
+        progress(80, "Write meta reports...")
+        manifest = OutputManifest(ctx.output_dir)
+        write_reports(ctx, report_configurations(ctx), manifest)
+
+        progress(85, "Running core analysis on Logseq graph...")
+        write_reports(ctx, analyze(ctx, index), manifest)
+        if args.table_format:
+            with profiler.timer("table export"):
+                TableExport(ctx, index, manifest).write()
+        if pattern_profiler.enabled:
+            write_reports(ctx, [(OutputDir.PROFILE, pattern_profiler.report)], manifest)
+
+        progress(95, "Finalizing analysis...")
+        with profiler.timer("finalize output"):
+            manifest.finalize()
+    finally:
+        with profiler.timer("close cache"):
+            cache.close(index, text_index)
+    if profiler.enabled:
+        profiler.write(ctx.output_dir)
+        print(profiler.summary(), file=sys.stderr)
+    if memory is not None:
+        memory.stop()
+    return ctx.output_dir
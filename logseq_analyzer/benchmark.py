@@ -0,0 +1,137 @@
+"""Benchmark the analyzer pipeline on synthetic graphs of increasing size."""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from .io.filesystem import graph_output_dir
+from .utils.enums import Constant
+from .utils.synthetic_graph import SyntheticGraph
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+
+
+def peak_memory() -> int | None:
+    """Return the peak resident memory of the current process in bytes, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_size(graph_dir: str, run_dir: str) -> dict[str, Any]:
+    """Run the full pipeline with stage profiling on a graph and return its measurements.
+
+    Runs in a fresh worker process, so the peak memory belongs to this run alone
+    and the cache, log and output files are written to ``run_dir``.
+    """
+    os.chdir(run_dir)
+    from .app import run_app  # noqa: PLC0415 - the app module opens its log file in the working directory
+
+    start = perf_counter()
+    run_app(graph_folder=graph_dir, profile=True)
+    wall = perf_counter() - start
+    profile_path = Path(run_dir) / graph_output_dir(Path(graph_dir)) / Constant.PROFILE_FILE
+    profile = json.loads(profile_path.read_text(encoding="utf-8"))
+    files = profile["parse"]["files"]
+    return {
+        "files": files,
+        "wall_seconds": wall,
+        "files_per_second": files / wall if wall else None,
+        "peak_memory_bytes": peak_memory(),
+        "stages": {name: entry["seconds"] for name, entry in profile["stages"].items()},
+        "parse": profile["parse"],
+    }
+
+
+def package_version() -> str | None:
+    """Return the installed version of the analyzer, if it is installed."""
+    try:
+        return version("logseq_analyzer")
+    except PackageNotFoundError:
+        return None
+
+
+def compare(results: list[dict[str, Any]], baseline_path: Path) -> list[str]:
+    """Return one line per graph size comparing the wall time with a previous results file."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {result["pages"]: result for result in baseline.get("results", [])}
+    lines = []
+    for result in results:
+        if (old := previous.get(result["pages"])) is None:
+            continue
+        change = result["wall_seconds"] / old["wall_seconds"] - 1 if old["wall_seconds"] else 0.0
+        lines.append(
+            f"{result['pages']:>8} pages: {result['wall_seconds']:.2f} s vs {old['wall_seconds']:.2f} s ({change:+.1%})"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Generate synthetic graphs, run the analyzer on each and write the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the Logseq Analyzer on synthetic graphs")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="graph sizes in pages (default: %(default)s)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic graphs")
+    parser.add_argument("--work-dir", default="logseq-analyzer-benchmark", help="folder for the graphs and run outputs")
+    parser.add_argument("--output", default="logseq-analyzer-benchmark.json", help="results file")
+    parser.add_argument("--baseline", help="previous results file to compare wall times against")
+    args = parser.parse_args(argv)
+
+    work_dir = Path(args.work_dir).resolve()
+    results = []
+    for pages in args.sizes:
+        graph_dir = work_dir / f"graph-{pages}"
+        run_dir = work_dir / f"run-{pages}"
+        for folder in (graph_dir, run_dir):
+            if folder.exists():
+                shutil.rmtree(folder)
+        start = perf_counter()
+        graph = SyntheticGraph(graph_dir, pages, args.seed)
+        graph.generate()
+        generate_seconds = perf_counter() - start
+        run_dir.mkdir(parents=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(run_size, str(graph_dir), str(run_dir)).result()
+        result = {"pages": pages, "graph_files": graph.files_written, "generate_seconds": generate_seconds, **result}
+        results.append(result)
+        peak = result["peak_memory_bytes"]
+        peak_text = f"{peak / 2**20:.0f} MiB" if peak is not None else "n/a"
+        rate = result["files_per_second"] or 0
+        summary = f"{pages:>8} pages: {result['wall_seconds']:.2f} s, {rate:.0f} files/s, peak {peak_text}"
+        print(summary, file=sys.stderr)
+
+    output = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "created": datetime.now(tz=UTC).isoformat(),
+        "results": results,
+    }
+    with Path(args.output).open("w", encoding="utf-8") as f:
+        json.dump(output, f, indent=4)
+    print(f"Results written to {args.output}", file=sys.stderr)
+    if args.baseline:
+        print("\n".join(compare(results, Path(args.baseline))), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
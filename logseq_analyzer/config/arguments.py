@@ -4,6 +4,8 @@ import argparse
 from dataclasses import dataclass
 from typing import Any
 
+from ..io.compression import COMPRESSION_LEVELS, available_compressions
+from ..io.table_export import TABLE_DIALECTS
 from ..utils.enums import Output
 
 
@@ -11,6 +13,9 @@ from ..utils.enums import Output
 class Args:
     """A class to represent command line arguments for the Logseq Analyzer."""
 
+    compression: str = ""
+    compression_level: int | None = None
+    cprofile: bool = False
     global_config: str = ""
     graph_cache: bool = False
     graph_folder: str = ""
@@ -18,7 +23,12 @@ class Args:
     move_bak: bool = False
     move_recycle: bool = False
     move_unlinked_assets: bool = False
+    profile: bool = False
+    profile_memory: bool = False
+    profile_patterns: bool = False
     report_format: str = ".txt"
+    table_format: str = ""
+    text_index: bool = False
     write_graph: bool = False
 
     def set_gui_args(self, gui_args: dict[str, Any]) -> None:
@@ -79,13 +89,71 @@ class Args:
             help="path to global configuration file",
             default="",
         )
+        parser.add_argument(
+            "--text-index",
+            action="store_true",
+            help="build the full-text search index and store it in the graph cache",
+            default=False,
+        )
         parser.add_argument(
             "--report-format",
             action="store",
-            help="report format (.txt, .json, .md, .html)",
+            help="report format (.txt, .json, .md, .html, .sqlite, .jsonl)",
             default=".txt",
         )
+        parser.add_argument(
+            "--compression",
+            action="store",
+            choices=available_compressions(),
+            help="compress the report files (HTML and bundled SQLite output are never compressed)",
+            default="",
+        )
+        parser.add_argument(
+            "--compression-level",
+            action="store",
+            type=int,
+            help="compression level (gzip/lzma 0-9, zstd 1-22; default: gzip 6, lzma 6, zstd 3)",
+            default=None,
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="time each pipeline stage and file parse; print a summary and write timings to the output folder",
+            default=False,
+        )
+        parser.add_argument(
+            "--cprofile",
+            action="store_true",
+            help="run under cProfile; write a .pstats file and a cumulative-time summary to the output folder",
+            default=False,
+        )
+        parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help="trace allocations per pipeline stage and estimate the retained size of the main analyzer objects",
+            default=False,
+        )
+        parser.add_argument(
+            "--profile-patterns",
+            action="store_true",
+            help="count calls, matches, scanned characters and time of each regex pattern while parsing files "
+            "(one profiled run per process)",
+            default=False,
+        )
+        parser.add_argument(
+            "--table-format",
+            action="store",
+            choices=tuple(TABLE_DIALECTS),
+            help="also export per-file metrics and file data as CSV or TSV tables",
+            default="",
+        )
         args = parser.parse_args()
+        if args.compression_level is not None:
+            levels = COMPRESSION_LEVELS.get(args.compression)
+            if levels is None:
+                parser.error("--compression-level requires --compression")
+            if args.compression_level not in levels:
+                parser.error(f"--compression-level for {args.compression} must be between {levels[0]} and {levels[-1]}")
         for key, value in vars(args).items():
             setattr(self, key, value)
 
@@ -0,0 +1,73 @@
+"""Per-run analyzer context shared through the Logseq Analyzer pipeline."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from ..utils.enums import FileType, TargetDir
+from ..utils.profiling import StageProfiler
+from .graph_config import get_ns_sep
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ..io.filesystem import LogseqAnalyzerDirs
+    from ..logseq_file.info import JournalFormats
+    from .arguments import Args
+    from .graph_config import ConfigEdns
+
+
+@dataclass(slots=True)
+class AnalyzerContext:
+    """Settings for analyzing a single Logseq graph.
+
+    One context is created per run and passed explicitly through the pipeline,
+    so several graphs can be analyzed in the same process without shared state.
+    """
+
+    args: Args
+    analyzer_dirs: LogseqAnalyzerDirs
+    config_edns: ConfigEdns
+    journal_formats: JournalFormats
+    profiler: StageProfiler = field(default_factory=StageProfiler)
+    ns_file_sep: str = field(init=False)
+    file_type_map: dict[str, tuple[str, str]] = field(init=False)
+    now_ts: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive the settings used while processing files."""
+        target_dirs = self.target_dirs
+        self.ns_file_sep = get_ns_sep(self.config_edns.config)
+        self.file_type_map = {
+            target_dirs[TargetDir.ASSET]: (FileType.ASSET, FileType.SUB_ASSET),
+            target_dirs[TargetDir.DRAW]: (FileType.DRAW, FileType.SUB_DRAW),
+            target_dirs[TargetDir.JOURNAL]: (FileType.JOURNAL, FileType.SUB_JOURNAL),
+            target_dirs[TargetDir.PAGE]: (FileType.PAGE, FileType.SUB_PAGE),
+            target_dirs[TargetDir.WHITEBOARD]: (FileType.WHITEBOARD, FileType.SUB_WHITEBOARD),
+        }
+        self.now_ts = datetime.now(tz=UTC).timestamp()
+
+    @property
+    def graph_dir(self) -> Path:
+        """Return the path of the graph folder."""
+        return self.analyzer_dirs.graph_dirs.graph_dir.path
+
+    @property
+    def target_dirs(self) -> dict[str, str]:
+        """Return the configured target directory names."""
+        return self.analyzer_dirs.target_dirs
+
+    @property
+    def journal_dir(self) -> str:
+        """Return the configured journals directory name."""
+        return self.analyzer_dirs.target_dirs[TargetDir.JOURNAL]
+
+    @property
+    def output_dir(self) -> Path:
+        """Return the path of the output directory of this graph."""
+        return self.analyzer_dirs.output_dir.path
+
+    @property
+    def cache_file(self) -> Path:
+        """Return the path of the cache file of this graph."""
+        return self.analyzer_dirs.cache_file.path
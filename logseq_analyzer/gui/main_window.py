@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..utils.enums import Format
+from ..utils.enums import Compression, Format
 from .analysis_worker import AnalysisWorker
 from .ui_components import Buttons, Checkboxes, Inputs, Progress
 
@@ -26,6 +26,8 @@ from .ui_components import Buttons, Checkboxes, Inputs, Progress
 class Argument(StrEnum):
     """Arguments for the Logseq Analyzer."""
 
+    COMPRESSION = "compression"
+    CPROFILE = "cprofile"
     GEOMETRY = "geometry"
     GLOBAL_CONFIG = "global_config"
     GRAPH_CACHE = "graph_cache"
@@ -35,6 +37,8 @@ class Argument(StrEnum):
     MOVE_RECYCLE = "move_recycle"
     MOVE_UNLINKED_ASSETS = "move_unlinked_assets"
     REPORT_FORMAT = "report_format"
+    TABLE_FORMAT = "table_format"
+    TEXT_INDEX = "text_index"
     WRITE_GRAPH = "write_graph"
 
 
@@ -68,6 +72,8 @@ class LogseqAnalyzerGUI(QWidget):
             graph_folder=QLineEdit(readOnly=True),
             global_config=QLineEdit(readOnly=True),
             report_format=QComboBox(),
+            compression=QComboBox(),
+            table_format=QComboBox(),
         )
         self.checkboxes = Checkboxes(
             move_all=QCheckBox("Enable all move options"),
@@ -76,6 +82,8 @@ class LogseqAnalyzerGUI(QWidget):
             move_recycle=QCheckBox("Move Recycle to 'to_delete' folder"),
             write_graph=QCheckBox("Write Full Graph Content (large)"),
             graph_cache=QCheckBox("Reindex Graph Cache"),
+            text_index=QCheckBox("Build Full-Text Search Index"),
+            cprofile=QCheckBox("Profile Run with cProfile (.pstats)"),
         )
         self.progress = Progress(progress_bar=QProgressBar(self), label=QLabel("Status: Ready"))
 
@@ -109,9 +117,13 @@ class LogseqAnalyzerGUI(QWidget):
             Argument.MOVE_RECYCLE: _checks.move_recycle.isChecked(),
             Argument.WRITE_GRAPH: _checks.write_graph.isChecked(),
             Argument.GRAPH_CACHE: _checks.graph_cache.isChecked(),
+            Argument.TEXT_INDEX: _checks.text_index.isChecked(),
+            Argument.CPROFILE: _checks.cprofile.isChecked(),
             Argument.GRAPH_FOLDER: _inputs.graph_folder.text(),
             Argument.GLOBAL_CONFIG: _inputs.global_config.text(),
             Argument.REPORT_FORMAT: _inputs.report_format.currentText(),
+            Argument.COMPRESSION: _inputs.compression.currentText(),
+            Argument.TABLE_FORMAT: _inputs.table_format.currentText(),
         }
         if not gui_args[Argument.GRAPH_FOLDER]:
             self.show_error("Graph folder is required.")
@@ -212,9 +224,13 @@ class LogseqAnalyzerGUI(QWidget):
         set_settings(Argument.MOVE_RECYCLE, _check.move_recycle.isChecked())
         set_settings(Argument.WRITE_GRAPH, _check.write_graph.isChecked())
         set_settings(Argument.GRAPH_CACHE, _check.graph_cache.isChecked())
+        set_settings(Argument.TEXT_INDEX, _check.text_index.isChecked())
+        set_settings(Argument.CPROFILE, _check.cprofile.isChecked())
         set_settings(Argument.GRAPH_FOLDER, _inputs.graph_folder.text())
         set_settings(Argument.GLOBAL_CONFIG, _inputs.global_config.text())
         set_settings(Argument.REPORT_FORMAT, _inputs.report_format.currentText())
+        set_settings(Argument.COMPRESSION, _inputs.compression.currentText())
+        set_settings(Argument.TABLE_FORMAT, _inputs.table_format.currentText())
         set_settings(Argument.GEOMETRY, self.saveGeometry())
 
     def load_settings(self) -> None:
@@ -228,7 +244,11 @@ class LogseqAnalyzerGUI(QWidget):
         _check.move_recycle.setChecked(bool(get_settings(Argument.MOVE_RECYCLE, defaultValue=False, type=bool)))
         _check.write_graph.setChecked(bool(get_settings(Argument.WRITE_GRAPH, defaultValue=False, type=bool)))
         _check.graph_cache.setChecked(bool(get_settings(Argument.GRAPH_CACHE, defaultValue=False, type=bool)))
+        _check.text_index.setChecked(bool(get_settings(Argument.TEXT_INDEX, defaultValue=False, type=bool)))
+        _check.cprofile.setChecked(bool(get_settings(Argument.CPROFILE, defaultValue=False, type=bool)))
         _inputs.graph_folder.setText(str(get_settings(Argument.GRAPH_FOLDER, "", type=str)))
         _inputs.global_config.setText(str(get_settings(Argument.GLOBAL_CONFIG, "", type=str)))
         _inputs.report_format.setCurrentText(str(get_settings(Argument.REPORT_FORMAT, Format.TXT, type=str)))
+        _inputs.compression.setCurrentText(str(get_settings(Argument.COMPRESSION, Compression.NONE, type=str)))
+        _inputs.table_format.setCurrentText(str(get_settings(Argument.TABLE_FORMAT, "", type=str)))
         self.restoreGeometry(get_settings(Argument.GEOMETRY))
@@ -16,7 +16,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..utils.enums import Format
+from ..io.compression import available_compressions
+from ..utils.enums import Compression, Format
 
 
 @dataclass(slots=True, weakref_slot=True)
@@ -29,6 +30,8 @@ class Checkboxes(QWidget):
     move_recycle: QCheckBox
     write_graph: QCheckBox
     graph_cache: QCheckBox
+    text_index: QCheckBox
+    cprofile: QCheckBox
 
     def __post_init__(self) -> None:
         """Post-initialization to set default values for checkboxes."""
@@ -46,6 +49,8 @@ class Checkboxes(QWidget):
         layout.addWidget(self.move_recycle)
         layout.addWidget(self.write_graph)
         layout.addWidget(self.graph_cache)
+        layout.addWidget(self.text_index)
+        layout.addWidget(self.cprofile)
         self.setLayout(layout)
 
     @Slot()
@@ -98,17 +103,23 @@ class Inputs(QWidget):
     graph_folder: QLineEdit
     global_config: QLineEdit
     report_format: QComboBox
+    compression: QComboBox
+    table_format: QComboBox
 
     def __post_init__(self) -> None:
         """Post-initialization to set default values for inputs."""
         super().__init__()
-        self.report_format.addItems((Format.TXT, Format.JSON, Format.MD, Format.HTML))
+        self.report_format.addItems((Format.TXT, Format.JSON, Format.MD, Format.HTML, Format.SQLITE, Format.JSONL))
+        self.compression.addItems((Compression.NONE, *available_compressions()))
+        self.table_format.addItems(("", Format.CSV, Format.TSV))
         self.initialize_layout()
 
     def initialize_layout(self) -> None:
-        """Create and return the layout for the report format input field."""
+        """Create and return the layout for the report format, compression and table export input fields."""
         layout = QFormLayout()
         layout.addRow(QLabel("Report Format:"), self.report_format)
+        layout.addRow(QLabel("Compression:"), self.compression)
+        layout.addRow(QLabel("Table Export:"), self.table_format)
         self.setLayout(layout)
 
 
@@ -0,0 +1,175 @@
+"""Bundled report output: every report of a run in a single SQLite database or JSON Lines file."""
+
+import logging
+import re
+import sqlite3
+from collections.abc import Mapping
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ..logseq_file.file import LogseqFile
+from ..utils.enums import Constant, Format
+from .compression import ReportCompression
+from .report_writer import StreamingJSONEncoder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from ..config.context import AnalyzerContext
+    from .manifest import OutputManifest
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMATS: frozenset[str] = frozenset({Format.JSONL, Format.SQLITE})
+CATALOG_TABLE = "report_catalog"
+NON_IDENTIFIER = re.compile(r"\W+")
+
+
+@dataclass(slots=True)
+class ReportBundle:
+    """A class to write all reports of a stage into one output file in a single bulk write.
+
+    SQLite output has one table per report family (output subdirectory) with the
+    columns ``report``, ``position``, ``name`` and ``value`` (JSON), indexed on the
+    page name and the report. A ``report_catalog`` table lists every report with
+    its family, row count and type, so empty reports are still discoverable.
+    JSON Lines output writes the same rows as one JSON object per line and
+    honours the report compression; SQLite databases are never compressed.
+    """
+
+    ctx: AnalyzerContext
+    manifest: OutputManifest | None = None
+    reports: list[tuple[str, str, Any]] = field(default_factory=list)
+    encoder: StreamingJSONEncoder = field(default_factory=lambda: StreamingJSONEncoder(indent=None))
+
+    def add(self, subdir: str, reports: dict[str, Any]) -> None:
+        """Queue the reports of an output subdirectory for writing."""
+        family = ReportBundle.table_name(subdir)
+        self.reports.extend((family, prefix, data) for prefix, data in reports.items())
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Return whether the bundle is an SQLite database."""
+        return self.ctx.args.report_format.lstrip(".") == Format.SQLITE
+
+    @property
+    def compression(self) -> ReportCompression:
+        """Return the compression of the bundle file."""
+        if self.is_sqlite:
+            return ReportCompression()
+        return ReportCompression(self.ctx.args.compression, self.ctx.args.compression_level)
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the bundle file."""
+        ext = self.ctx.args.report_format.lstrip(".")
+        return self.ctx.output_dir / f"{Constant.REPORT_BUNDLE}.{ext}{self.compression.suffix}"
+
+    def write(self) -> None:
+        """Write the queued reports to the bundle file.
+
+        With a manifest, a bundle left by a previous run is replaced by the first
+        write of this run and extended by the following ones.
+        """
+        path = self.path
+        manifest = self.manifest
+        key = str(Constant.REPORT_BUNDLE)
+        previous_count = 0
+        if manifest is not None:
+            if key in manifest.current:
+                previous_count = manifest.current[key]["count"]
+            else:
+                path.unlink(missing_ok=True)
+        logger.info("Writing %d reports to %s", len(self.reports), path)
+        if self.is_sqlite:
+            self.write_sqlite(path)
+        else:
+            self.write_jsonl(path)
+        if manifest is not None:
+            entry = {
+                "file": path.relative_to(self.ctx.output_dir).as_posix(),
+                "hash": "",
+                "count": previous_count + len(self.reports),
+                "format": self.ctx.args.report_format.lstrip("."),
+                "compression": self.compression.method,
+            }
+            manifest.record(key, entry, written=True)
+        self.reports.clear()
+
+    def write_sqlite(self, path: Path) -> None:
+        """Insert every report into the SQLite database in one transaction."""
+        families = dict.fromkeys(family for family, _, _ in self.reports)
+        with closing(sqlite3.connect(path)) as con, con:
+            con.execute(
+                f'CREATE TABLE IF NOT EXISTS "{CATALOG_TABLE}" '
+                "(family TEXT NOT NULL, report TEXT NOT NULL, rows INTEGER, type TEXT NOT NULL)"
+            )
+            for family in families:
+                con.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{family}" '
+                    "(report TEXT NOT NULL, position INTEGER NOT NULL, name TEXT, value TEXT NOT NULL)"
+                )
+                con.execute(f'CREATE INDEX IF NOT EXISTS "{family}_name" ON "{family}" (name)')
+                con.execute(f'CREATE INDEX IF NOT EXISTS "{family}_report" ON "{family}" (report)')
+                con.executemany(
+                    f'INSERT INTO "{family}" VALUES (?, ?, ?, ?)',
+                    self.sqlite_rows(family),
+                )
+            con.executemany(
+                f'INSERT INTO "{CATALOG_TABLE}" VALUES (?, ?, ?, ?)',
+                (
+                    (family, prefix, len(data) if hasattr(data, "__len__") else None, type(data).__qualname__)
+                    for family, prefix, data in self.reports
+                ),
+            )
+
+    def sqlite_rows(self, family: str) -> Iterator[tuple[str, int, str | None, str]]:
+        """Yield the rows of a report family with JSON-encoded values."""
+        iterencode = self.encoder.iterencode
+        for report_family, prefix, data in self.reports:
+            if report_family != family:
+                continue
+            for position, name, value in ReportBundle.report_rows(data):
+                yield prefix, position, name, "".join(iterencode(value))
+
+    def write_jsonl(self, path: Path) -> None:
+        """Append every report row to the JSON Lines file as one object per line."""
+        iterencode = self.encoder.iterencode
+        with self.compression.open(path, "a") as f:
+            for family, prefix, data in self.reports:
+                for position, name, value in ReportBundle.report_rows(data):
+                    row = {"family": family, "report": prefix, "position": position, "name": name, "value": value}
+                    f.writelines(iterencode(row))
+                    f.write("\n")
+
+    @staticmethod
+    def report_rows(data: Any) -> Iterator[tuple[int, str | None, Any]]:
+        """Yield a row for each top-level entry of a report with its position and page name.
+
+        Mapping entries are named by their key; collection entries by the item
+        itself when it is a page name or a file.
+        """
+        if isinstance(data, Mapping):
+            for position, (key, value) in enumerate(data.items()):
+                yield position, ReportBundle.page_name(key) or str(key), value
+        elif isinstance(data, (list, tuple, set, frozenset)):
+            for position, value in enumerate(data):
+                yield position, ReportBundle.page_name(value), value
+        else:
+            yield 0, None, data
+
+    @staticmethod
+    def page_name(obj: Any) -> str | None:
+        """Return the page name of a file or string, or None for other values."""
+        if isinstance(obj, LogseqFile):
+            return obj.path.name
+        if isinstance(obj, str):
+            return str(obj)
+        return None
+
+    @staticmethod
+    def table_name(subdir: str) -> str:
+        """Return the table name of a report family from its output subdirectory."""
+        return NON_IDENTIFIER.sub("_", subdir).strip("_") or "reports"
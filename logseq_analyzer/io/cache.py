@@ -4,17 +4,17 @@ import logging
 import shelve
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any
 
 from ..analysis.index import FileIndex
+from ..analysis.text_index import INDEX_VERSION, TextIndex
 from ..utils.helpers import iter_files
 
 if TYPE_CHECKING:
     from collections.abc import Generator
     from pathlib import Path
 
-    from ..config.arguments import Args
-    from ..io.filesystem import LogseqAnalyzerDirs
+    from ..config.context import AnalyzerContext
 
 logger = logging.getLogger(__name__)
 
@@ -24,44 +24,47 @@ class CacheKey(StrEnum):
 
     INDEX = "index"
     MOD_TRACKER = "mod_tracker"
+    TEXT_INDEX = "text_index"
 
 
 @dataclass(slots=True)
 class Cache:
-    """Cache class to manage caching of modified files and directories."""
+    """Cache class to manage caching of modified files and directories.
+
+    The modification times of the processed files are only saved by `close`,
+    together with the index built from those files, so a run that fails before
+    closing the cache leaves the previous, consistent state behind.
+    """
 
     cache_path: Path
     cache: shelve.Shelf[Any] = field(init=False)
-
-    graph_dir: ClassVar[Path]
-    graph_cache: ClassVar[bool] = False
-    target_dirs: ClassVar[set[str]] = set()
-
-    @classmethod
-    def configure(cls, args: Args, analyzer_dirs: LogseqAnalyzerDirs) -> None:
-        """Configure the Cache class with necessary settings.
-
-        Args:
-            args (Args): Command line arguments.
-            analyzer_dirs (LogseqAnalyzerDirs): Directory paths for the Logseq analyzer.
-
-        """
-        cls.target_dirs = set(analyzer_dirs.target_dirs.values())
-        cls.graph_dir = analyzer_dirs.graph_dirs.graph_dir.path
-        cls.graph_cache = args.graph_cache
+    mod_tracker: dict[str, float] | None = field(init=False, default=None)
 
     def open(self, protocol: int = 5) -> None:
         """Open the cache file."""
         self.cache = shelve.open(self.cache_path, protocol=protocol)  # noqa: SIM115
 
-    def close(self, index: FileIndex) -> None:
-        """Close the cache file."""
+    def close(self, index: FileIndex, text_index: TextIndex | None = None) -> None:
+        """Save the index, the full-text index and the modification times, then close the cache file."""
         self.cache[CacheKey.INDEX] = index
+        if text_index is not None:
+            self.cache[CacheKey.TEXT_INDEX] = text_index
+        if self.mod_tracker is not None:
+            self.cache[CacheKey.MOD_TRACKER] = self.mod_tracker
         self.cache.close()
 
-    def initialize(self) -> FileIndex:
+    def load_text_index(self) -> TextIndex:
+        """Load the full-text index from the cache, or start a new one if it is missing or in an older layout."""
+        if CacheKey.TEXT_INDEX in self.cache:
+            text_index = self.cache[CacheKey.TEXT_INDEX]
+            if getattr(text_index, "version", None) == INDEX_VERSION:
+                return text_index
+            logger.info("Rebuilding the full-text index cached in an older layout.")
+        return TextIndex()
+
+    def initialize(self, ctx: AnalyzerContext) -> FileIndex:
         """Clear the cache if needed."""
-        if Cache.graph_cache:
+        if ctx.args.graph_cache:
             self.clear()
             logger.info("Cache cleared and reset index.")
             return FileIndex()
@@ -82,13 +85,13 @@ class Cache:
         self.cache[CacheKey.INDEX] = index
         return index
 
-    def iter_modified_files(self) -> Generator[Path, Any]:
-        """Get the modified files from the cache."""
+    def iter_modified_files(self, ctx: AnalyzerContext) -> Generator[Path, Any]:
+        """Get the modified files from the cache; their modification times are saved on `close`."""
         mod_tracker = {}
         if CacheKey.MOD_TRACKER in self.cache:
             mod_tracker = self.cache[CacheKey.MOD_TRACKER]
 
-        file_iter = iter_files(Cache.graph_dir, Cache.target_dirs)
+        file_iter = iter_files(ctx.graph_dir, set(ctx.target_dirs.values()))
         for path in file_iter:
             str_path = str(path)
             curr_date_mod = path.stat().st_mtime
@@ -97,4 +100,4 @@ class Cache:
             mod_tracker[str_path] = curr_date_mod
             yield path
 
-        self.cache[CacheKey.MOD_TRACKER] = mod_tracker
+        self.mod_tracker = mod_tracker
@@ -0,0 +1,95 @@
+"""Compressed report streams using the standard library codecs."""
+
+import gzip
+import lzma
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TextIO
+
+from ..utils.enums import Compression
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+REPORT_BUFFER_SIZE = 1 << 16
+
+COMPRESSION_SUFFIXES: dict[str, str] = {
+    Compression.GZIP: ".gz",
+    Compression.LZMA: ".xz",
+    Compression.ZSTD: ".zst",
+}
+
+COMPRESSION_LEVELS: dict[str, range] = {
+    Compression.GZIP: range(10),
+    Compression.LZMA: range(10),
+    Compression.ZSTD: range(1, 23),
+}
+
+# zlib's own default; gzip.open would otherwise use its slowest level, 9.
+GZIP_DEFAULT_LEVEL = 6
+
+
+def available_compressions() -> tuple[str, ...]:
+    """Return the compression methods supported by the running interpreter."""
+    return tuple(method for method in COMPRESSION_SUFFIXES if method != Compression.ZSTD or zstd is not None)
+
+
+@dataclass(slots=True)
+class ReportCompression:
+    """A class to open report files as text streams, optionally compressed.
+
+    Attributes:
+        method (str): The compression method, or "" to write plain files.
+        level (int | None): The codec level (gzip/lzma 0-9, zstd 1-22); None uses the codec default.
+
+    """
+
+    method: str = Compression.NONE
+    level: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the compression method and level."""
+        if self.method and self.method not in available_compressions():
+            msg = f"Unsupported compression method: {self.method}"
+            raise ValueError(msg)
+        if self.level is not None and self.level not in COMPRESSION_LEVELS.get(self.method, ()):
+            msg = f"Unsupported compression level for {self.method or 'no compression'}: {self.level}"
+            raise ValueError(msg)
+
+    @property
+    def suffix(self) -> str:
+        """Return the file suffix appended to compressed reports."""
+        return COMPRESSION_SUFFIXES.get(self.method, "")
+
+    def open(self, path: Path, mode: str = "w", newline: str | None = None) -> TextIO:
+        """Open a report for writing ("w") or appending ("a") as a UTF-8 text stream.
+
+        Pass ``newline=""`` for streams written by a ``csv`` writer.
+        """
+        text_mode = f"{mode}t"
+        level = self.level
+        match self.method:
+            case Compression.GZIP:
+                compresslevel = GZIP_DEFAULT_LEVEL if level is None else level
+                return gzip.open(path, text_mode, compresslevel=compresslevel, encoding="utf-8", newline=newline)
+            case Compression.LZMA:
+                return lzma.open(path, text_mode, preset=level, encoding="utf-8", newline=newline)
+            case Compression.ZSTD:
+                return zstd.open(path, text_mode, level=level, encoding="utf-8", newline=newline)
+        return path.open(mode, encoding="utf-8", buffering=REPORT_BUFFER_SIZE, newline=newline)
+
+    @staticmethod
+    def open_read(path: Path) -> TextIO:
+        """Open a report for reading, decompressing it according to its suffix."""
+        match path.suffix:
+            case ".gz":
+                return gzip.open(path, "rt", encoding="utf-8")
+            case ".xz":
+                return lzma.open(path, "rt", encoding="utf-8")
+            case ".zst" if zstd is not None:
+                return zstd.open(path, "rt", encoding="utf-8")
+        return path.open(encoding="utf-8")
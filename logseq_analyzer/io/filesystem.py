@@ -1,5 +1,6 @@
 """File system operations for Logseq Analyzer."""
 
+import hashlib
 import logging
 import shutil
 from dataclasses import dataclass, field
@@ -11,6 +12,26 @@ from ..utils.enums import Constant, DirsAnalyzer, DirsDelete, DirsGraph
 logger = logging.getLogger(__name__)
 
 
+def graph_key(graph_dir: Path) -> str:
+    """Return the name that keeps the cache and output of a graph apart from other graphs.
+
+    The key is the folder name followed by a short hash of its absolute path, so
+    graphs with the same folder name in different places do not collide.
+    """
+    digest = hashlib.blake2b(str(Path(graph_dir).resolve()).encode("utf-8"), digest_size=4).hexdigest()
+    return f"{Path(graph_dir).name}-{digest}"
+
+
+def graph_output_dir(graph_dir: Path) -> Path:
+    """Return the output directory of a graph, relative to the working directory."""
+    return Path(Constant.OUTPUT_DIR) / graph_key(graph_dir)
+
+
+def graph_cache_file(graph_dir: Path) -> Path:
+    """Return the cache file of a graph, relative to the working directory."""
+    return Path(Constant.CACHE_DIR) / graph_key(graph_dir)
+
+
 @dataclass(slots=True)
 class File:
     """A class to represent a file in the Logseq Analyzer."""
@@ -87,11 +108,15 @@ class File:
 
 @dataclass(slots=True)
 class OutputDirectory(File):
-    """Class to handle the output directory for the Logseq Analyzer."""
+    """Class to handle the output directory for the Logseq Analyzer.
+
+    The directory is kept between runs when it holds an output manifest, which
+    then decides which reports to rewrite; otherwise it is cleaned on init.
+    """
 
     def __post_init__(self) -> None:
         """Post-initialization for OutputDirectory."""
-        self.clean_on_init = True
+        self.clean_on_init = not (Path(self.path) / Constant.OUTPUT_MANIFEST).exists()
         self.is_dir = True
         return super().__post_init__()
 
@@ -325,6 +350,7 @@ class LogseqAnalyzerDirs:
     delete_dirs: AnalyzerDeleteDirs
     target_dirs: dict[str, str]
     output_dir: OutputDirectory
+    cache_file: CacheFile
 
     @property
     def report(self) -> dict[DirsAnalyzer, dict[DirsAnalyzer, Any]]:
@@ -335,5 +361,6 @@ class LogseqAnalyzerDirs:
                 DirsAnalyzer.DELETE: self.delete_dirs.report,
                 DirsAnalyzer.TARGET: self.target_dirs,
                 DirsAnalyzer.OUTPUT: self.output_dir,
+                DirsAnalyzer.CACHE: self.cache_file,
             }
         }
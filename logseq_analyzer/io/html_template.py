@@ -0,0 +1,148 @@
+"""Static style, controls and script of the paginated HTML report shell."""
+
+HTML_STYLE = """
+body { font-family: sans-serif; margin: 2em; }
+nav { display: flex; gap: 0.5em; align-items: center; margin: 1em 0; }
+nav input { flex: 1; max-width: 30em; }
+section { border-top: 1px solid #ddd; padding: 0.5em 0; }
+section h2 { font-size: 1em; margin: 0 0 0.25em; }
+dl { margin: 0 0 0 1em; }
+dt { font-weight: bold; }
+dd { margin-left: 1em; }
+ol { margin: 0 0 0 1em; }
+span { white-space: pre-wrap; }
+"""
+
+HTML_CONTROLS = """<nav>
+<input type="search" id="search" placeholder="Search all rows">
+<button type="button" id="prev">Previous</button>
+<button type="button" id="next">Next</button>
+<span id="status"></span>
+</nav>
+<div id="rows"></div>
+"""
+
+HTML_SCRIPT = """
+"use strict";
+(() => {
+  const meta = JSON.parse(document.getElementById("report-meta").textContent);
+  const inline = document.getElementById("report-rows");
+  const size = meta.pageSize;
+  const pages = new Map();
+  const waiting = new Map();
+  const search = document.getElementById("search");
+  const status = document.getElementById("status");
+  const list = document.getElementById("rows");
+  const prev = document.getElementById("prev");
+  const next = document.getElementById("next");
+  let current = 1;
+  let matches = null;
+  let token = 0;
+  let timer = 0;
+
+  if (inline) pages.set(1, JSON.parse(inline.textContent));
+  window.logseqReportPage = (page, rows) => {
+    pages.set(page, rows);
+    const resolve = waiting.get(page);
+    if (resolve) {
+      waiting.delete(page);
+      resolve(rows);
+    }
+  };
+
+  function loadPage(page) {
+    if (page > meta.pages) return Promise.resolve([]);
+    if (pages.has(page)) return Promise.resolve(pages.get(page));
+    return new Promise((resolve, reject) => {
+      waiting.set(page, resolve);
+      const script = document.createElement("script");
+      script.src = `${meta.dataDir}/page-${page}.js`;
+      script.onerror = () => reject(new Error(`Failed to load ${script.src}`));
+      document.head.appendChild(script);
+    });
+  }
+
+  function render(value) {
+    if (Array.isArray(value)) {
+      const ol = document.createElement("ol");
+      for (const item of value) {
+        const li = document.createElement("li");
+        li.appendChild(render(item));
+        ol.appendChild(li);
+      }
+      return ol;
+    }
+    if (value !== null && typeof value === "object") {
+      const dl = document.createElement("dl");
+      for (const [key, item] of Object.entries(value)) {
+        const dt = document.createElement("dt");
+        const dd = document.createElement("dd");
+        dt.textContent = key;
+        dd.appendChild(render(item));
+        dl.append(dt, dd);
+      }
+      return dl;
+    }
+    const span = document.createElement("span");
+    span.textContent = String(value);
+    return span;
+  }
+
+  function renderRow([position, key, value]) {
+    const section = document.createElement("section");
+    const heading = document.createElement("h2");
+    heading.textContent = key === null ? `#${position}` : key;
+    section.append(heading, render(value));
+    return section;
+  }
+
+  async function update() {
+    const ticket = ++token;
+    let rows;
+    let total;
+    if (matches) {
+      total = matches.length;
+      rows = matches.slice((current - 1) * size, current * size);
+    } else {
+      total = meta.rows;
+      const data = await loadPage(current);
+      if (ticket !== token) return;
+      rows = data.map((row, i) => [(current - 1) * size + i + 1, ...row]);
+    }
+    const pageCount = Math.max(1, Math.ceil(total / size));
+    status.textContent = `Page ${current} of ${pageCount} (${total} rows)`;
+    prev.disabled = current <= 1;
+    next.disabled = current >= pageCount;
+    list.replaceChildren(...rows.map(renderRow));
+  }
+
+  async function runSearch() {
+    const query = search.value.trim().toLowerCase();
+    const ticket = ++token;
+    current = 1;
+    if (!query) {
+      matches = null;
+      return update();
+    }
+    const found = [];
+    for (let page = 1; page <= meta.pages; page++) {
+      status.textContent = `Searching page ${page} of ${meta.pages}`;
+      const data = await loadPage(page);
+      if (ticket !== token) return;
+      data.forEach((row, i) => {
+        if (JSON.stringify(row).toLowerCase().includes(query)) found.push([(page - 1) * size + i + 1, ...row]);
+      });
+    }
+    matches = found;
+    return update();
+  }
+
+  prev.addEventListener("click", () => { current -= 1; update(); });
+  next.addEventListener("click", () => { current += 1; update(); });
+  search.addEventListener("input", () => {
+    clearTimeout(timer);
+    timer = setTimeout(runSearch, 250);
+  });
+  update().catch((error) => { status.textContent = error.message; });
+})();
+"""
@@ -0,0 +1,160 @@
+"""Output manifest to skip unchanged report writes and remove stale reports."""
+
+import hashlib
+import json
+import logging
+import shutil
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TextIO
+
+from ..utils.enums import Constant
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(slots=True)
+class HashingStream:
+    """A write-only text stream that hashes everything written to it and passes it on to another stream.
+
+    Writes are buffered and forwarded in chunks of ``buffer_size`` characters, so
+    each of the many small strings of a streaming encoder costs a list append.
+    """
+
+    stream: TextIO | None = None
+    hasher: Any = field(default_factory=lambda: hashlib.blake2b(digest_size=16))
+    buffer_size: int = 1 << 16
+    pending: list[str] = field(default_factory=list)
+    pending_size: int = 0
+
+    def write(self, text: str) -> int:
+        """Buffer a string for hashing and writing."""
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if self.pending_size >= self.buffer_size:
+            self.flush()
+        return len(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Buffer a sequence of strings for hashing and writing."""
+        write = self.write
+        for text in lines:
+            write(text)
+
+    def flush(self) -> None:
+        """Hash the buffered strings and write them to the stream."""
+        if not self.pending:
+            return
+        text = "".join(self.pending)
+        self.pending.clear()
+        self.pending_size = 0
+        self.hasher.update(text.encode("utf-8"))
+        if self.stream is not None:
+            self.stream.write(text)
+
+    def hexdigest(self) -> str:
+        """Return the digest of everything written so far."""
+        self.flush()
+        return self.hasher.hexdigest()
+
+
+@dataclass(slots=True)
+class OutputManifest:
+    """A class to track the report files of the output directory across runs.
+
+    Every report is recorded under its key (``subdir/prefix``) with the file it was
+    written to, the hash of its serialized content, its count, format and
+    compression. Reports whose hash and file match the previous run are not
+    rewritten, and files of the previous run that no report claimed this run are
+    removed when the manifest is finalized.
+    """
+
+    output_dir: Path
+    previous: dict[str, dict[str, Any]] = field(default_factory=dict)
+    current: dict[str, dict[str, Any]] = field(default_factory=dict)
+    written: int = 0
+    skipped: int = 0
+    lock: Lock = field(default_factory=Lock)
+
+    def __post_init__(self) -> None:
+        """Load the manifest of the previous run."""
+        self.load()
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the manifest file."""
+        return self.output_dir / Constant.OUTPUT_MANIFEST
+
+    def load(self) -> None:
+        """Load the report entries of the previous run, if any."""
+        if not self.path.exists():
+            return
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable output manifest: %s", self.path)
+            return
+        if manifest.get("version") == MANIFEST_VERSION:
+            self.previous = manifest.get("reports", {})
+
+    def has_report(self, key: str, file: str) -> bool:
+        """Return whether the previous run wrote a report to the same file and the file still exists."""
+        entry = self.previous.get(key)
+        return entry is not None and entry.get("file") == file and (self.output_dir / file).exists()
+
+    def is_current(self, key: str, file: str, digest: str) -> bool:
+        """Return whether a report is unchanged since the previous run and its file still exists."""
+        return self.has_report(key, file) and self.previous[key].get("hash") == digest
+
+    def record(self, key: str, entry: dict[str, Any], *, written: bool) -> None:
+        """Record the entry of a report for this run."""
+        with self.lock:
+            self.current[key] = entry
+            if written:
+                self.written += 1
+            else:
+                self.skipped += 1
+
+    def finalize(self) -> None:
+        """Remove the stale report files of the previous run and save the manifest."""
+        removed = self.remove_stale()
+        self.save()
+        logger.info("Reports written: %d, unchanged: %d, stale removed: %d", self.written, self.skipped, removed)
+
+    def remove_stale(self) -> int:
+        """Delete the files of the previous run that were not written or kept this run."""
+        output_dir = self.output_dir
+        keep = {entry["file"] for entry in self.current.values()}
+        removed = 0
+        for entry in self.previous.values():
+            if (file := entry.get("file")) is None or file in keep:
+                continue
+            path = output_dir / file
+            path.unlink(missing_ok=True)
+            data_dir = path.with_name(f"{path.name}.data")
+            if data_dir.is_dir():
+                shutil.rmtree(data_dir)
+            OutputManifest.remove_empty_parents(path, output_dir)
+            removed += 1
+        return removed
+
+    def save(self) -> None:
+        """Write the manifest of this run."""
+        manifest = {"version": MANIFEST_VERSION, "reports": dict(sorted(self.current.items()))}
+        with self.path.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4, ensure_ascii=False)
+
+    @staticmethod
+    def remove_empty_parents(path: Path, output_dir: Path) -> None:
+        """Remove the directories between a deleted file and the output directory that are now empty."""
+        parent = path.parent
+        while parent != output_dir and parent.is_relative_to(output_dir) and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
@@ -1,33 +1,51 @@
 """Reporting module for writing output to files, including HTML reports."""
 
-import json
 import logging
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar, TextIO
-
+import math
+import os
+import shutil
+from array import array
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, time, timedelta
+from enum import Enum
+from html import escape
+from itertools import batched
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import TYPE_CHECKING, Any, TextIO
+from urllib.parse import quote
+
+from ..logseq_file.file import LogseqFile
 from ..utils.enums import Format
+from .compression import ReportCompression
+from .html_template import HTML_CONTROLS, HTML_SCRIPT, HTML_STYLE
+from .manifest import HashingStream
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
-    from ..config.arguments import Args
-    from ..io.filesystem import LogseqAnalyzerDirs
+    from ..config.context import AnalyzerContext
+    from .manifest import OutputManifest
 
 logger = logging.getLogger(__name__)
 
+JSON_CONSTANTS = {None: "null", True: "true", False: "false"}
+
 
 class TextWriter:
     """A class to handle recursive writing of nested data structures to text files."""
 
     @staticmethod
-    def write(outputpath: Path, prefix: str, count: int | None, filename: str, data: Any) -> None:
-        """Write the data to a plain text file with the given prefix and count."""
-        with outputpath.open("w", encoding="utf-8") as f:
-            if count is not None:
-                f.write(f"{prefix} | {filename}\n")
-                f.write(f"COUNT: {count}\n")
-                f.write(f"TYPE: {data.__class__.__qualname__}\n\n")
-            TextWriter.write_recursive(f, data)
+    def write(f: TextIO, prefix: str, count: int | None, filename: str, data: Any) -> None:
+        """Write the data to a plain text stream with the given prefix and count."""
+        if count is not None:
+            f.write(f"{prefix} | {filename}\n")
+            f.write(f"COUNT: {count}\n")
+            f.write(f"TYPE: {data.__class__.__qualname__}\n\n")
+        TextWriter.write_recursive(f, data)
 
     @staticmethod
     def write_recursive(f: TextIO, data: Any, indent_level: int = 0) -> None:
@@ -41,173 +59,363 @@ class TextWriter:
     @staticmethod
     def write_toplevel_dict(f: TextIO, data: dict, indent: str, indent_level: int = 0) -> None:
         """Write the top-level dictionary to a file."""
+        label = TextWriter.label
         f_write = f.write
         write_dict = TextWriter.write_values_is_dict
         write_collection = TextWriter.write_values_is_collection
         for key, values in data.items():
-            f_write(f"{indent}KEY: {key}\n")
+            f_write(f"{indent}KEY: {label(key)}\n")
             if isinstance(values, dict):
                 write_dict(f, values, indent, indent_level)
             elif isinstance(values, (list, set)):
                 write_collection(f, values, indent)
             else:
-                f_write(f"{indent}VAL: {values}\n\n")
+                f_write(f"{indent}VAL: {label(values)}\n\n")
 
     @staticmethod
     def write_values_is_dict(f: TextIO, data: dict, indent: str, indent_level: int = 0) -> None:
         """Write values of a dictionary to a file with indentation."""
+        label = TextWriter.label
         f_write = f.write
         write_recursive = TextWriter.write_recursive
         for key, values in data.items():
             if not isinstance(values, (list, set, dict)):
-                f_write(f"{indent}\t{key:<60}: {values}\n")
+                f_write(f"{indent}\t{label(key):<60}: {label(values)}\n")
             else:
-                f_write(f"{indent}\t{key:<60}:\n")
+                f_write(f"{indent}\t{label(key):<60}:\n")
                 write_recursive(f, values, indent_level + 2)
         f_write("\n" + "-" * 180 + "\n\n")
 
     @staticmethod
     def write_values_is_collection(f: TextIO, values: Any, indent: str) -> None:
         """Write values of a collection to a file with indentation."""
+        label = TextWriter.label
         f_write = f.write
         f_write(f"{indent}VALUES ({len(values)}):\n")
+        if isinstance(values, set):
+            values = StreamingJSONEncoder.sorted_if_possible(values)
         for index, value in enumerate(values, 1):
-            f_write(f"{indent}\t{index}\t|\t{value}\n")
+            f_write(f"{indent}\t{index}\t|\t{label(value)}\n")
         f_write("\n")
 
     @staticmethod
     def write_not_toplevel_dict(f: TextIO, data: Any, indent: str, indent_level: int = 0) -> None:
         """Write the non-top-level dictionary to a file."""
+        label = TextWriter.label
         if isinstance(data, dict):
             TextWriter.write_nested_dict(f, data, indent, indent_level)
         elif isinstance(data, (list, set)):
             TextWriter.write_nested_collection(f, data, indent, indent_level)
         else:
-            f.write(f"{indent}{data}\n")
+            f.write(f"{indent}{label(data)}\n")
 
     @staticmethod
     def write_nested_dict(f: TextIO, data: dict, indent: str, indent_level: int = 0) -> None:
         """Write nested dictionaries to a file with indentation."""
+        label = TextWriter.label
         f_write = f.write
         write_recursive = TextWriter.write_recursive
         for key, values in data.items():
             if isinstance(values, (list, set, dict)):
-                f_write(f"{indent}{key}:\n")
+                f_write(f"{indent}{label(key)}:\n")
                 write_recursive(f, values, indent_level + 1)
             else:
-                f_write(f"{indent}{key:<60}: {values}\n")
+                f_write(f"{indent}{label(key):<60}: {label(values)}\n")
 
     @staticmethod
     def write_nested_collection(f: TextIO, data: Any, indent: str, indent_level: int = 0) -> None:
-        """Write collections (lists, sets) to a file with indentation."""
+        """Write collections (lists, sets) to a file with indentation, sets in sorted order."""
+        label = TextWriter.label
         f_write = f.write
         write_recursive = TextWriter.write_recursive
+        if isinstance(data, set):
+            data = StreamingJSONEncoder.sorted_if_possible(data)
         for index, item in enumerate(data, 1):
             if isinstance(item, (list, set, dict)):
                 f_write(f"{indent}{index}:\n")
                 write_recursive(f, item, indent_level + 1)
             else:
-                f_write(f"{indent}{index}\t|\t{item}\n")
+                f_write(f"{indent}{index}\t|\t{label(item)}\n")
+
+    @staticmethod
+    def label(value: Any) -> Any:
+        """Return a file as its path for text output, and any other value unchanged."""
+        if isinstance(value, LogseqFile):
+            return str(value.path.file)
+        return value
 
 
+@dataclass(slots=True)
 class HTMLWriter:
-    """A class to handle writing HTML content."""
+    """A class to write HTML reports as a small shell page with paginated, client-side rendering.
 
-    @staticmethod
-    def write(outputpath: Path, prefix: str, count: int | None, filename: str, data: Any) -> None:
-        """Write the data to an HTML file with the given prefix and count.
+    The top-level entries of a report become rows that the shell page renders a
+    page at a time, with search across all rows. Reports that fit on one page
+    are embedded in the shell; larger ones are split into numbered data pages
+    next to it, loaded on demand as scripts so the report also works from
+    ``file://`` URLs. Values are rendered with ``textContent``, so they are
+    always escaped.
+    """
+
+    page_size: int = 500
+
+    def write(self, f: TextIO, prefix: str, count: int | None, filename: str, data: Any) -> None:
+        """Write the shell page of a report.
 
         Args:
-            outputpath (Path): The path where the HTML file will be written.
+            f (TextIO): The stream the HTML document is written to.
             prefix (str): The prefix for the HTML title and header.
             count (int | None): The count of items, if applicable.
             filename (str): The name of the file being processed.
-            data (Any): The data to be written to the HTML file.
+            data (Any): The data of the report.
 
         """
-        with outputpath.open("w", encoding="utf-8") as f:
-            f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
-            f.write(f'<meta charset="utf-8">\n<title>{prefix}</title>\n')
-            f.write(
-                """<style>
-                body { font-family: sans-serif; margin: 2em; }
-                dl { margin-left: 1em; }
-                ol { margin-left: 1em; }
-                span { display: inline-block; }
-                </style>\n"""
-            )
-            f.write("</head>\n<body>\n")
-            f.write(f"<h1>{prefix}</h1>\n")
-            if count is not None:
-                f.write(f"<p>{filename}</p>\n")
-                f.write(f"<p>COUNT: {count}</p>\n")
-                f.write(f"<p>TYPE: {data.__class__.__qualname__}</p>\n")
-            HTMLWriter.write_html_recursive(f, data)
-            f.write("</body>\n</html>\n")
+        rows = HTMLWriter.row_count(data)
+        pages = math.ceil(rows / self.page_size)
+        meta = {
+            "pages": pages,
+            "pageSize": self.page_size,
+            "rows": rows,
+            "dataDir": quote(HTMLWriter.data_dir_name(filename)),
+        }
+        title = escape(prefix)
+        f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
+        f.write(f'<meta charset="utf-8">\n<title>{title}</title>\n')
+        f.write(f"<style>{HTML_STYLE}</style>\n")
+        f.write("</head>\n<body>\n")
+        f.write(f"<h1>{title}</h1>\n")
+        if count is not None:
+            f.write(f"<p>{escape(filename)}</p>\n")
+            f.write(f"<p>COUNT: {count}</p>\n")
+            f.write(f"<p>TYPE: {escape(data.__class__.__qualname__)}</p>\n")
+        f.write(HTML_CONTROLS)
+        f.write('<script type="application/json" id="report-meta">')
+        f.writelines(HTMLWriter.script_safe(StreamingJSONEncoder(indent=None).iterencode(meta)))
+        f.write("</script>\n")
+        if pages == 1:
+            f.write('<script type="application/json" id="report-rows">')
+            f.writelines(HTMLWriter.script_safe(self.encode_page(HTMLWriter.rows(data))))
+            f.write("</script>\n")
+        f.write(f"<script>{HTML_SCRIPT}</script>\n")
+        f.write("</body>\n</html>\n")
+
+    def write_pages(self, data_dir: Path | None, data: Any, hasher: Any = None) -> None:
+        """Write the data pages of a report that does not fit on a single page, replacing older pages.
+
+        Pages are never compressed: the shell page loads them as plain scripts.
+        When a hasher is given, the pages are added to it as they are written;
+        without a data directory they are only hashed.
+        """
+        if data_dir is not None and data_dir.exists():
+            shutil.rmtree(data_dir)
+        if math.ceil(HTMLWriter.row_count(data) / self.page_size) <= 1:
+            return
+        if data_dir is not None:
+            data_dir.mkdir()
+        for page, rows in enumerate(batched(HTMLWriter.rows(data), self.page_size, strict=False), 1):
+            page_file = nullcontext() if data_dir is None else ReportCompression().open(data_dir / f"page-{page}.js")
+            with page_file as f:
+                sink = HashingStream(f) if hasher is None else HashingStream(f, hasher)
+                sink.write(f"logseqReportPage({page}, ")
+                sink.writelines(self.encode_page(rows))
+                sink.write(");\n")
+                sink.flush()
+
+    def encode_page(self, rows: Iterable[tuple[str | None, Any]]) -> Iterator[str]:
+        """Yield the JSON encoding of the rows of a page."""
+        return StreamingJSONEncoder(indent=None).iterencode(list(rows))
 
     @staticmethod
-    def write_html_recursive(f: TextIO, data: Any) -> None:
-        """Recursive helper to write nested data structures into HTML format.
+    def rows(data: Any) -> Iterator[tuple[str | None, Any]]:
+        """Yield the top-level rows of a report as (key, value) pairs; keys are None outside mappings."""
+        if isinstance(data, Mapping):
+            for key, value in data.items():
+                yield StreamingJSONEncoder.key_text(key), value
+        elif isinstance(data, (set, frozenset)):
+            for value in StreamingJSONEncoder.sorted_if_possible(data):
+                yield None, value
+        elif isinstance(data, (list, tuple)):
+            for value in data:
+                yield None, value
+        else:
+            yield None, data
 
-        Uses <dl> for dicts, <ol> for lists/sets, and <span> for simple values.
-        """
-        if isinstance(data, dict):
-            HTMLWriter.write_dict_html(f, data)
-        elif isinstance(data, (list, set)):
-            HTMLWriter.write_collection_html(f, data)
+    @staticmethod
+    def row_count(data: Any) -> int:
+        """Return the number of top-level rows of a report."""
+        if isinstance(data, (Mapping, list, tuple, set, frozenset)):
+            return len(data)
+        return 1
+
+    @staticmethod
+    def data_dir_name(filename: str) -> str:
+        """Return the name of the directory holding the data pages of a report file."""
+        return f"{filename}.data"
+
+    @staticmethod
+    def script_safe(chunks: Iterable[str]) -> Iterator[str]:
+        """Escape "<" in JSON chunks so they can be embedded in a script element."""
+        for chunk in chunks:
+            yield chunk.replace("<", "\\u003c")
+
+
+@dataclass(slots=True)
+class StreamingJSONEncoder:
+    """A class to encode analyzer data to JSON incrementally, one chunk at a time.
+
+    Besides the JSON types it natively handles the types found in reports: sets,
+    mappings with non-string keys, dataclasses (slotted or not), LogseqFile objects
+    (by name and path), dates, times, paths and enums. Containers are walked in
+    place, so no intermediate copy of the data is built.
+    """
+
+    indent: int | None = 4
+    ensure_ascii: bool = False
+
+    def iterencode(self, data: Any) -> Iterator[str]:
+        """Yield the JSON encoding of the data as a sequence of strings."""
+        encode_str = encode_basestring_ascii if self.ensure_ascii else encode_basestring
+        return self.encode_value(data, 0, set(), encode_str)
+
+    def encode_value(self, obj: Any, level: int, markers: set[int], encode_str: Callable[[str], str]) -> Iterator[str]:
+        """Yield the JSON encoding of a single value."""
+        if isinstance(obj, str):
+            yield encode_str(obj)
+        elif obj is None or isinstance(obj, (bool, int, float)):
+            yield StreamingJSONEncoder.encode_scalar(obj)
+        elif isinstance(obj, Mapping):
+            yield from self.encode_items(obj, obj.items(), level, markers, encode_str)
+        elif isinstance(obj, (list, tuple, array)):
+            yield from self.encode_sequence(obj, obj, level, markers, encode_str)
+        elif isinstance(obj, (set, frozenset)):
+            values = StreamingJSONEncoder.sorted_if_possible(obj)
+            yield from self.encode_sequence(obj, values, level, markers, encode_str)
+        elif isinstance(obj, LogseqFile):
+            file_items = (("name", obj.path.name), ("path", str(obj.path.file)))
+            yield from self.encode_items(obj, file_items, level, markers, encode_str)
+        elif isinstance(obj, (date, time)):
+            yield encode_str(obj.isoformat())
+        elif isinstance(obj, timedelta):
+            yield StreamingJSONEncoder.encode_scalar(obj.total_seconds())
+        elif isinstance(obj, Enum):
+            yield from self.encode_value(obj.value, level, markers, encode_str)
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            items = ((f.name, getattr(obj, f.name)) for f in fields(obj) if hasattr(obj, f.name))
+            yield from self.encode_items(obj, items, level, markers, encode_str)
         else:
-            f.write(f"<span>{data}</span>\n")
+            yield encode_str(str(obj))
+
+    def encode_items(
+        self,
+        obj: Any,
+        items: Iterable[tuple[Any, Any]],
+        level: int,
+        markers: set[int],
+        encode_str: Callable[[str], str],
+    ) -> Iterator[str]:
+        """Yield the JSON encoding of key/value pairs as an object."""
+        StreamingJSONEncoder.enter(obj, markers)
+        newline, closing, item_sep, key_sep = self.separators(level)
+        yield "{"
+        sep = newline
+        empty = True
+        for key, value in items:
+            yield f"{sep}{StreamingJSONEncoder.encode_key(key, encode_str)}{key_sep}"
+            yield from self.encode_value(value, level + 1, markers, encode_str)
+            sep = item_sep
+            empty = False
+        yield "}" if empty else f"{closing}}}"
+        markers.discard(id(obj))
+
+    def encode_sequence(
+        self,
+        obj: Any,
+        values: Iterable[Any],
+        level: int,
+        markers: set[int],
+        encode_str: Callable[[str], str],
+    ) -> Iterator[str]:
+        """Yield the JSON encoding of values as an array."""
+        StreamingJSONEncoder.enter(obj, markers)
+        newline, closing, item_sep, _ = self.separators(level)
+        yield "["
+        sep = newline
+        empty = True
+        for value in values:
+            yield sep
+            yield from self.encode_value(value, level + 1, markers, encode_str)
+            sep = item_sep
+            empty = False
+        yield "]" if empty else f"{closing}]"
+        markers.discard(id(obj))
+
+    def separators(self, level: int) -> tuple[str, str, str, str]:
+        """Return the opening newline, closing newline, item and key separators for a nesting level."""
+        if self.indent is None:
+            return "", "", ", ", ": "
+        newline = "\n" + " " * (self.indent * (level + 1))
+        return newline, "\n" + " " * (self.indent * level), f",{newline}", ": "
 
     @staticmethod
-    def write_collection_html(f: TextIO, data: Any) -> None:
-        """Write collections (lists, sets) to HTML format.
+    def enter(obj: Any, markers: set[int]) -> None:
+        """Mark a container as being encoded, raising on circular references."""
+        if (marker := id(obj)) in markers:
+            msg = f"Circular reference detected while encoding {type(obj).__qualname__}"
+            raise ValueError(msg)
+        markers.add(marker)
 
-        Uses <ol> for ordered lists and <li> for items.
-        """
-        f.write("<ol>\n")
-        for item in data:
-            f.write("  <li>")
-            if isinstance(item, (dict, list, set)):
-                f.write("\n")
-                HTMLWriter.write_html_recursive(f, item)
-                f.write("  ")
-            else:
-                f.write(f"<span>{item}</span>")
-            f.write("</li>\n")
-        f.write("</ol>\n")
+    @staticmethod
+    def encode_scalar(obj: float | None) -> str:
+        """Return the JSON encoding of None, a boolean or a number."""
+        if obj is None or isinstance(obj, bool):
+            return JSON_CONSTANTS[obj]
+        if isinstance(obj, int):
+            return int.__repr__(obj)
+        if math.isfinite(obj):
+            return float.__repr__(obj)
+        if math.isnan(obj):
+            return "NaN"
+        return "Infinity" if obj > 0 else "-Infinity"
 
     @staticmethod
-    def write_dict_html(f: TextIO, data: dict) -> None:
-        """Write a dictionary to HTML format.
+    def encode_key(key: Any, encode_str: Callable[[str], str]) -> str:
+        """Return the JSON encoding of a mapping key, converting non-string keys to strings."""
+        return encode_str(StreamingJSONEncoder.key_text(key))
 
-        Uses <dl> for definition lists, <dt> for terms, and <dd> for definitions.
-        """
-        f.write("<dl>\n")
-        for key, value in data.items():
-            f.write(f"  <dt><strong>{key}</strong></dt>\n")
-            f.write("  <dd>")
-            if isinstance(value, (dict, list, set)):
-                f.write("\n")
-                HTMLWriter.write_html_recursive(f, value)
-                f.write("  ")
-            else:
-                f.write(f"<span>{value}</span>")
-            f.write("</dd>\n")
-        f.write("</dl>\n")
+    @staticmethod
+    def key_text(key: Any) -> str:
+        """Return the string a mapping key is encoded as."""
+        if isinstance(key, str):
+            return key
+        if key is None or isinstance(key, (bool, int, float)):
+            return StreamingJSONEncoder.encode_scalar(key)
+        if isinstance(key, Enum):
+            return str(key.value)
+        if isinstance(key, (date, time)):
+            return key.isoformat()
+        if isinstance(key, LogseqFile):
+            return str(key.path.file)
+        return str(key)
+
+    @staticmethod
+    def sorted_if_possible(values: set[Any] | frozenset[Any]) -> Iterable[Any]:
+        """Return the values of a set sorted for stable output, or unsorted if they are not orderable."""
+        try:
+            return sorted(values)
+        except TypeError:
+            return values
 
 
 class JSONWriter:
     """A class to handle writing JSON content."""
 
     @staticmethod
-    def write(outputpath: Path, prefix: str, count: int | None, filename: str, data: Any) -> None:
-        """Write the data to a JSON file."""
-        try:
-            with outputpath.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            logger.info("Successfully wrote JSON for %s items in filename: %s", count, filename)
-        except TypeError:
-            logger.exception("Failed to write JSON for %s, falling back to TXT.", prefix)
+    def write(f: TextIO, prefix: str, count: int | None, filename: str, data: Any) -> None:
+        """Stream the data as JSON without holding the encoded document in memory."""
+        logger.debug("Encoding %s as JSON", prefix)
+        f.writelines(StreamingJSONEncoder().iterencode(data))
+        f.write("\n")
+        logger.info("Successfully wrote JSON for %s items in filename: %s", count, filename)
 
 
 @dataclass(slots=True)
@@ -228,31 +436,37 @@ class ReportWriter:
     subdir: str
     writer: Writers = field(default_factory=Writers)
 
-    ext: ClassVar[str]
-    output_dir: ClassVar[Path]
-
-    @classmethod
-    def configure(cls, args: Args, analyzer_dirs: LogseqAnalyzerDirs) -> None:
-        """Configure the ReportWriter class with necessary settings.
+    def write(
+        self,
+        ctx: AnalyzerContext,
+        *,
+        make_dirs: bool = True,
+        compression: ReportCompression | None = None,
+        manifest: OutputManifest | None = None,
+    ) -> None:
+        """Write the report to a file in the configured format (TXT, JSON, or HTML).
 
         Args:
-            args (Args): The command-line arguments.
-            analyzer_dirs (LogseqAnalyzerDirs): The directories used by the Logseq Analyzer.
+            ctx (AnalyzerContext): The context of the current analyzer run.
+            make_dirs (bool): Whether to create the output subdirectory if it is missing.
+            compression (ReportCompression | None): The compression to use, taken from the arguments if None.
+            manifest (OutputManifest | None): The manifest used to skip unchanged reports, if any.
 
         """
-        cls.ext = args.report_format
-        cls.output_dir = analyzer_dirs.output_dir.path
-
-    def write(self) -> None:
-        """Write the report to a file in the configured format (TXT, JSON, or HTML)."""
         _data = self.data
         _prefix = self.prefix
-        _ext = self.ext
+        _ext = ctx.args.report_format.lstrip(".")
         _writer = self.writer
+        if compression is None:
+            compression = ReportCompression(ctx.args.compression, ctx.args.compression_level)
+        if _ext == Format.HTML:
+            # Browsers cannot open compressed shell pages or load compressed data page scripts.
+            compression = ReportCompression()
         count = len(_data) if hasattr(_data, "__len__") else None
-        filename = f"{_prefix}.{_ext}" if count else f"(EMPTY) {_prefix}.{_ext}"
-        outputpath = self.get_output_path(filename)
-        logger.info("Writing %s as %s", _prefix, _ext)
+        filename = f"{_prefix}.{_ext}{compression.suffix}"
+        if not count:
+            filename = f"(EMPTY) {filename}"
+        outputpath = self.get_output_path(ctx.output_dir, filename, make_dirs=make_dirs)
         write_method = {
             Format.TXT: _writer.text.write,
             Format.MD: _writer.text.write,
@@ -260,18 +474,130 @@ class ReportWriter:
             Format.HTML: _writer.html.write,
         }.get(_ext, _writer.text.write)
 
-        write_method(outputpath, _prefix, count, filename, _data)
+        key = f"{self.subdir}/{_prefix}" if self.subdir else _prefix
+        file = outputpath.relative_to(ctx.output_dir).as_posix()
+        entry = {"file": file, "hash": "", "count": count, "format": _ext, "compression": compression.method}
+        if manifest is not None and manifest.has_report(key, file):
+            # Hash without writing first, so an unchanged report is never opened for writing.
+            entry["hash"] = self.write_temp(write_method, None, count, filename, compression)
+            if manifest.is_current(key, file, entry["hash"]):
+                logger.debug("Keeping unchanged report %s", _prefix)
+                manifest.record(key, entry, written=False)
+                return
+
+        logger.info("Writing %s as %s", _prefix, _ext)
+        temp_path = outputpath.with_name(f"{filename}.tmp")
+        try:
+            entry["hash"] = self.write_temp(write_method, temp_path, count, filename, compression)
+        except BaseException:
+            ReportWriter.discard(temp_path)
+            raise
+        ReportWriter.commit(temp_path, outputpath)
+        if manifest is not None:
+            manifest.record(key, entry, written=True)
+
+    def write_temp(
+        self,
+        write_method: Callable[..., None],
+        temp_path: Path | None,
+        count: int | None,
+        filename: str,
+        compression: ReportCompression,
+    ) -> str:
+        """Write the report to a temporary file, moved into place by ``commit``, and return its hash.
+
+        The hash covers the compression settings and the uncompressed text,
+        including the data pages of HTML reports, and is computed in the same
+        pass that writes them. Without a path the report is only hashed.
+        """
+        report_file = nullcontext() if temp_path is None else compression.open(temp_path)
+        with report_file as f:
+            sink = HashingStream(f)
+            sink.hasher.update(f"{compression.method}:{compression.level}\n".encode())
+            write_method(sink, self.prefix, count, filename, self.data)
+            sink.flush()
+        if write_method == self.writer.html.write:
+            data_dir = None if temp_path is None else ReportWriter.data_dir(temp_path)
+            self.writer.html.write_pages(data_dir, self.data, sink.hasher)
+        return sink.hexdigest()
+
+    @staticmethod
+    def data_dir(path: Path) -> Path:
+        """Return the directory holding the HTML data pages of a report file."""
+        return path.with_name(HTMLWriter.data_dir_name(path.name))
+
+    @staticmethod
+    def commit(temp_path: Path, outputpath: Path) -> None:
+        """Move a temporary report, and its data pages if any, into place."""
+        temp_path.replace(outputpath)
+        data_dir = ReportWriter.data_dir(outputpath)
+        if data_dir.is_dir():
+            shutil.rmtree(data_dir)
+        if (temp_data_dir := ReportWriter.data_dir(temp_path)).is_dir():
+            temp_data_dir.rename(data_dir)
 
-    def get_output_path(self, filename: str) -> Path:
+    @staticmethod
+    def discard(temp_path: Path) -> None:
+        """Remove a temporary report and its data pages, if any."""
+        temp_path.unlink(missing_ok=True)
+        if (temp_data_dir := ReportWriter.data_dir(temp_path)).is_dir():
+            shutil.rmtree(temp_data_dir)
+
+    def get_output_path(self, output_dir: Path, filename: str, *, make_dirs: bool = True) -> Path:
         """Get the output path for the report file.
 
         Args:
+            output_dir (Path): The root output directory.
             filename (str): The name of the file to be created.
+            make_dirs (bool): Whether to create the output subdirectory if it is missing.
 
         Returns:
             Path: The output path for the report file.
 
         """
-        output_dir = self.output_dir / self.subdir if self.subdir else self.output_dir
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = output_dir / self.subdir if self.subdir else output_dir
+        if make_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir / filename
+
+
+@dataclass(slots=True)
+class ReportBatch:
+    """A class to write a batch of reports concurrently on a bounded thread pool."""
+
+    ctx: AnalyzerContext
+    manifest: OutputManifest | None = None
+    max_workers: int = field(default_factory=lambda: min(32, (os.cpu_count() or 1) + 4))
+    reports: list[ReportWriter] = field(default_factory=list)
+
+    def add(self, subdir: str, reports: dict[str, Any]) -> None:
+        """Queue the reports of an output subdirectory for writing."""
+        self.reports.extend(ReportWriter(prefix, data, subdir) for prefix, data in reports.items())
+
+    def write(self) -> None:
+        """Create the output subdirectories once, then write every queued report.
+
+        Failed writes do not stop the remaining ones; their errors are raised
+        together as an ExceptionGroup once the batch has finished.
+        """
+        ctx = self.ctx
+        output_dir = ctx.output_dir
+        manifest = self.manifest
+        compression = ReportCompression(ctx.args.compression, ctx.args.compression_level)
+        for subdir in {report.subdir for report in self.reports}:
+            (output_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="report-writer") as pool:
+            futures = {
+                pool.submit(report.write, ctx, make_dirs=False, compression=compression, manifest=manifest): report
+                for report in self.reports
+            }
+            for future in as_completed(futures):
+                if (exc := future.exception()) is not None:
+                    logger.error("Failed to write report %s: %s", futures[future].prefix, exc)
+                    errors.append(exc)
+        self.reports.clear()
+        if errors:
+            msg = f"Failed to write {len(errors)} reports"
+            raise ExceptionGroup(msg, errors)
@@ -0,0 +1,166 @@
+"""Tabular CSV/TSV export of per-file metrics and extracted file data."""
+
+import csv
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..utils.enums import Core, Format, OutputDir, Table
+from .compression import ReportCompression
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ..analysis.index import FileIndex
+    from ..config.context import AnalyzerContext
+    from ..logseq_file.file import LogseqFile
+    from .manifest import OutputManifest
+
+logger = logging.getLogger(__name__)
+
+TABLE_DIALECTS: dict[str, type[csv.Dialect]] = {
+    Format.CSV: csv.excel,
+    Format.TSV: csv.excel_tab,
+}
+
+FILE_COLUMNS: tuple[str, ...] = (
+    "path",
+    "name",
+    "file_type",
+    "node_type",
+    "size",
+    "has_content",
+    "date_created",
+    "date_modified",
+    "time_existed",
+    "time_unmodified",
+    "bullets",
+    "empty_bullets",
+    "chars",
+    "char_per_bullet",
+    "is_namespace",
+    "namespace_depth",
+    "namespace_root",
+    "has_backlinks",
+    "backlinked",
+    "backlinked_ns_only",
+    "is_hls",
+)
+
+DATA_COLUMNS: tuple[str, ...] = ("path", "name", "criterion", "position", "value", "detail")
+
+
+@dataclass(slots=True)
+class TableExport:
+    """A class to stream per-file metrics and data occurrences as CSV or TSV tables.
+
+    The ``files`` table has one row per file of the index. The ``file_data`` table
+    has one row per value of each criterion in ``LogseqFile.data``: mapping entries
+    give their key as the value and their value as the detail, and (value, detail)
+    pairs such as task dates are split the same way. Rows are written as they are
+    produced, so memory use does not grow with the size of the graph.
+    """
+
+    ctx: AnalyzerContext
+    index: FileIndex
+    manifest: OutputManifest | None = None
+
+    def write(self) -> None:
+        """Write both tables to the tables output directory."""
+        table_format = self.ctx.args.table_format.lstrip(".")
+        dialect = TABLE_DIALECTS[table_format]
+        compression = ReportCompression(self.ctx.args.compression, self.ctx.args.compression_level)
+        table_dir = self.ctx.output_dir / OutputDir.TABLES
+        table_dir.mkdir(parents=True, exist_ok=True)
+        tables = (
+            (Table.FILES, FILE_COLUMNS, self.file_rows()),
+            (Table.FILE_DATA, DATA_COLUMNS, self.data_rows()),
+        )
+        for table, columns, rows in tables:
+            path = table_dir / f"{table}.{table_format}{compression.suffix}"
+            count = TableExport.write_table(compression.open(path, newline=""), dialect, columns, rows)
+            logger.info("Wrote %d rows to %s", count, path)
+            if self.manifest is not None:
+                entry = {
+                    "file": path.relative_to(self.ctx.output_dir).as_posix(),
+                    "hash": "",
+                    "count": count,
+                    "format": table_format,
+                    "compression": compression.method,
+                }
+                self.manifest.record(f"{OutputDir.TABLES}/{table}", entry, written=True)
+
+    @staticmethod
+    def write_table(
+        stream: Any, dialect: type[csv.Dialect], columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]
+    ) -> int:
+        """Write the header and rows of a table to a stream, close it and return the row count."""
+        count = 0
+        with stream as f:
+            writer = csv.writer(f, dialect)
+            writer.writerow(columns)
+            writerow = writer.writerow
+            for count, row in enumerate(rows, 1):  # noqa: B007
+                writerow(row)
+        return count
+
+    def file_rows(self) -> Iterator[tuple[Any, ...]]:
+        """Yield one row of metrics per file."""
+        for f in self.index:
+            info = f.info
+            node = f.node
+            namespace = info.namespace
+            yield (
+                str(f.path.file),
+                f.path.name,
+                f.path.file_type,
+                node.node_type,
+                info.size.size,
+                info.size.has_content,
+                info.timestamp.date_created,
+                info.timestamp.date_modified,
+                info.timestamp.time_existed,
+                info.timestamp.time_unmodified,
+                info.bullet.bullets,
+                info.bullet.empty_bullets,
+                info.bullet.chars,
+                info.bullet.char_per_bullet,
+                namespace.is_namespace,
+                f.path.name.count(Core.NS_SEP) + 1,
+                namespace.root,
+                node.has_backlinks,
+                node.backlinked,
+                node.backlinked_ns_only,
+                f.is_hls,
+            )
+
+    def data_rows(self) -> Iterator[tuple[Any, ...]]:
+        """Yield one row per (file, criterion, value) occurrence."""
+        for f in self.index:
+            yield from TableExport.file_data_rows(f)
+
+    @staticmethod
+    def file_data_rows(f: LogseqFile) -> Iterator[tuple[Any, ...]]:
+        """Yield the data occurrence rows of a file, criteria in sorted order."""
+        path = str(f.path.file)
+        name = f.path.name
+        for criterion, values in sorted(f.data.items()):
+            for position, (value, detail) in enumerate(TableExport.occurrences(values)):
+                yield path, name, criterion, position, value, detail
+
+    @staticmethod
+    def occurrences(values: Any) -> Iterator[tuple[Any, Any]]:
+        """Yield the (value, detail) pairs of a criterion; sets are sorted for stable output."""
+        if isinstance(values, Mapping):
+            yield from values.items()
+            return
+        if isinstance(values, (set, frozenset)):
+            values = sorted(values, key=str)
+        elif not isinstance(values, (list, tuple)):
+            values = (values,)
+        for value in values:
+            if isinstance(value, tuple) and len(value) == 2:
+                yield value
+            else:
+                yield value, None
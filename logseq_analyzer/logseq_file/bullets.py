@@ -12,7 +12,8 @@ from ..patterns import double_curly as double_curly_brackets_patterns
 from ..patterns import double_parentheses as double_parentheses_patterns
 from ..patterns import embedded_links as embedded_links_patterns
 from ..patterns import external_links as external_links_patterns
-from ..utils.enums import CritCode, CritContent, CritProp
+from ..patterns import tasks as task_patterns
+from ..utils.enums import CritCode, CritContent, CritProp, CritTask
 from ..utils.helpers import (
     extract_builtin_properties,
     iter_pattern_split,
@@ -120,6 +121,74 @@ class LogseqBullets:
             if value:
                 yield key, value
 
+    def iter_code_free_bullets(self) -> Generator[tuple[int, str]]:
+        """Yield the offset and text of each bullet with its code blocks and inline code removed.
+
+        Offsets match ``all_bullets``. A code block whose lines start with "-" is
+        split over several bullets, so a fence left open by one bullet masks the
+        following bullets up to its closing fence.
+        """
+        sub_code_blocks = code_patterns.ALL.sub
+        sub_inline_code = code_patterns.INLINE_CODE_BLOCK.sub
+        in_fence = False
+        for offset, bullet in enumerate(self.all_bullets):
+            text = bullet
+            if in_fence:
+                if (closing := text.find("```")) == -1:
+                    continue
+                text = text[closing + 3 :]
+                in_fence = False
+            if "`" in text:
+                text = sub_code_blocks("", text)
+                if (opening := text.find("```")) != -1:
+                    text = text[:opening]
+                    in_fence = True
+                text = sub_inline_code("", text)
+            yield offset, text
+
+    def extract_block_ids(self) -> Generator[tuple[str, Any]]:
+        """Extract `id::` block properties outside code as a mapping of UUID to bullet offset."""
+        search_block_id = content_patterns.BLOCK_ID.search
+        block_ids = {}
+        for offset, bullet in self.iter_code_free_bullets():
+            if "id::" in bullet and (match := search_block_id(bullet)):
+                block_ids.setdefault(match.group(1).lower(), offset)
+        if block_ids:
+            yield CritContent.BLOCK_IDS, block_ids
+
+    def extract_tasks(self) -> Generator[tuple[str, Any]]:
+        """Extract task markers, priorities and SCHEDULED/DEADLINE dates from the bullets outside code.
+
+        Dates are paired with the marker of their bullet ("" if it has none).
+        """
+        match_marker = task_patterns.MARKER.match
+        find_all_priorities = task_patterns.PRIORITY.findall
+        find_all_scheduled = task_patterns.SCHEDULED.findall
+        find_all_deadlines = task_patterns.DEADLINE.findall
+        markers = []
+        priorities = []
+        scheduled = []
+        deadlines = []
+        for _, bullet in self.iter_code_free_bullets():
+            marker = ""
+            if match := match_marker(bullet):
+                marker = match.group(1)
+                markers.append(marker)
+            if "[#" in bullet:
+                priorities.extend(p.upper() for p in find_all_priorities(bullet))
+            if "SCHEDULED:" in bullet:
+                scheduled.extend((date, marker) for date in find_all_scheduled(bullet))
+            if "DEADLINE:" in bullet:
+                deadlines.extend((date, marker) for date in find_all_deadlines(bullet))
+        for key, value in {
+            CritTask.DEADLINES: deadlines,
+            CritTask.MARKERS: markers,
+            CritTask.PRIORITIES: priorities,
+            CritTask.SCHEDULED: scheduled,
+        }.items():
+            if value:
+                yield key, value
+
     def extract_patterns(self) -> Generator[tuple[str, Any]]:
         """Process patterns in the content."""
         _content = self.content
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from collections.abc import Generator
     from pathlib import Path
 
+    from ..config.context import AnalyzerContext
+
 BACKLINK_CRITERIA: frozenset[str] = frozenset(
     {
         CritProp.VALUES,
@@ -99,18 +101,18 @@ class LogseqFile:
             return self.path.name < other
         return NotImplemented
 
-    def process(self) -> None:
+    def process(self, ctx: AnalyzerContext) -> None:
         """Process the Logseq file to extract metadata and content."""
-        self.init_file_data()
+        self.init_file_data(ctx)
         self.process_content_data()
 
-    def init_file_data(self) -> None:
+    def init_file_data(self, ctx: AnalyzerContext) -> None:
         """Extract metadata from a file."""
-        self.path.process()
+        self.path.process(ctx)
         self.bullets = LogseqBullets(self.path.read_text())
         self.bullets.process()
         self.info = LogseqFileInfo(
-            timestamp=self.path.get_timestamp_info(),
+            timestamp=self.path.get_timestamp_info(ctx.now_ts),
             size=self.path.get_size_info(),
             namespace=self.path.get_namespace_info(),
             bullet=self.bullets.get_bullet_info(),
@@ -131,6 +133,8 @@ class LogseqFile:
         yield from self.bullets.extract_primary_raw_data()
         yield from self.bullets.extract_aliases_and_propvalues()
         yield from self.bullets.extract_properties()
+        yield from self.bullets.extract_block_ids()
+        yield from self.bullets.extract_tasks()
         yield from self.bullets.extract_patterns()
 
     def extract_data(self) -> None:
@@ -4,19 +4,18 @@ import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
-from ..config.graph_config import ConfigEdns, get_ns_sep
 from ..utils.date_utilities import DateUtilities
-from ..utils.enums import Core, FileType, TargetDir
+from ..utils.enums import Core, FileType
 from ..utils.helpers import format_bytes
 from .info import JournalFormats, NamespaceInfo, SizeInfo, TimestampInfo
 
 if TYPE_CHECKING:
     from os import stat_result
 
-    from ..io.filesystem import LogseqAnalyzerDirs
+    from ..config.context import AnalyzerContext
 
 logger = logging.getLogger(__name__)
 
@@ -25,47 +24,32 @@ logger = logging.getLogger(__name__)
 class LogseqFileName:
     """LogseqFileName class."""
 
-    journal_format: ClassVar[JournalFormats]
-    ns_file_sep: ClassVar[str]
-    journal_dir: ClassVar[str]
-
-    @classmethod
-    def configure(
-        cls, analyzer_dirs: LogseqAnalyzerDirs, journal_formats: JournalFormats, config_edns: ConfigEdns
-    ) -> None:
-        """Configure the LogseqPath class with necessary settings."""
-        cls.journal_format = journal_formats
-        cls.ns_file_sep = get_ns_sep(config_edns.config)
-        cls.journal_dir = analyzer_dirs.target_dirs[TargetDir.JOURNAL]
-
     @staticmethod
-    def process(file: Path) -> str:
+    def process(file: Path, ctx: AnalyzerContext) -> str:
         """Process the Logseq filename based on its parent directory."""
-        _ns_file_sep = LogseqFileName.ns_file_sep
+        _ns_file_sep = ctx.ns_file_sep
         name = file.stem.strip(_ns_file_sep)
 
-        if file.parent.name == LogseqFileName.journal_dir:
-            return LogseqFileName.process_journal_key(name)
+        if file.parent.name == ctx.journal_dir:
+            return LogseqFileName.process_journal_key(name, ctx.journal_formats)
         return LogseqFileName.process_non_journal_key(name, _ns_file_sep)
 
     @staticmethod
-    def process_journal_key(name: str) -> str:
+    def process_journal_key(name: str, journal_formats: JournalFormats) -> str:
         """Process the journal key to create a page title."""
-        _file_format = LogseqFileName.journal_format.file
-        _page_format = LogseqFileName.journal_format.page
-        _page_title_format = LogseqFileName.journal_format.page_title
+        _file_format = journal_formats.file
+        _page_format = journal_formats.page
+        _page_title_format = journal_formats.page_title
 
-        try:
-            date_obj = datetime.strptime(name, _file_format).replace(tzinfo=UTC)
-            page_title = date_obj.strftime(_page_format)
-            if Core.DATE_ORDINAL_SUFFIX in _page_title_format:
-                day_number = str(date_obj.day)
-                day_with_ordinal = DateUtilities.append_ordinal_to_day(day_number)
-                page_title.replace(day_number, day_with_ordinal, 1)
-            return page_title.replace("'", "")
-        except ValueError as e:
-            logger.warning("Failed to parse date, key '%s', fmt `%s`: %s", name, _page_format, e)
+        if (date_obj := DateUtilities.parse_date(name, _file_format)) is None:
+            logger.warning("Failed to parse date, key '%s', fmt `%s`", name, _file_format)
             return name
+        page_title = date_obj.strftime(_page_format)
+        if Core.DATE_ORDINAL_SUFFIX in _page_title_format:
+            day_number = str(date_obj.day)
+            day_with_ordinal = DateUtilities.append_ordinal_to_day(day_number)
+            page_title.replace(day_number, day_with_ordinal, 1)
+        return page_title.replace("'", "")
 
     @staticmethod
     def process_non_journal_key(name: str, ns_file_sep: str, ns_sep: str = Core.NS_SEP) -> str:
@@ -84,11 +68,6 @@ class LogseqPath:
     stat: stat_result = field(init=False)
     uri: str = ""
 
-    now_ts: ClassVar[float] = datetime.now(tz=UTC).timestamp()
-    graph_path: ClassVar[Path]
-    result_map: ClassVar[dict]
-    target_dirs: ClassVar[dict]
-
     def __post_init__(self) -> None:
         """Initialize the LogseqPath object."""
         if not isinstance(self.file, Path):
@@ -97,28 +76,15 @@ class LogseqPath:
         self.stat = self.file.stat()
         self.uri: str = self.file.as_uri()
 
-    @classmethod
-    def configure(cls, analyzer_dirs: LogseqAnalyzerDirs) -> None:
-        """Configure the LogseqPath class with necessary settings."""
-        cls.graph_path = analyzer_dirs.graph_dirs.graph_dir.path
-        cls.target_dirs = analyzer_dirs.target_dirs
-        cls.result_map = {
-            cls.target_dirs[TargetDir.ASSET]: (FileType.ASSET, FileType.SUB_ASSET),
-            cls.target_dirs[TargetDir.DRAW]: (FileType.DRAW, FileType.SUB_DRAW),
-            cls.target_dirs[TargetDir.JOURNAL]: (FileType.JOURNAL, FileType.SUB_JOURNAL),
-            cls.target_dirs[TargetDir.PAGE]: (FileType.PAGE, FileType.SUB_PAGE),
-            cls.target_dirs[TargetDir.WHITEBOARD]: (FileType.WHITEBOARD, FileType.SUB_WHITEBOARD),
-        }
-
-    def process(self) -> None:
+    def process(self, ctx: AnalyzerContext) -> None:
         """Process the Logseq file path to gather statistics."""
-        self.name = LogseqFileName.process(self.file)
-        self.file_type = self.evaluate_file_type()
-        self.logseq_url = self.set_logseq_url()
+        self.name = LogseqFileName.process(self.file, ctx)
+        self.file_type = self.evaluate_file_type(ctx.file_type_map)
+        self.logseq_url = self.set_logseq_url(ctx.graph_dir)
 
-    def evaluate_file_type(self) -> str:
+    def evaluate_file_type(self, file_type_map: dict[str, tuple[str, str]]) -> str:
         """Determine the file type based on the directory structure."""
-        _result_map = LogseqPath.result_map
+        _result_map = file_type_map
         _parent = self.file.parent.name
         _parts = self.file.parts
 
@@ -133,9 +99,9 @@ class LogseqPath:
 
         return FileType.OTHER
 
-    def set_logseq_url(self) -> str:
+    def set_logseq_url(self, graph_path: Path) -> str:
         """Set the Logseq URL."""
-        _graph_path = LogseqPath.graph_path
+        _graph_path = graph_path
         _uri = self.uri
 
         uri_path = Path(_uri)
@@ -164,10 +130,10 @@ class LogseqPath:
             logger.warning("Failed to decode file %s with utf-8 encoding.", self.file)
             return ""
 
-    def get_timestamp_info(self) -> TimestampInfo:
+    def get_timestamp_info(self, now_ts: float) -> TimestampInfo:
         """Get the timestamps for the file."""
-        _now = LogseqPath.now_ts
-        _created_time = self.stat.st_birthtime
+        _now = now_ts
+        _created_time = getattr(self.stat, "st_birthtime", self.stat.st_ctime)
         _modified_time = self.stat.st_mtime
         return TimestampInfo(
             time_existed=_now - _created_time,
@@ -66,6 +66,25 @@ PROPERTY_VALUE = re.compile(
     re.MULTILINE | re.IGNORECASE | re.VERBOSE,
 )
 
+BLOCK_ID = re.compile(
+    r"""
+    ^                   # Start of line
+    (?!\s*-\s)          # Negative lookahead: not a bullet
+    \s*?                # Optional whitespace
+    id::                # Literal id::
+    \s*                 # Optional whitespace
+    (                   # Capture group: the block UUID
+    [0-9a-f]{8}-        # 8 hex digits followed by hyphen
+    [0-9a-f]{4}-        # 4 hex digits followed by hyphen
+    [0-9a-f]{4}-        # 4 hex digits followed by hyphen
+    [0-9a-f]{4}-        # 4 hex digits followed by hyphen
+    [0-9a-f]{12}        # 12 hex digits
+    )
+    \s*$                # Optional whitespace, end of line
+    """,
+    re.MULTILINE | re.IGNORECASE | re.VERBOSE,
+)
+
 ASSET = re.compile(
     r"""
     assets/         # assets/ literal string
@@ -115,6 +134,19 @@ DYNAMIC_VARIABLE = re.compile(
     re.IGNORECASE | re.VERBOSE,
 )
 
+MASKED_PLACEHOLDER = re.compile(
+    r"""
+    __[a-z_]+_          # Double underscore, criteria prefix, underscore
+    [0-9a-f]{8}-        # UUID4 written by LogseqFile.mask_blocks
+    [0-9a-f]{4}-
+    [0-9a-f]{4}-
+    [0-9a-f]{4}-
+    [0-9a-f]{12}
+    __                  # Closing double underscore
+    """,
+    re.VERBOSE,
+)
+
 ANY_LINK = re.compile(
     r"""
     \b                                          # word boundary
@@ -0,0 +1,47 @@
+"""Task patterns for Logseq."""
+
+import re
+
+MARKER = re.compile(
+    r"""
+    \A                  # Start of the bullet
+    (NOW|LATER|TODO|DOING|DONE|WAITING|WAIT|CANCELED|CANCELLED|IN-PROGRESS|STARTED)
+    (?=\s|\Z)           # Followed by whitespace or end of bullet
+    """,
+    re.VERBOSE,
+)
+
+PRIORITY = re.compile(
+    r"""
+    \[\#                # Opening bracket and hash
+    ([A-C])             # Capture group: priority letter
+    \]                  # Closing bracket
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+SCHEDULED = re.compile(
+    r"""
+    ^\s*                # Start of line, optional whitespace
+    SCHEDULED:\s*       # Literal SCHEDULED: and optional whitespace
+    <                   # Opening angle bracket
+    (\d{4}-\d{2}-\d{2}) # Capture group: ISO date
+    [^>]*               # Optional weekday, time and repeater
+    >                   # Closing angle bracket
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+DEADLINE = re.compile(
+    r"""
+    ^\s*                # Start of line, optional whitespace
+    DEADLINE:\s*        # Literal DEADLINE: and optional whitespace
+    <                   # Opening angle bracket
+    (\d{4}-\d{2}-\d{2}) # Capture group: ISO date
+    [^>]*               # Optional weekday, time and repeater
+    >                   # Closing angle bracket
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+CLOSED_MARKERS: frozenset[str] = frozenset({"DONE", "CANCELED", "CANCELLED"})
@@ -0,0 +1,56 @@
+"""Command line search over the full-text index stored in the graph cache."""
+
+import argparse
+import shelve
+import sys
+import time
+from pathlib import Path
+
+from .analysis.index import FileIndex
+from .io.cache import CacheKey
+from .io.filesystem import graph_cache_file
+
+SNIPPET_LENGTH = 100
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a query against the cached full-text index and print the matching blocks."""
+    parser = argparse.ArgumentParser(
+        description="Search the Logseq Analyzer full-text index",
+        epilog='Terms are ANDed; use OR between alternatives, "quotes" for phrases and -term or NOT term to exclude.',
+    )
+    parser.add_argument("query", help="search query")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-g", "--graph-folder", help="path to the analyzed Logseq graph, to find its cache file")
+    source.add_argument("--cache", help="path to the analyzer cache file")
+    parser.add_argument("--limit", type=int, default=50, help="maximum number of results to print")
+    args = parser.parse_args(argv)
+    if args.cache is None:
+        args.cache = str(graph_cache_file(Path(args.graph_folder)))
+
+    if not Path(args.cache).exists():
+        print(f"Cache file not found: {args.cache}", file=sys.stderr)
+        return 1
+
+    with shelve.open(args.cache, flag="r") as cache:
+        if CacheKey.TEXT_INDEX not in cache:
+            print("No full-text index in cache; run the analyzer with --text-index first.", file=sys.stderr)
+            return 1
+        text_index = cache[CacheKey.TEXT_INDEX]
+        index = cache[CacheKey.INDEX] if CacheKey.INDEX in cache else FileIndex()
+
+    start = time.perf_counter()
+    results = text_index.search(args.query, index)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for name, offset in results[: args.limit]:
+        snippet = ""
+        if files := index[name]:
+            snippet = " ".join(files[0].bullets.all_bullets[offset].split())[:SNIPPET_LENGTH]
+        print(f"{name}\t#{offset}\t{snippet}")
+    print(f"{len(results)} blocks in {elapsed:.2f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Aho-Corasick automaton for matching many patterns in a single pass over text."""
+
+from collections import deque
+from dataclasses import InitVar, dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+
+@dataclass(slots=True)
+class AhoCorasick:
+    """Multi-pattern substring matcher.
+
+    The automaton is built once over all patterns; scanning a text is then linear in
+    the length of the text plus the number of matches, regardless of the pattern count.
+    Empty patterns are ignored.
+    """
+
+    patterns: InitVar[Iterable[str]]
+    _goto: list[dict[str, int]] = field(default_factory=lambda: [{}])
+    _fail: list[int] = field(default_factory=lambda: [0])
+    _output: list[tuple[str, ...]] = field(default_factory=lambda: [()])
+
+    def __post_init__(self, patterns: Iterable[str]) -> None:
+        """Build the automaton from the given patterns."""
+        for pattern in patterns:
+            self.add(pattern)
+        self.build()
+
+    def __len__(self) -> int:
+        """Return the number of states in the automaton."""
+        return len(self._goto)
+
+    def add(self, pattern: str) -> None:
+        """Add a pattern to the trie. Call `build` afterwards to refresh failure links."""
+        if not pattern:
+            return
+        goto = self._goto
+        node = 0
+        for char in pattern:
+            next_node = goto[node].get(char)
+            if next_node is None:
+                next_node = len(goto)
+                goto[node][char] = next_node
+                goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        if pattern not in self._output[node]:
+            self._output[node] += (pattern,)
+
+    def build(self) -> None:
+        """Compute failure links and merged outputs with a breadth-first traversal."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                if own := output[fail[child]]:
+                    output[child] += tuple(p for p in own if p not in output[child])
+
+    def iter_matches(self, text: str) -> Generator[tuple[int, str]]:
+        """Yield (start index, pattern) for every pattern occurrence in the text."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern in output[node]:
+                yield end - len(pattern), pattern
+
+    def find_all(self, text: str) -> set[str]:
+        """Return the set of patterns that occur in the text."""
+        return {pattern for _, pattern in self.iter_matches(text)}
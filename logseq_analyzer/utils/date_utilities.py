@@ -1,9 +1,11 @@
 """DateUtilities class to handle date-related operations."""
 
+import calendar
 import logging
 import re
 from datetime import UTC, datetime, timedelta
 from enum import IntEnum, StrEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -64,6 +66,32 @@ DATETIME_TOKEN_MAP: dict[str, str] = {
     "ZZ": "%z",
 }
 
+_MONTH_NAMES: dict[str, int] = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+_MONTH_ABBRS: dict[str, int] = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+_ORDINAL_SUFFIX = "(?:" + "|".join(sorted(DATE_ORDINAL_SUFFIXES)) + ")?"
+STRFTIME_DIRECTIVE_REGEX: dict[str, str] = {
+    "Y": r"(?P<Y>\d{4})",
+    "y": r"(?P<y>\d{2})",
+    "B": "(?P<B>" + "|".join(sorted(_MONTH_NAMES, key=len, reverse=True)) + ")",
+    "b": "(?P<b>" + "|".join(sorted(_MONTH_ABBRS, key=len, reverse=True)) + ")",
+    "m": r"(?P<m>\d{1,2})",
+    "d": r"(?P<d>\d{1,2})" + _ORDINAL_SUFFIX,
+    "j": r"(?P<j>\d{1,3})",
+    "A": "(?:" + "|".join(name for name in calendar.day_name) + ")",
+    "a": "(?:" + "|".join(name for name in calendar.day_abbr) + ")",
+    "u": "[1-7]",
+    "H": r"(?P<H>\d{1,2})",
+    "I": r"(?P<I>\d{1,2})",
+    "M": r"(?P<M>\d{1,2})",
+    "S": r"(?P<S>\d{1,2})",
+    "f": r"\d{1,6}",
+    "p": "(?P<p>am|pm)",
+    "z": r"(?:[+-]\d{4}|z)",
+    "%": "%",
+}
+STRFTIME_DIRECTIVE: re.Pattern = re.compile(r"%#?(.)")
+DATE_PARSE_CACHE_SIZE = 8192
+
 DY = Day
 DS = DateStat
 
@@ -76,6 +104,11 @@ class DateUtilities:
         """Return the date of the next day."""
         return date_obj + timedelta(days=1)
 
+    @staticmethod
+    def from_ordinal(day: int) -> datetime:
+        """Return the UTC midnight datetime of a proleptic Gregorian ordinal day."""
+        return datetime.fromordinal(day).replace(tzinfo=UTC)
+
     @staticmethod
     def range(stats: dict[str, datetime]) -> dict[str, float | None]:
         """Compute the range between two dates in days, weeks, months, and years."""
@@ -108,15 +141,87 @@ class DateUtilities:
 
     @staticmethod
     def journals_to_datetime(keys: Iterable[str], py_page_format: str = "") -> Iterator[datetime]:
-        """Convert journal keys from strings to datetime objects."""
+        """Convert journal keys from strings to datetime objects, skipping non-dates."""
+        parse_date = DateUtilities.parse_date
         for key in keys:
+            if (date_obj := parse_date(key, py_page_format)) is not None:
+                yield date_obj
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def compile_date_pattern(py_format: str) -> re.Pattern | None:
+        """Compile a Python date format into an anchored regex with named groups.
+
+        Returns None if the format uses a directive without a regex translation.
+        """
+        parts = []
+        seen = set()
+        position = 0
+        for match in STRFTIME_DIRECTIVE.finditer(py_format):
+            parts.append(re.escape(py_format[position : match.start()]))
+            directive = match.group(1)
+            if (regex := STRFTIME_DIRECTIVE_REGEX.get(directive)) is None:
+                return None
+            if directive in seen and regex.startswith("(?P<"):
+                regex = f"(?P={directive})"
+            seen.add(directive)
+            parts.append(regex)
+            position = match.end()
+        parts.append(re.escape(py_format[position:]))
+        return re.compile("".join(parts), re.IGNORECASE)
+
+    @staticmethod
+    @lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+    def parse_date(key: str, py_format: str) -> datetime | None:
+        """Parse a date string in the given Python date format, or return None if it is not a date."""
+        if (pattern := DateUtilities.compile_date_pattern(py_format)) is None:
             try:
-                key_to_parse = key
-                for ordinal in DATE_ORDINAL_SUFFIXES:
-                    key_to_parse = key_to_parse.replace(ordinal, "")
-                yield datetime.strptime(key_to_parse, py_page_format.replace("#", "")).replace(tzinfo=UTC)
+                return datetime.strptime(key, py_format.replace("#", "")).replace(tzinfo=UTC)
             except ValueError:
-                pass
+                return None
+
+        if not (match := pattern.fullmatch(key)):
+            return None
+
+        groups = match.groupdict()
+        year = DateUtilities.year_from_groups(groups)
+        month = DateUtilities.month_from_groups(groups)
+        hour = int(groups.get("H") or 0)
+        if twelve_hour := groups.get("I"):
+            hour = int(twelve_hour) % 12 + (12 if (groups.get("p") or "").lower() == "pm" else 0)
+
+        try:
+            if (day_of_year := groups.get("j")) and not groups.get("d"):
+                date_obj = datetime(year, 1, 1, tzinfo=UTC) + timedelta(days=int(day_of_year) - 1)
+                if date_obj.year != year:
+                    return None
+                month, day = date_obj.month, date_obj.day
+            else:
+                day = int(groups.get("d") or 1)
+            return datetime(year, month, day, hour, int(groups.get("M") or 0), int(groups.get("S") or 0), tzinfo=UTC)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def year_from_groups(groups: dict[str, str | None]) -> int:
+        """Return the year captured by a compiled date pattern, defaulting to 1900 like strptime."""
+        if year := groups.get("Y"):
+            return int(year)
+        if year := groups.get("y"):
+            short_year = int(year)
+            return short_year + (1900 if short_year >= 69 else 2000)
+        return 1900
+
+    @staticmethod
+    def month_from_groups(groups: dict[str, str | None]) -> int:
+        """Return the month captured by a compiled date pattern, defaulting to January."""
+        if month := groups.get("m"):
+            return int(month)
+        if month := groups.get("B"):
+            return _MONTH_NAMES[month.lower()]
+        if month := groups.get("b"):
+            return _MONTH_ABBRS[month.lower()]
+        return 1
 
     @staticmethod
     def compile_datetime_tokens() -> re.Pattern:
@@ -3,6 +3,15 @@
 from enum import StrEnum
 
 
+class Compression(StrEnum):
+    """Report compression methods for the Logseq Analyzer."""
+
+    GZIP = "gzip"
+    LZMA = "lzma"
+    NONE = ""
+    ZSTD = "zstd"
+
+
 class ConfigEdnReport(StrEnum):
     """Configuration EDN reports for the Logseq Analyzer."""
 
@@ -16,9 +25,14 @@ class ConfigEdnReport(StrEnum):
 class Constant(StrEnum):
     """Constants used in the Logseq Analyzer."""
 
-    CACHE_FILE = "logseq-analyzer-cache"
+    CACHE_DIR = "logseq-analyzer-caches"
     LOG_FILE = "logseq_analyzer.log"
     OUTPUT_DIR = "logseq-analyzer-output"
+    OUTPUT_MANIFEST = "logseq-analyzer-manifest.json"
+    PROFILE_FILE = "logseq-analyzer-profile.json"
+    PSTATS_FILE = "logseq-analyzer.pstats"
+    PSTATS_SUMMARY_FILE = "logseq-analyzer-pstats.txt"
+    REPORT_BUNDLE = "logseq-analyzer-reports"
     TO_DELETE_ASSETS_DIR = "to-delete/assets"
     TO_DELETE_BAK_DIR = "to-delete/bak"
     TO_DELETE_DIR = "to-delete"
@@ -43,6 +57,7 @@ class CritContent(StrEnum):
     ALIASES = "content_aliases"
     ANY_LINKS = "content_any_link"
     ASSETS = "content_asset"
+    BLOCK_IDS = "content_block_ids"
     BLOCKQUOTES = "content_blockquote"
     DRAW = "content_draw"
     DYNAMIC_VAR = "content_dynamic_variable"
@@ -133,6 +148,15 @@ class CritProp(StrEnum):
     VALUES = "property_values"
 
 
+class CritTask(StrEnum):
+    """Criteria for tasks in Logseq."""
+
+    DEADLINES = "task_deadlines"
+    MARKERS = "task_markers"
+    PRIORITIES = "task_priorities"
+    SCHEDULED = "task_scheduled"
+
+
 class DirsAnalyzer(StrEnum):
     """Directories used in the Logseq Analyzer."""
 
@@ -141,6 +165,7 @@ class DirsAnalyzer(StrEnum):
     DELETE = "delete_dirs"
     TARGET = "target_dirs"
     OUTPUT = "output_dir"
+    CACHE = "cache_file"
 
 
 class DirsDelete(StrEnum):
@@ -196,10 +221,14 @@ class FileType(StrEnum):
 class Format(StrEnum):
     """File formats used in the Logseq Analyzer."""
 
+    CSV = "csv"
     HTML = "html"
     JSON = "json"
+    JSONL = "jsonl"
     MD = "md"
     ORG = "org"
+    SQLITE = "sqlite"
+    TSV = "tsv"
     TXT = "txt"
 
 
@@ -240,13 +269,26 @@ class Output(StrEnum):
     ARGUMENTS = "arguments"
     ASSETS_BACKLINKED = "assets_backlinked"
     ASSETS_NOT_BACKLINKED = "assets_not_backlinked"
+    BLOCK_IDS_DUPLICATE = "block_ids_duplicate"
+    BLOCK_REFS_BROKEN = "block_refs_broken"
+    BLOCK_REFS_CROSS_PAGE = "block_refs_cross_page"
+    BLOCK_REFS_MOST_REFERENCED = "block_refs_most_referenced"
+    BLOCK_REFS_SUMMARY = "block_refs_summary"
+    DUPLICATES_EXACT = "duplicates_exact"
+    DUPLICATES_NEAR = "duplicates_near"
+    DUPLICATES_SUMMARY = "duplicates_summary"
     GRAPH_ALL_DANGLING_LINKS = "graph_all_dangling_links"
     GRAPH_ALL_LINKED_REFERENCES = "graph_all_linked_references"
     GRAPH_BULLETS = "graph_content_bullets"
     GRAPH_CONTENT = "graph_content"
+    GRAPH_COMPONENTS = "graph_components"
     GRAPH_CONTENT_DATA = "graph_content_data"
     GRAPH_DANGLING_LINKS = "graph_dangling_links"
     GRAPH_DATA = "graph_data"
+    GRAPH_DEGREE_DISTRIBUTION = "graph_degree_distribution"
+    GRAPH_HUBS = "graph_hubs"
+    GRAPH_METRICS_SUMMARY = "graph_metrics_summary"
+    GRAPH_PAGERANK = "graph_pagerank"
     GRAPH_UNIQUE_ALIASES = "graph_unique_aliases"
     GRAPH_UNIQUE_LINKED_REFERENCES = "graph_unique_linked_references"
     GRAPH_UNIQUE_LINKED_REFERENCES_NS = "graph_unique_linked_references_ns"
@@ -273,13 +315,26 @@ class Output(StrEnum):
     NS_HIERARCHY = "ns_hierarchy"
     NS_PARTS = "ns_parts"
     NS_QUERIES = "ns_queries"
+    NS_ROLLUPS = "ns_rollups"
     NS_UNIQUE_PARTS = "ns_unique_parts"
     NS_UNIQUE_PER_LEVEL = "ns_unique_per_level"
+    PATTERN_CRITERIA_TIMINGS = "pattern_criteria_timings"
+    PATTERN_TIMINGS = "pattern_timings"
+    TASKS_DEADLINE_LOAD = "tasks_deadline_load"
+    TASKS_MARKERS = "tasks_markers"
+    TASKS_OVERDUE = "tasks_overdue"
+    TASKS_PRIORITIES = "tasks_priorities"
+    TASKS_SCHEDULED_LOAD = "tasks_scheduled_load"
+    TASKS_SCHEDULED_PAST = "tasks_scheduled_past"
+    TASKS_SUMMARY = "tasks_summary"
+    UNLINKED_REFERENCES = "unlinked_references"
 
 
 class OutputDir(StrEnum):
     """Output directories for the Logseq Analyzer."""
 
+    BLOCK_REFS = "block_refs"
+    DUPLICATES = "duplicates"
     GRAPH = "graph"
     INDEX = "index"
     JOURNALS = "journals"
@@ -288,12 +343,23 @@ class OutputDir(StrEnum):
     MOVED_FILES_ASSETS = "moved_files/assets"
     MOVED_FILES_HLS_ASSETS = "moved_files/hls_assets"
     NAMESPACES = "namespaces"
+    PROFILE = "_profile"
     SUMMARY_CONTENT = "summary_content"
     SUMMARY_CONTENT_INFO = "summary_content/info_reports"
     SUMMARY_FILES_FILE = "summary_files/file_types"
     SUMMARY_FILES_GENERAL = "summary_files/general"
     SUMMARY_FILES_NODE = "summary_files/node_types"
     SUMMARY_FILES_EXTENSIONS = "summary_files/extensions"
+    TABLES = "tables"
+    TASKS = "tasks"
+    UNLINKED_REFERENCES = "unlinked_references"
+
+
+class Table(StrEnum):
+    """Tabular export files for the Logseq Analyzer."""
+
+    FILE_DATA = "file_data"
+    FILES = "files"
 
 
 class TargetDir(StrEnum):
@@ -139,10 +139,11 @@ def process_aliases(aliases: str) -> Generator[str]:
 
 
 def sort_dict_by_value(data: dict, value: str = "", *, reverse: bool = False) -> dict:
-    """Sort a dictionary by its values."""
+    """Sort a dictionary by its values; equal values keep the order of their keys."""
+    items = sorted(data.items(), key=lambda item: str(item[0]))
     if value:
-        return dict(sorted(data.items(), key=lambda item: item[1][value], reverse=reverse))
-    return dict(sorted(data.items(), key=lambda item: item[1], reverse=reverse))
+        return dict(sorted(items, key=lambda item: item[1][value], reverse=reverse))
+    return dict(sorted(items, key=lambda item: item[1], reverse=reverse))
 
 
 def yield_attrs(obj: object) -> Generator[tuple[str, Any]]:
@@ -273,8 +274,8 @@ def format_bytes(size_bytes: int, system: str = SizeUnit.SI, precision: int = 2)
 
 
 def yield_asset_paths(unlinked_assets: set[LogseqFile]) -> Generator[Path]:
-    """Yield the file paths of unlinked assets."""
-    for asset in unlinked_assets:
+    """Yield the file paths of unlinked assets, sorted by path."""
+    for asset in sorted(unlinked_assets, key=lambda asset: asset.path.file):
         yield asset.path.file
 
 
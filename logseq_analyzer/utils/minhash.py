@@ -0,0 +1,151 @@
+"""MinHash signatures with LSH banding for near-duplicate detection."""
+
+from array import array
+from dataclasses import dataclass, field
+from functools import cache
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_VALUE_MASK = (1 << 32) - 1
+_EMPTY = _VALUE_MASK
+# Shifts that fold every bit of a 32-bit signature slot into its lowest bit.
+_FOLD_SHIFTS = (16, 8, 4, 2, 1)
+
+
+def equal_slots(packed_a: int, packed_b: int, num_perm: int) -> int:
+    """Count the equal 32-bit slots of two packed signatures.
+
+    The signatures are XORed, the bits of each slot are folded into its lowest
+    bit, and the slots with a bit left set are the ones that differ.
+    """
+    diff = packed_a ^ packed_b
+    for shift in _FOLD_SHIFTS:
+        diff |= diff >> shift
+    return num_perm - (diff & _slot_bits(num_perm)).bit_count()
+
+
+@cache
+def _slot_bits(num_perm: int) -> int:
+    """Return the mask of the lowest bit of every slot of a packed signature."""
+    return sum(1 << (32 * slot) for slot in range(num_perm))
+
+
+@dataclass(slots=True)
+class MinHashLSH:
+    """Near-duplicate finder over token sequences.
+
+    Signatures use one-permutation MinHash: each shingle hash is sent to one of
+    `num_perm` bins and every bin keeps its minimum, with empty bins filled from
+    the next non-empty bin. Signatures are stored as compact 32-bit arrays.
+    Candidates are items sharing all rows of at least one LSH band; each band is
+    bucketed separately so only one band's buckets are held in memory at a time.
+    Pairs of a bucket not yet in the same cluster are verified against the
+    threshold. Buckets with more than `max_bucket` items are skipped and counted
+    in `oversized_buckets`, which bounds the comparisons per band to
+    `max_bucket` per item; their items are still clustered through other bands.
+    Shingles are hashed with BLAKE2b, so signatures are stable across runs.
+    """
+
+    num_perm: int = 32
+    bands: int = 8
+    threshold: float = 0.8
+    shingle_size: int = 3
+    max_bucket: int = 256
+    signatures: list[array] = field(default_factory=list)
+    oversized_buckets: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        """Validate the signature layout."""
+        if self.num_perm & (self.num_perm - 1) or self.num_perm % self.bands:
+            msg = "num_perm must be a power of two divisible by bands"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        """Return the number of stored signatures."""
+        return len(self.signatures)
+
+    def add(self, tokens: Sequence[str]) -> int:
+        """Store the signature of a token sequence and return its item id."""
+        self.signatures.append(self.signature(tokens))
+        return len(self.signatures) - 1
+
+    def signature(self, tokens: Sequence[str]) -> array:
+        """Compute the one-permutation MinHash signature of the token shingles."""
+        num_perm = self.num_perm
+        bin_mask = num_perm - 1
+        shift = num_perm.bit_length() - 1
+        size = self.shingle_size
+        shingles = {" ".join(tokens[i : i + size]) for i in range(max(len(tokens) - size + 1, 1))}
+        values = [_EMPTY] * num_perm
+        from_bytes = int.from_bytes
+        for shingle in shingles:
+            h = from_bytes(blake2b(shingle.encode(), digest_size=8).digest())
+            slot = h & bin_mask
+            values[slot] = min(values[slot], (h >> shift) & _VALUE_MASK)
+
+        if _EMPTY in values and len(set(values)) > 1:
+            for slot in range(num_perm):
+                distance = 1
+                while values[slot] == _EMPTY:
+                    donor = values[(slot + distance) % num_perm]
+                    if donor != _EMPTY:
+                        values[slot] = (donor + distance) & _VALUE_MASK
+                    distance += 1
+        return array("I", values)
+
+    def similarity(self, a: int, b: int) -> float:
+        """Estimate the Jaccard similarity of two stored items."""
+        packed = MinHashLSH.packed
+        return equal_slots(packed(self.signatures[a]), packed(self.signatures[b]), self.num_perm) / self.num_perm
+
+    @staticmethod
+    def packed(signature: array) -> int:
+        """Pack a signature into one integer, 32 bits per slot with the first slot lowest."""
+        return int.from_bytes(b"".join(value.to_bytes(4, "little") for value in signature), "little")
+
+    def clusters(self) -> list[list[int]]:
+        """Group stored items whose estimated similarity reaches the threshold.
+
+        Returns:
+            list[list[int]]: Item ids per cluster, only for clusters with more than one item.
+
+        """
+        parent = list(range(len(self.signatures)))
+
+        def find(x: int) -> int:
+            """Find the root of an item with path halving."""
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        num_perm = self.num_perm
+        rows = num_perm // self.bands
+        min_equal = self.threshold * num_perm
+        max_bucket = self.max_bucket
+        packed = [MinHashLSH.packed(sig) for sig in self.signatures]
+        self.oversized_buckets = 0
+        for band in range(self.bands):
+            start = band * rows
+            buckets: dict[bytes, list[int]] = {}
+            for item, sig in enumerate(self.signatures):
+                buckets.setdefault(sig[start : start + rows].tobytes(), []).append(item)
+            for members in buckets.values():
+                if len(members) > max_bucket:
+                    self.oversized_buckets += 1
+                    continue
+                for i, item_a in enumerate(members[:-1]):
+                    root_a = find(item_a)
+                    packed_a = packed[item_a]
+                    for item_b in members[i + 1 :]:
+                        root_b = find(item_b)
+                        if root_b != root_a and equal_slots(packed_a, packed[item_b], num_perm) >= min_equal:
+                            parent[root_b] = root_a
+
+        groups: dict[int, list[int]] = {}
+        for item in range(len(parent)):
+            groups.setdefault(find(item), []).append(item)
+        return [group for group in groups.values() if len(group) > 1]
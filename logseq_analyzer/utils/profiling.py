@@ -0,0 +1,615 @@
+"""Lightweight stage timing, memory, call and regex profiling for the Logseq Analyzer pipeline."""
+
+import cProfile
+import json
+import logging
+import pstats
+import re
+import sys
+import tracemalloc
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from statistics import quantiles
+from threading import Lock
+from time import perf_counter
+from types import FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from ..logseq_file import bullets, file
+from ..patterns import adv_cmd, code, content, double_curly, double_parentheses, embedded_links, external_links, tasks
+from .enums import Constant, Output
+from .helpers import SizeUnit, format_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+NULL_TIMER = nullcontext()
+# Allocation sites of the import system and of tracemalloc itself are left out of the top sites.
+IGNORED_SITES: tuple[str, ...] = ("<frozen importlib._bootstrap", tracemalloc.__file__)
+
+# Types measured by their own size only when estimating retained object sizes.
+ATOMIC_TYPES: tuple[type, ...] = (str, bytes, int, float, complex, bool, type(None), type, ModuleType, FunctionType)
+
+# Held while a PatternProfiler has replaced the module-level patterns, which are shared by the whole process.
+PATTERN_PROFILING_LOCK = Lock()
+
+# Upper bounds (seconds) of the per-file parse time histogram buckets.
+PARSE_TIME_BUCKETS: tuple[float, ...] = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+PATTERN_MODULES: tuple[ModuleType, ...] = (
+    adv_cmd,
+    code,
+    content,
+    double_curly,
+    double_parentheses,
+    embedded_links,
+    external_links,
+    tasks,
+)
+
+
+def deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """Return the approximate size of an object and everything it references that is not in ``seen``.
+
+    Containers, ``__slots__`` and ``__dict__`` attributes are followed; the ids of
+    visited objects are added to ``seen``, so objects shared with an earlier
+    measurement are not counted twice.
+    """
+    size = 0
+    stack = [obj]
+    push = stack.append
+    extend = stack.extend
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, ATOMIC_TYPES):
+            continue
+        if isinstance(item, dict):
+            extend(item.keys())
+            extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            extend(item)
+        else:
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if (value := getattr(item, slot, None)) is not None:
+                        push(value)
+            if (attrs := getattr(item, "__dict__", None)) is not None:
+                push(attrs)
+    return size
+
+
+@dataclass(slots=True)
+class MemoryProfiler:
+    """A class to measure the memory of each stage with ``tracemalloc`` snapshots.
+
+    Each stage records the traced memory it retained (current memory at its end
+    minus at its start), its peak above the start, and the allocation sites
+    that grew the most since the previous snapshot. Snapshots are costly on
+    large heaps, so they are only taken after stages retaining at least
+    ``site_threshold`` bytes; the growth of smaller stages shows up in the
+    sites of the next snapshotted stage. Nested stages are handled with a
+    stack so an inner stage does not hide the outer peak. Objects passed to
+    ``measure`` get an approximate retained size, broken down by top-level
+    attribute, that excludes everything already counted for an earlier object.
+    """
+
+    top: int = 10
+    site_threshold: int = 1 << 20
+    stages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    objects: dict[str, dict[str, Any]] = field(default_factory=dict)
+    open_stages: list[list[int]] = field(default_factory=list)
+    sites: dict[str, tuple[int, int]] = field(default_factory=dict)
+    seen: set[int] = field(default_factory=set)
+    peak: int = 0
+
+    def start(self) -> None:
+        """Start tracing allocations."""
+        tracemalloc.start()
+        self.sites = MemoryProfiler.site_sizes()
+
+    def stop(self) -> None:
+        """Stop tracing allocations and release the traces."""
+        self.sites.clear()
+        self.seen.clear()
+        tracemalloc.stop()
+
+    @staticmethod
+    def site_sizes() -> dict[str, tuple[int, int]]:
+        """Return the traced size and block count of each allocation site.
+
+        The snapshot is grouped once per stage and compared with the previous
+        grouping, which is much cheaper on large heaps than filtering the raw
+        traces or calling ``Snapshot.compare_to``.
+        """
+        return {
+            f"{frame.filename}:{frame.lineno}": (stat.size, stat.count)
+            for stat in tracemalloc.take_snapshot().statistics("lineno")
+            if not (frame := stat.traceback[0]).filename.startswith(IGNORED_SITES)
+        }
+
+    def top_sites(self, sites: dict[str, tuple[int, int]]) -> list[dict[str, Any]]:
+        """Return the allocation sites whose traced size changed the most since the previous stage."""
+        previous = self.sites
+        diffs = []
+        for site in sites.keys() | previous.keys():
+            size, count = sites.get(site, (0, 0))
+            old_size, old_count = previous.get(site, (0, 0))
+            if size != old_size:
+                diffs.append({"site": site, "size_diff": size - old_size, "count_diff": count - old_count})
+        diffs.sort(key=lambda diff: abs(diff["size_diff"]), reverse=True)
+        return diffs[: self.top]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure the memory of the body of the context as a stage."""
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def begin(self) -> None:
+        """Open a stage at the current traced memory."""
+        current, peak = tracemalloc.get_traced_memory()
+        if self.open_stages:
+            parent = self.open_stages[-1]
+            parent[1] = max(parent[1], peak)
+        tracemalloc.reset_peak()
+        self.open_stages.append([current, current])
+
+    def end(self, name: str) -> None:
+        """Close the innermost stage and record its memory and top allocation sites."""
+        current, peak = tracemalloc.get_traced_memory()
+        before, stage_peak = self.open_stages.pop()
+        stage_peak = max(stage_peak, peak)
+        if self.open_stages:
+            parent = self.open_stages[-1]
+            parent[1] = max(parent[1], stage_peak)
+        self.peak = max(self.peak, stage_peak)
+        entry = self.stages.setdefault(name, {"retained": 0, "peak": 0, "top_sites": []})
+        entry["retained"] += current - before
+        entry["peak"] = max(entry["peak"], stage_peak - before)
+        if abs(current - before) >= self.site_threshold:
+            sites = MemoryProfiler.site_sizes()
+            entry["top_sites"] = self.top_sites(sites)
+            self.sites = sites
+
+    def measure(self, name: str, obj: Any) -> None:
+        """Record the approximate retained size of an object and its attributes not already counted."""
+        seen = self.seen
+        attributes = {}
+        if not isinstance(obj, (*ATOMIC_TYPES, dict, list, tuple, set, frozenset)) and id(obj) not in seen:
+            slots = (slot for cls in type(obj).__mro__ for slot in getattr(cls, "__slots__", ()))
+            names = getattr(obj, "__dict__", None) or dict.fromkeys(slots)
+            attributes = {attr: deep_sizeof(getattr(obj, attr, None), seen) for attr in names}
+        size = deep_sizeof(obj, seen) + sum(attributes.values())
+        entry = self.objects.setdefault(name, {"size": 0, "attributes": {}})
+        entry["size"] += size
+        for attr, attr_size in attributes.items():
+            if attr_size:
+                entry["attributes"][attr] = entry["attributes"].get(attr, 0) + attr_size
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Return the stage memory, peak traced memory and the object sizes, largest first."""
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        return {
+            "peak": max(self.peak, peak),
+            "current": current,
+            "stages": self.stages,
+            "objects": dict(sorted(self.objects.items(), key=lambda item: item[1]["size"], reverse=True)),
+        }
+
+    def summary(self) -> str:
+        """Return the memory of each stage and the largest objects as a text table."""
+        report = self.report
+        fmt = MemoryProfiler.format_bytes
+        lines = [f"{'Stage':<36}{'Retained':>12}{'Peak':>12}"]
+        for name, entry in report["stages"].items():
+            lines.append(f"{name:<36}{fmt(entry['retained']):>12}{fmt(entry['peak']):>12}")
+        lines.append(f"{'peak traced memory':<36}{'':>12}{fmt(report['peak']):>12}")
+        lines.append(f"\n{'Object':<60}{'Retained':>12}")
+        for name, entry in list(report["objects"].items())[: self.top]:
+            lines.append(f"{name:<60}{fmt(entry['size']):>12}")
+            attributes = sorted(entry["attributes"].items(), key=lambda item: item[1], reverse=True)
+            lines.extend(f"  .{attr:<57}{fmt(size):>12}" for attr, size in attributes[:3])
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_bytes(size: int) -> str:
+        """Format a possibly negative byte count with IEC units."""
+        sign = "-" if size < 0 else ""
+        return f"{sign}{format_bytes(abs(size), SizeUnit.IEC, precision=1)}"
+
+
+@dataclass(slots=True)
+class StageProfiler:
+    """A class to time the stages of a run and the parse time of each file.
+
+    Stages are timed with ``timer(name)``; repeated stages accumulate their time
+    and call count. When the profiler is disabled, ``timer`` returns a shared
+    no-op context manager and nothing is recorded, so the instrumentation can
+    stay in place at near-zero cost.
+    """
+
+    enabled: bool = False
+    memory: MemoryProfiler | None = None
+    stages: dict[str, list[float]] = field(default_factory=dict)
+    file_times: list[float] = field(default_factory=list)
+    start: float = field(default_factory=perf_counter)
+
+    def __post_init__(self) -> None:
+        """Profile stages whenever memory is profiled."""
+        self.enabled = self.enabled or self.memory is not None
+
+    def timer(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing a stage, or a no-op one when disabled."""
+        if not self.enabled:
+            return NULL_TIMER
+        return self.timed(name)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Time the body of the context and add it to a stage, measuring its memory if enabled."""
+        with self.memory_stage(name):
+            start = perf_counter()
+            try:
+                yield
+            finally:
+                self.add(name, perf_counter() - start)
+
+    def memory_stage(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager measuring the memory of a stage, or a no-op one when memory is not profiled."""
+        if self.memory is None:
+            return NULL_TIMER
+        return self.memory.stage(name)
+
+    def call[T](self, func: Callable[..., T], *args: Any) -> T:
+        """Call a function, timing it as a stage named after the function or class."""
+        if not self.enabled:
+            return func(*args)
+        with self.timed(func.__name__):
+            result = func(*args)
+        self.measure(func.__name__, result)
+        return result
+
+    def measure(self, name: str, obj: Any) -> None:
+        """Record the approximate retained size of an object when memory is profiled."""
+        if self.memory is not None:
+            self.memory.measure(name, obj)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add a timed call to a stage."""
+        entry = self.stages.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def record_file(self, seconds: float) -> None:
+        """Record the parse time of a file."""
+        self.file_times.append(seconds)
+
+    @property
+    def parse_stats(self) -> dict[str, Any]:
+        """Return the count, total, mean, percentiles and histogram of the per-file parse times."""
+        times = sorted(self.file_times)
+        if not times:
+            return {"files": 0}
+        total = sum(times)
+        p50, p90, p99 = (quantiles(times, n=100, method="inclusive")[i] for i in (49, 89, 98))
+        labels = [f"<{StageProfiler.format_seconds(bound)}" for bound in PARSE_TIME_BUCKETS]
+        labels.append(f">={StageProfiler.format_seconds(PARSE_TIME_BUCKETS[-1])}")
+        histogram = dict.fromkeys(labels, 0)
+        for seconds in times:
+            histogram[labels[bisect_right(PARSE_TIME_BUCKETS, seconds)]] += 1
+        return {
+            "files": len(times),
+            "total": total,
+            "mean": total / len(times),
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": times[-1],
+            "files_per_second": len(times) / total if total else None,
+            "histogram": histogram,
+        }
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Return the stage timings and the per-file parse statistics."""
+        report = {
+            "total": perf_counter() - self.start,
+            "stages": {
+                name: {"seconds": seconds, "calls": int(calls)} for name, (seconds, calls) in self.stages.items()
+            },
+            "parse": self.parse_stats,
+        }
+        if self.memory is not None:
+            report["memory"] = self.memory.report
+        return report
+
+    def summary(self) -> str:
+        """Return the timings as a text table."""
+        report = self.report
+        total = report["total"] or 1.0
+        lines = [f"{'Stage':<36}{'Calls':>7}{'Seconds':>11}{'Share':>8}"]
+        for name, entry in report["stages"].items():
+            share = entry["seconds"] / total
+            lines.append(f"{name:<36}{entry['calls']:>7}{entry['seconds']:>11.3f}{share:>8.1%}")
+        lines.append(f"{'total':<36}{'':>7}{report['total']:>11.3f}")
+        parse = report["parse"]
+        if parse["files"]:
+            fmt = StageProfiler.format_seconds
+            lines.append(
+                f"\nParsed {parse['files']} files in {parse['total']:.3f} s: mean {fmt(parse['mean'])}, "
+                f"p50 {fmt(parse['p50'])}, p90 {fmt(parse['p90'])}, p99 {fmt(parse['p99'])}, max {fmt(parse['max'])}"
+            )
+            peak = max(parse["histogram"].values())
+            for label, count in parse["histogram"].items():
+                bar = "#" * round(40 * count / peak) if peak else ""
+                lines.append(f"  {label:>9} {count:>7} {bar}")
+        if self.memory is not None:
+            lines.append(f"\n{self.memory.summary()}")
+        return "\n".join(lines)
+
+    def write(self, output_dir: Path) -> Path:
+        """Write the timings (and memory measurements) to a JSON file in the output directory and return its path."""
+        path = output_dir / Constant.PROFILE_FILE
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.report, f, indent=4)
+        logger.info("Wrote stage timings to %s", path)
+        return path
+
+    @staticmethod
+    def format_seconds(seconds: float) -> str:
+        """Format a duration with a unit suited to its size."""
+        if seconds < 0.001:
+            return f"{seconds * 1_000_000:.3g}us"
+        if seconds < 1:
+            return f"{seconds * 1000:.3g}ms"
+        return f"{seconds:.3g}s"
+
+
+@dataclass(slots=True)
+class CallProfiler:
+    """A class to run the pipeline under ``cProfile`` and save its statistics.
+
+    ``profiling()`` profiles the body of the context in the calling thread, so
+    wrapping the pipeline in ``run_app`` also covers runs started from the GUI's
+    ``AnalysisWorker`` thread. ``write`` saves the raw ``.pstats`` file, for
+    ``pstats`` or a viewer such as snakeviz, and a text summary of the ``top``
+    functions by cumulative time.
+    """
+
+    enabled: bool = False
+    top: int = 50
+    profile: cProfile.Profile | None = None
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        """Profile the body of the context when enabled."""
+        if not self.enabled:
+            yield
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            logger.warning("cProfile could not start because another profiler is active")
+            yield
+            return
+        self.profile = profile
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def write(self, output_dir: Path) -> list[Path]:
+        """Write the statistics and their text summary to the output directory and return their paths."""
+        if self.profile is None:
+            return []
+        stats_path = output_dir / Constant.PSTATS_FILE
+        summary_path = output_dir / Constant.PSTATS_SUMMARY_FILE
+        self.profile.dump_stats(stats_path)
+        with summary_path.open("w", encoding="utf-8") as f:
+            pstats.Stats(self.profile, stream=f).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        logger.info("Wrote cProfile statistics to %s", stats_path)
+        return [stats_path, summary_path]
+
+
+@dataclass(slots=True, eq=False)
+class PatternTimer:
+    """A stand-in for a compiled pattern that records its calls, matches, scanned characters and time.
+
+    ``search``, ``match``, ``findall``, ``finditer`` and ``sub`` are timed; other
+    attributes are read from the wrapped pattern. The time of ``finditer`` is
+    the time spent advancing the iterator, and the time of ``sub`` includes the
+    replacement callback.
+    """
+
+    pattern: re.Pattern
+    name: str
+    criteria: set[str] = field(default_factory=set)
+    calls: int = 0
+    matches: int = 0
+    scanned: int = 0
+    seconds: float = 0.0
+
+    def __getattr__(self, attr: str) -> Any:
+        """Return the attributes of the wrapped pattern."""
+        return getattr(self.pattern, attr)
+
+    def record(self, string: str, args: tuple[Any, ...], start: float, matches: int) -> None:
+        """Record a call on a string, from the optional start position in ``args``."""
+        self.seconds += perf_counter() - start
+        self.calls += 1
+        self.matches += matches
+        self.scanned += len(string) - (args[0] if args else 0)
+
+    def search(self, string: str, *args: Any) -> re.Match | None:
+        """Time ``re.Pattern.search``."""
+        start = perf_counter()
+        match = self.pattern.search(string, *args)
+        self.record(string, args, start, match is not None)
+        return match
+
+    def match(self, string: str, *args: Any) -> re.Match | None:
+        """Time ``re.Pattern.match``."""
+        start = perf_counter()
+        match = self.pattern.match(string, *args)
+        self.record(string, args, start, match is not None)
+        return match
+
+    def findall(self, string: str, *args: Any) -> list[Any]:
+        """Time ``re.Pattern.findall``."""
+        start = perf_counter()
+        found = self.pattern.findall(string, *args)
+        self.record(string, args, start, len(found))
+        return found
+
+    def finditer(self, string: str, *args: Any) -> Iterator[re.Match]:
+        """Time ``re.Pattern.finditer`` as its matches are consumed."""
+        start = perf_counter()
+        iterator = self.pattern.finditer(string, *args)
+        self.record(string, args, start, 0)
+        while True:
+            start = perf_counter()
+            match = next(iterator, None)
+            self.seconds += perf_counter() - start
+            if match is None:
+                return
+            self.matches += 1
+            yield match
+
+    def sub(self, repl: Any, string: str, count: int = 0) -> str:
+        """Time ``re.Pattern.sub``, counting the replacements as matches."""
+        start = perf_counter()
+        result, replaced = self.pattern.subn(repl, string, count)
+        self.record(string, (), start, replaced)
+        return result
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the recorded counters of the pattern."""
+        return {
+            "calls": self.calls,
+            "matches": self.matches,
+            "scanned_chars": self.scanned,
+            "seconds": self.seconds,
+            "criteria": sorted(self.criteria),
+        }
+
+
+@dataclass(slots=True)
+class PatternProfiler:
+    """A class to measure the compiled patterns used while parsing files.
+
+    While ``instrument()`` is active, every compiled pattern of the pattern
+    modules is replaced by a ``PatternTimer``, as are the patterns held in the
+    pattern maps of ``LogseqFile``, ``LogseqBullets`` and the pattern modules'
+    ``PATTERN_MAP`` used by ``process_pattern_hierarchy``. The originals are
+    restored on exit. Patterns are attributed to the ``Crit*`` keys they
+    produce, so time can also be reported per criterion.
+
+    The replaced patterns are module globals, so instrumenting affects every
+    thread of the process: only one profiled run may be active per process,
+    and any other run started meanwhile is counted along with it.
+    ``install`` raises ``RuntimeError`` while another profiler is installed.
+    """
+
+    enabled: bool = False
+    timers: dict[re.Pattern, PatternTimer] = field(default_factory=dict)
+    restore: list[tuple[Any, str, Any]] = field(default_factory=list)
+    installed: bool = False
+
+    @contextmanager
+    def instrument(self) -> Iterator[None]:
+        """Instrument the patterns for the body of the context, if enabled."""
+        if not self.enabled:
+            yield
+            return
+        try:
+            self.install()
+            yield
+        finally:
+            self.uninstall()
+
+    def wrap(self, pattern: re.Pattern | PatternTimer, name: str, criteria: str = "") -> PatternTimer:
+        """Return the timer of a pattern, creating it on first use."""
+        if isinstance(pattern, PatternTimer):
+            pattern = pattern.pattern
+        if (timer := self.timers.get(pattern)) is None:
+            timer = self.timers[pattern] = PatternTimer(pattern, name)
+        if criteria:
+            timer.criteria.add(str(criteria))
+        return timer
+
+    def replace(self, target: Any, attr: str, value: Any) -> None:
+        """Replace a module attribute, remembering the original."""
+        self.restore.append((target, attr, getattr(target, attr)))
+        setattr(target, attr, value)
+
+    def install(self) -> None:
+        """Replace the compiled patterns with timers."""
+        if not PATTERN_PROFILING_LOCK.acquire(blocking=False):
+            msg = "Pattern profiling is already active in this process"
+            raise RuntimeError(msg)
+        self.installed = True
+        wrap = self.wrap
+        for module in PATTERN_MODULES:
+            short_name = module.__name__.rpartition(".")[2]
+            for attr, value in list(vars(module).items()):
+                if isinstance(value, re.Pattern):
+                    self.replace(module, attr, wrap(value, f"{short_name}.{attr}"))
+            if pattern_map := getattr(module, "PATTERN_MAP", None):
+                timed_map = {wrap(pattern, "", criteria): criteria for pattern, criteria in pattern_map.items()}
+                self.replace(module, "PATTERN_MAP", timed_map)
+                wrap(module.ALL, "", module.FALLBACK)
+        primary_data_map = {key: wrap(pattern, "", key) for key, pattern in file.PRIMARY_DATA_MAP.items()}
+        self.replace(file, "PRIMARY_DATA_MAP", primary_data_map)
+        raw_data_map = {key: wrap(pattern, "", key) for key, pattern in bullets.RAW_DATA_MAP.items()}
+        self.replace(bullets, "RAW_DATA_MAP", raw_data_map)
+        pattern_masking = tuple(
+            (wrap(sub.__self__, "", prefix.strip("_")).sub, prefix) for sub, prefix in file.PATTERN_MASKING
+        )
+        self.replace(file, "PATTERN_MASKING", pattern_masking)
+
+    def uninstall(self) -> None:
+        """Restore the original patterns."""
+        while self.restore:
+            target, attr, value = self.restore.pop()
+            setattr(target, attr, value)
+        if self.installed:
+            self.installed = False
+            PATTERN_PROFILING_LOCK.release()
+
+    @property
+    def report(self) -> dict[Output, dict[str, dict[str, Any]]]:
+        """Return the pattern and criterion counters, slowest first."""
+        timers = sorted((t for t in self.timers.values() if t.calls), key=lambda t: t.seconds, reverse=True)
+        by_criteria: dict[str, dict[str, Any]] = defaultdict(
+            lambda: {"calls": 0, "matches": 0, "scanned_chars": 0, "seconds": 0.0, "patterns": []}
+        )
+        for timer in timers:
+            for criteria in timer.criteria:
+                entry = by_criteria[criteria]
+                entry["calls"] += timer.calls
+                entry["matches"] += timer.matches
+                entry["scanned_chars"] += timer.scanned
+                entry["seconds"] += timer.seconds
+                entry["patterns"].append(timer.name)
+        return {
+            Output.PATTERN_TIMINGS: {timer.name: timer.stats for timer in timers},
+            Output.PATTERN_CRITERIA_TIMINGS: dict(
+                sorted(by_criteria.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            ),
+        }
@@ -0,0 +1,117 @@
+"""Throttled per-file progress reporting with throughput and ETA."""
+
+import logging
+import sys
+from dataclasses import dataclass, field
+from datetime import timedelta
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .helpers import SizeUnit, format_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+type ProgressCallback = Callable[[int, str], None]
+
+# Default maximum number of progress updates per second.
+UPDATES_PER_SECOND = 4.0
+
+
+@dataclass(slots=True)
+class FileProgress:
+    """A class to report the progress of processing the discovered files.
+
+    ``advance`` is called once per processed file and only forwards an update
+    to the callback when at least ``1 / max_rate`` seconds have passed since the
+    previous one, so the hot loop pays a counter increment and a clock read per
+    file. The percentage is scaled between ``start_percent`` and ``end_percent``
+    of the overall run, and the label gives the processed and discovered
+    files, the bytes read, the throughput and the estimated time left.
+    """
+
+    callback: ProgressCallback
+    start_percent: int = 0
+    end_percent: int = 100
+    max_rate: float = UPDATES_PER_SECOND
+    discovered: int = 0
+    processed: int = 0
+    bytes_processed: int = 0
+    start: float = field(default_factory=perf_counter)
+    next_update: float = 0.0
+
+    def discover(self, count: int) -> None:
+        """Set the number of files to process and start measuring throughput."""
+        self.discovered = count
+        self.processed = 0
+        self.bytes_processed = 0
+        self.start = perf_counter()
+        self.update(self.start)
+
+    def advance(self, size: int = 0) -> None:
+        """Count a processed file and its size, updating the callback when the throttle allows it."""
+        self.processed += 1
+        self.bytes_processed += size
+        now = perf_counter()
+        if now >= self.next_update:
+            self.update(now)
+
+    def finish(self) -> None:
+        """Send the final update regardless of the throttle."""
+        self.update(perf_counter())
+
+    def update(self, now: float) -> None:
+        """Send the current percentage and label to the callback."""
+        self.next_update = now + 1 / self.max_rate
+        self.callback(self.percent, self.label(now))
+
+    @property
+    def percent(self) -> int:
+        """Return the overall percentage reached by the processed files."""
+        done = self.processed / self.discovered if self.discovered else 1.0
+        return self.start_percent + int((self.end_percent - self.start_percent) * done)
+
+    def stats(self, now: float | None = None) -> dict[str, Any]:
+        """Return the file and byte counts, the throughput and the seconds left."""
+        elapsed = (perf_counter() if now is None else now) - self.start
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        remaining = self.discovered - self.processed
+        return {
+            "discovered": self.discovered,
+            "processed": self.processed,
+            "bytes": self.bytes_processed,
+            "files_per_second": rate,
+            "bytes_per_second": self.bytes_processed / elapsed if elapsed > 0 else 0.0,
+            "eta": remaining / rate if rate else None,
+        }
+
+    def label(self, now: float | None = None) -> str:
+        """Return a one-line description of the progress."""
+        stats = self.stats(now)
+        eta = stats["eta"]
+        eta_text = str(timedelta(seconds=round(eta))) if eta is not None else "--:--"
+        size = format_bytes(stats["bytes"], SizeUnit.IEC, precision=1)
+        return (
+            f"Processed {stats['processed']:,}/{stats['discovered']:,} files ({size}), "
+            f"{stats['files_per_second']:,.0f} files/s, ETA {eta_text}"
+        )
+
+
+@dataclass(slots=True)
+class ConsoleProgress:
+    """A class to show progress updates on a single, rewritten terminal line."""
+
+    stream: TextIO = field(default_factory=lambda: sys.stderr)
+    width: int = 0
+
+    def update(self, percentage: int, label: str = "") -> None:
+        """Rewrite the progress line, ending it once the run is complete."""
+        line = f"[{percentage:>3}%] {label}"
+        padding = " " * max(self.width - len(line), 0)
+        self.width = len(line)
+        end = "\n" if percentage >= 100 else ""
+        self.stream.write(f"\r{line}{padding}{end}")
+        self.stream.flush()
+        logger.info("Updating progress: %d%% %s", percentage, label)
@@ -0,0 +1,235 @@
+"""Deterministic synthetic Logseq graphs for benchmarks and tests."""
+
+import logging
+import os
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from .enums import Core, TargetDir
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CONFIG_EDN = """{:meta/version 1
+ :preferred-format :markdown
+ :journal/page-title-format "MMM do, yyyy"
+ :journal/file-name-format "yyyy_MM_dd"
+ :file/name-format :triple-lowbar
+ :hidden []
+ :default-queries {:journals []}}
+"""
+
+WORDS: tuple[str, ...] = (
+    "analysis",
+    "archive",
+    "backlog",
+    "budget",
+    "design",
+    "draft",
+    "garden",
+    "habit",
+    "idea",
+    "inbox",
+    "meeting",
+    "note",
+    "plan",
+    "project",
+    "reading",
+    "research",
+    "review",
+    "roadmap",
+    "summary",
+    "travel",
+)
+NAMESPACE_ROOTS: tuple[str, ...] = ("area", "project", "reference", "team")
+TASK_MARKERS: tuple[str, ...] = ("TODO", "DOING", "DONE", "LATER", "NOW", "WAITING", "CANCELED")
+CODE_LANGUAGES: tuple[str, ...] = ("python", "clojure", "bash", "sql")
+BASE_TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+START_DATE = date(2020, 1, 1)
+
+
+@dataclass(slots=True)
+class SyntheticGraph:
+    """A class to write a reproducible Logseq graph of a given size.
+
+    The same ``pages`` and ``seed`` always produce the same files, contents and
+    modification times. A fifth of the pages are journals, a quarter of the
+    rest are namespaced, one in a hundred is an HLS (PDF highlights) page, and
+    one asset is written per fifty pages, half of them never linked. Page
+    bullets mix page references, tags, properties, tasks with SCHEDULED and
+    DEADLINE dates, code blocks, page and block embeds, block references,
+    queries and external links.
+    """
+
+    root: Path
+    pages: int
+    seed: int = 0
+    rng: random.Random = field(init=False)
+    titles: list[str] = field(default_factory=list)
+    journal_titles: list[str] = field(default_factory=list)
+    block_ids: list[str] = field(default_factory=list)
+    assets: list[str] = field(default_factory=list)
+    files_written: int = 0
+
+    def __post_init__(self) -> None:
+        """Seed the random generator."""
+        self.rng = random.Random(self.seed)
+
+    def generate(self) -> Path:
+        """Write the graph and return its root folder."""
+        root = self.root
+        for target in (TargetDir.ASSET, TargetDir.DRAW, TargetDir.JOURNAL, TargetDir.PAGE, TargetDir.WHITEBOARD):
+            (root / target).mkdir(parents=True, exist_ok=True)
+        (root / "logseq").mkdir(exist_ok=True)
+        self.write(root / "logseq" / "config.edn", CONFIG_EDN)
+
+        journals = self.pages // 5
+        hls_pages = self.pages // 100
+        pages = self.pages - journals - hls_pages
+        self.titles = [self.page_title(i) for i in range(pages)]
+        self.assets = [f"image-{i}.png" for i in range(max(self.pages // 50, 1))]
+        for name in self.assets:
+            self.write(root / TargetDir.ASSET / name, "")
+
+        for title, day in self.iter_journals(journals):
+            self.write(root / TargetDir.JOURNAL / f"{day:%Y_%m_%d}.md", self.page_content())
+            self.journal_titles.append(title)
+        for title in self.titles:
+            self.write(root / TargetDir.PAGE / f"{title.replace('/', '___')}.md", self.page_content(title))
+        for i in range(hls_pages):
+            self.write_hls_page(i)
+        logger.info("Wrote a synthetic graph of %d files to %s", self.files_written, root)
+        return root
+
+    def write(self, path: Path, text: str) -> None:
+        """Write a file with a modification time derived from its position in the graph."""
+        path.write_text(text, encoding="utf-8")
+        timestamp = BASE_TIMESTAMP + self.files_written * 60
+        os.utime(path, (timestamp, timestamp))
+        self.files_written += 1
+
+    def page_title(self, i: int) -> str:
+        """Return the title of the i-th page; every fourth page is namespaced."""
+        choice = self.rng.choice
+        name = f"{choice(WORDS)} {choice(WORDS)} {i}"
+        if i % 4 == 0:
+            depth = 1 + i % 3
+            parts = [choice(NAMESPACE_ROOTS), *(choice(WORDS) for _ in range(depth - 1)), name]
+            return "/".join(parts)
+        return name
+
+    def iter_journals(self, count: int) -> Iterator[tuple[str, date]]:
+        """Yield the title and date of each journal, skipping about one day in ten."""
+        day = START_DATE
+        for _ in range(count):
+            if self.rng.random() < 0.1:
+                day += timedelta(days=1)
+            yield SyntheticGraph.journal_title(day), day
+            day += timedelta(days=1)
+
+    @staticmethod
+    def journal_title(day: date) -> str:
+        """Return the journal page title of a date in the "MMM do, yyyy" format."""
+        suffix = "th" if 11 <= day.day % 100 <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(day.day % 10, "th")
+        return f"{day:%b} {day.day}{suffix}, {day.year}"
+
+    def new_block_id(self) -> str:
+        """Return a new block UUID and remember it for later references."""
+        block_id = str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        self.block_ids.append(block_id)
+        return block_id
+
+    def link(self) -> str:
+        """Return a reference to an existing page, journal or a dangling page."""
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.1 and self.journal_titles:
+            return f"[[{rng.choice(self.journal_titles)}]]"
+        if roll < 0.15:
+            return f"[[missing {rng.choice(WORDS)}]]"
+        return f"[[{rng.choice(self.titles)}]]" if self.titles else "[[index]]"
+
+    def page_content(self, title: str = "") -> str:
+        """Return the bullets of a page or, without a title, of a journal."""
+        rng = self.rng
+        lines = []
+        if title:
+            lines.append(f"tags:: {rng.choice(WORDS)}, {rng.choice(WORDS)}")
+            lines.append(f"type:: {rng.choice(('note', 'project', 'person'))}")
+            if rng.random() < 0.2:
+                lines.append(f"alias:: {title.rpartition('/')[2]} alias")
+            lines.append("")
+        for _ in range(rng.randint(3, 12)):
+            lines.extend(self.bullet())
+        return "\n".join(lines) + "\n"
+
+    def bullet(self) -> list[str]:
+        """Return the lines of a random bullet."""
+        rng = self.rng
+        choice = rng.choice
+        kind = rng.randrange(10)
+        text = f"{choice(WORDS)} {self.link()} #{choice(WORDS)}"
+        match kind:
+            case 0:
+                lines = [f"- {text}", f"  id:: {self.new_block_id()}"]
+            case 1 if self.block_ids:
+                lines = [f"- see (({choice(self.block_ids)})) {choice(WORDS)}"]
+            case 2:
+                target = f"(({choice(self.block_ids)}))" if self.block_ids and rng.random() < 0.5 else self.link()
+                lines = [f"- {{{{embed {target}}}}}"]
+            case 3:
+                day = START_DATE + timedelta(days=rng.randrange(1500))
+                lines = [
+                    f"- {choice(TASK_MARKERS)} [#{choice('ABC')}] {text}",
+                    f"  SCHEDULED: <{day:%Y-%m-%d %a}>",
+                    f"  DEADLINE: <{day + timedelta(days=7):%Y-%m-%d %a}>",
+                ]
+            case 4:
+                lines = [
+                    f"- ```{choice(CODE_LANGUAGES)}",
+                    f"  value = {rng.randrange(1000)}  # [[not a link]]",
+                    "  ```",
+                ]
+            case 5:
+                lines = [f"- ![{choice(WORDS)}](../assets/{choice(self.assets[::2])})"]
+            case 6:
+                lines = [f"- [{choice(WORDS)}](https://example.com/{choice(WORDS)}) {text}"]
+            case 7:
+                page = choice(self.titles) if self.titles else "index"
+                lines = ["- {{query (and (todo todo doing) [[" + page + "]])}}"]
+            case 8:
+                lines = [f"- {text}", f"  {choice(WORDS)}:: {choice(WORDS)}"]
+            case _:
+                lines = [f"- {text} `inline {choice(WORDS)}`"]
+        return lines
+
+    def write_hls_page(self, i: int) -> None:
+        """Write a PDF highlights page with its highlight images in a subfolder of the assets."""
+        rng = self.rng
+        name = f"{Core.HLS_PREFIX}paper-{i}"
+        image_dir = self.root / TargetDir.ASSET / name
+        image_dir.mkdir(exist_ok=True)
+        lines = [f"file:: [paper-{i}.pdf](../assets/paper-{i}.pdf)", f"file-path:: ../assets/paper-{i}.pdf", ""]
+        for _ in range(rng.randint(2, 6)):
+            block_id = self.new_block_id()
+            hl_page = rng.randint(1, 40)
+            hl_stamp = int(BASE_TIMESTAMP * 1000) + rng.randrange(10**6)
+            lines.extend(
+                (
+                    "- [:span]",
+                    "  ls-type:: annotation",
+                    f"  hl-page:: {hl_page}",
+                    "  hl-color:: yellow",
+                    f"  id:: {block_id}",
+                    "  hl-type:: area",
+                    f"  hl-stamp:: {hl_stamp}",
+                )
+            )
+            self.write(image_dir / f"{hl_page}_{block_id}_{hl_stamp}.png", "")
+        self.write(self.root / TargetDir.PAGE / f"{name}.md", "\n".join(lines) + "\n")
@@ -1,11 +1,110 @@
 """Fixtures for testing."""
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from logseq_analyzer.analysis.index import FileIndex
+from logseq_analyzer.config.arguments import Args
+from logseq_analyzer.config.context import AnalyzerContext
+from logseq_analyzer.config.graph_config import ConfigEdns, get_default_logseq_config, get_target_dirs
+from logseq_analyzer.io.filesystem import (
+    AnalyzerDeleteDirs,
+    BakDirectory,
+    CacheFile,
+    ConfigFile,
+    GraphDirectory,
+    LogseqAnalyzerDirs,
+    LogseqDirectory,
+    LogseqGraphDirs,
+    OutputDirectory,
+    RecycleDirectory,
+)
+from logseq_analyzer.logseq_file.file import LogseqFile
+from logseq_analyzer.logseq_file.info import JournalFormats
+from logseq_analyzer.utils.enums import Constant, TargetDir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
 
 
 @pytest.fixture
 def file_index() -> FileIndex:
     """Fixture to create a FileIndex object."""
     return FileIndex()
+
+
+@pytest.fixture
+def make_context(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[[str], AnalyzerContext]:
+    """Fixture returning a factory that builds an AnalyzerContext for an empty graph."""
+    monkeypatch.chdir(tmp_path)
+
+    def _make_context(name: str = "graph") -> AnalyzerContext:
+        graph = tmp_path / name
+        logseq_dir = graph / "logseq"
+        logseq_dir.mkdir(parents=True, exist_ok=True)
+        (logseq_dir / "config.edn").write_text("{}", encoding="utf-8")
+        config = get_default_logseq_config()
+        target_dirs = get_target_dirs(config)
+        for target in (TargetDir.ASSET, TargetDir.JOURNAL, TargetDir.PAGE):
+            (graph / target_dirs[target]).mkdir(exist_ok=True)
+        graph_dirs = LogseqGraphDirs(
+            graph_dir=GraphDirectory(graph),
+            logseq_dir=LogseqDirectory(logseq_dir),
+            bak_dir=BakDirectory(logseq_dir / "bak"),
+            recycle_dir=RecycleDirectory(logseq_dir / ".recycle"),
+            user_config=ConfigFile(logseq_dir / "config.edn"),
+        )
+        return AnalyzerContext(
+            args=Args(graph_folder=str(graph)),
+            analyzer_dirs=LogseqAnalyzerDirs(
+                graph_dirs=graph_dirs,
+                delete_dirs=AnalyzerDeleteDirs(),
+                target_dirs=target_dirs,
+                output_dir=OutputDirectory(tmp_path / Constant.OUTPUT_DIR / name),
+                cache_file=CacheFile(tmp_path / Constant.CACHE_DIR / name),
+            ),
+            config_edns=ConfigEdns(config=config, default_edn=config),
+            journal_formats=JournalFormats(file="%Y_%m_%d", page="%b %#d, %Y", page_title="MMM do, yyyy"),
+        )
+
+    return _make_context
+
+
+@pytest.fixture
+def make_index() -> Callable[..., FileIndex]:
+    """Fixture returning a factory that writes files into a graph, then processes and indexes them.
+
+    The factory takes the context, a mapping of file names to text or bytes
+    content, the target directory (pages by default) and an index to add the
+    files to. Without contents, the files already in the target directory are
+    indexed in sorted order.
+    """
+
+    def _make_index(
+        ctx: AnalyzerContext,
+        contents: Mapping[str, str | bytes] | None = None,
+        target: str = TargetDir.PAGE,
+        index: FileIndex | None = None,
+    ) -> FileIndex:
+        folder = ctx.graph_dir / ctx.target_dirs[target]
+        index = FileIndex() if index is None else index
+        if contents is None:
+            paths = sorted(folder.iterdir())
+        else:
+            paths = []
+            for name, content in contents.items():
+                path = folder / name
+                if isinstance(content, bytes):
+                    path.write_bytes(content)
+                else:
+                    path.write_text(content, encoding="utf-8")
+                paths.append(path)
+        for path in paths:
+            f = LogseqFile(path)
+            f.process(ctx)
+            index.add(f)
+        return index
+
+    return _make_index
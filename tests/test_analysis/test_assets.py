@@ -5,9 +5,13 @@ from typing import TYPE_CHECKING
 import pytest
 
 from logseq_analyzer.analysis.assets import LogseqAssets, LogseqAssetsHls
+from logseq_analyzer.utils.enums import TargetDir
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
 
 
 @pytest.fixture
@@ -34,3 +38,18 @@ def test_logseq_assets_hls_initialization(logseq_assets_hls: LogseqAssetsHls) ->
     assert logseq_assets_hls.backlinked == set()
     assert logseq_assets_hls.hls_bullets == set()
     assert logseq_assets_hls.not_backlinked == set()
+
+
+def test_logseq_assets_backlinks(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that asset mentions, including URL-encoded ones, mark assets as backlinked."""
+    ctx = make_context("graph")
+    assets = dict.fromkeys(("pic.png", "unused.png", "my%20photo.jpg"), b"\x00")
+    index = make_index(ctx, assets, TargetDir.ASSET)
+    page = {"page.md": "- ![pic](../assets/pic.png)\n- ![photo](../assets/my%20photo.jpg)\n"}
+    make_index(ctx, page, index=index)
+
+    logseq_assets = LogseqAssets(index)
+    assert {f.path.name for f in logseq_assets.backlinked} == {"pic", "my photo"}
+    assert {f.path.name for f in logseq_assets.not_backlinked} == {"unused"}
@@ -0,0 +1,67 @@
+"""Tests for LogseqBlockRefs."""
+
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.analysis.block_refs import LogseqBlockRefs
+from logseq_analyzer.utils.enums import CritContent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+UUID_A = "6650a1b2-0000-4000-8000-00000000000a"
+UUID_B = "6650a1b2-0000-4000-8000-00000000000b"
+UUID_MISSING = "6650a1b2-0000-4000-8000-0000000000ff"
+
+
+def test_block_refs_empty(file_index: FileIndex) -> None:
+    """Test an empty index has no block references."""
+    block_refs = LogseqBlockRefs(file_index)
+    assert block_refs.broken == {}
+    assert block_refs.summary["references"] == 0
+
+
+def test_block_refs(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test resolving block references and embeds against the block UUID index."""
+    ctx = make_context("graph")
+    contents = {
+        "Source.md": f"- first\n- target block\n  id:: {UUID_A}\n- see (({UUID_B}))\n",
+        "Other.md": f"- quote\n  id:: {UUID_B.upper()}\n- (({UUID_A})) and (({UUID_MISSING}))\n",
+        "Third.md": f"- {{{{embed (({UUID_A}))}}}}\n- (({UUID_MISSING}))\n",
+    }
+    index = make_index(ctx, contents)
+
+    assert index["Source"][0].data[CritContent.BLOCK_IDS] == {UUID_A: 2}
+    block_refs = LogseqBlockRefs(index)
+    assert block_refs.block_index == {UUID_A: ("Source", 2), UUID_B: ("Other", 1)}
+    assert block_refs.broken[UUID_MISSING]["count"] == 2
+    assert next(iter(block_refs.referenced)) == UUID_A
+    assert block_refs.referenced[UUID_A]["count"] == 2
+    assert block_refs.cross_page["Source"] == {"Other": 1, "Third": 1}
+    assert block_refs.summary == {
+        "block_ids": 2,
+        "duplicate_block_ids": 0,
+        "references": 5,
+        "resolved": 3,
+        "broken": 2,
+        "same_page": 0,
+        "cross_page": 3,
+    }
+
+
+def test_block_ids_in_code_are_ignored(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that `id::` lines in code blocks are not block ids and later offsets still match the bullets."""
+    ctx = make_context("graph")
+    content = (
+        f"- ```markdown\n- example\n  id:: {UUID_B}\n```\n- `id:: {UUID_MISSING}`\n- real block\n  id:: {UUID_A}\n"
+    )
+    index = make_index(ctx, {"Docs.md": content})
+
+    f = index["Docs"][0]
+    assert f.data[CritContent.BLOCK_IDS] == {UUID_A: 4}
+    assert f.bullets.all_bullets[4].startswith("real block")
+    assert LogseqBlockRefs(index).summary["block_ids"] == 1
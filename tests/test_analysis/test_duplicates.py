@@ -0,0 +1,37 @@
+"""Tests for LogseqDuplicateBlocks."""
+
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.analysis.duplicates import LogseqDuplicateBlocks
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+PASTED = " ".join(f"meeting notes item {i} review the budget" for i in range(10))
+
+
+def test_duplicates_empty(file_index: FileIndex) -> None:
+    """Test an empty index has no duplicates."""
+    duplicates = LogseqDuplicateBlocks(file_index)
+    assert duplicates.exact == {}
+    assert duplicates.near == []
+
+
+def test_duplicates(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test exact duplicates ignore case, whitespace and properties, and near duplicates cluster."""
+    ctx = make_context("graph")
+    contents = {
+        "One.md": f"- {PASTED}\n- short\n- a unique sentence that appears in only one single place\n",
+        "Two.md": f"- {PASTED.upper()}\n  id:: 6650a1b2-0000-4000-8000-00000000000a\n",
+        "Three.md": f"- {PASTED.replace('budget', 'plan', 1)}\n",
+    }
+    index = make_index(ctx, contents)
+
+    duplicates = LogseqDuplicateBlocks(index)
+    assert len(duplicates.exact) == 1
+    assert next(iter(duplicates.exact.values())) == {"count": 2, "found_in": {"One": [1], "Two": [1]}}
+    assert duplicates.near == [{"count": 3, "found_in": {"One": [1], "Two": [1], "Three": [1]}, "variants": 2}]
+    assert duplicates.summary["exact_duplicate_blocks"] == 2
@@ -0,0 +1,51 @@
+"""Tests for LogseqGraphMetrics."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logseq_analyzer.analysis.graph_metrics import LogseqGraphMetrics
+from logseq_analyzer.utils.enums import Output
+
+if TYPE_CHECKING:
+    from logseq_analyzer.analysis.index import FileIndex
+
+
+def _refs(edges: list[tuple[str, str]]) -> dict[str, dict]:
+    refs: dict[str, dict] = {}
+    for source, target in edges:
+        entry = refs.setdefault(target, {"count": 0, "found_in": {}})
+        entry["count"] += 1
+        entry["found_in"][source] = entry["found_in"].get(source, 0) + 1
+    return refs
+
+
+def test_graph_metrics_empty(file_index: FileIndex) -> None:
+    """Test an empty graph yields empty metrics."""
+    metrics = LogseqGraphMetrics(file_index, {})
+    assert metrics.pagerank == {}
+    assert metrics.components == []
+    assert metrics.summary == {}
+
+
+def test_graph_metrics(file_index: FileIndex) -> None:
+    """Test components, degrees and PageRank on a small graph."""
+    edges = [("a", "hub"), ("b", "hub"), ("c", "hub"), ("hub", "a"), ("x", "y"), ("y", "y")]
+    metrics = LogseqGraphMetrics(file_index, _refs(edges))
+
+    assert metrics.components == [["a", "b", "c", "hub"], ["x", "y"]]
+    assert metrics.summary["nodes"] == 6
+    assert metrics.summary["edges"] == 5
+    assert metrics.summary["components"] == 2
+    assert metrics.degrees["in_degree"] == {0: 3, 1: 2, 3: 1}
+    assert metrics.degrees["out_degree"] == {0: 1, 1: 5}
+    assert next(iter(metrics.pagerank)) == "hub"
+    assert sum(metrics.pagerank.values()) == pytest.approx(1.0, abs=1e-6)
+    assert metrics.hubs["hub"]["in_degree"] == 3
+    assert set(metrics.report) >= {Output.GRAPH_PAGERANK, Output.GRAPH_COMPONENTS}
+
+
+def test_compute_pagerank_symmetric_cycle() -> None:
+    """Test PageRank is uniform on a directed cycle."""
+    ranks, _ = LogseqGraphMetrics.compute_pagerank([[2], [0], [1]], [1, 1, 1])
+    assert ranks == pytest.approx([1 / 3] * 3)
@@ -6,9 +6,13 @@ from typing import TYPE_CHECKING
 import pytest
 
 from logseq_analyzer.analysis.journals import LogseqJournals
+from logseq_analyzer.utils.enums import TargetDir
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
 
 
 @pytest.fixture
@@ -25,3 +29,25 @@ def test_len(logseq_journals: LogseqJournals) -> None:
         datetime.datetime.max.replace(tzinfo=datetime.UTC),
     ]
     assert len(logseq_journals) == 2
+
+
+def test_journal_timeline(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test timeline, missing days and dangling journal classification."""
+    ctx = make_context("graph")
+    names = ("2024_01_01.md", "2024_01_05.md", "2024_01_06.md")
+    index = make_index(ctx, dict.fromkeys(names, "- entry\n"), TargetDir.JOURNAL)
+
+    dangling = {"Dec 31, 2023", "Jan 3, 2024", "Feb 1, 2024", "not a date"}
+    logseq_journals = LogseqJournals(index, dangling, ctx.journal_formats.page)
+
+    def day(d: int, month: int = 1, year: int = 2024) -> datetime.datetime:
+        """Return a UTC journal date."""
+        return datetime.datetime(year, month, d, tzinfo=datetime.UTC)
+
+    assert logseq_journals.sets.timeline == [day(d) for d in range(1, 7)]
+    assert logseq_journals.sets.missing == [day(2), day(4)]
+    assert logseq_journals.dangling["past"] == [day(31, 12, 2023)]
+    assert logseq_journals.dangling["inside"] == [day(3)]
+    assert logseq_journals.dangling["future"] == [day(1, 2)]
+    assert logseq_journals.timeline_stats["timeline"]["days"] == 6
+    assert logseq_journals.timeline_stats["total"]["first"] == day(31, 12, 2023)
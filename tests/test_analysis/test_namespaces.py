@@ -1,4 +1,4 @@
-"""Tests for LogseqJournals."""
+"""Tests for LogseqNamespaces."""
 
 from typing import TYPE_CHECKING
 
@@ -7,10 +7,70 @@ import pytest
 from logseq_analyzer.analysis.namespaces import LogseqNamespaces
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
 
 
 @pytest.fixture
 def logseq_namespaces(file_index: FileIndex) -> LogseqNamespaces:
     """Fixture for LogseqNamespaces."""
     return LogseqNamespaces(file_index, dangling_links=set())
+
+
+def test_namespace_trie_rollups(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test the namespace trie rollups and namespace query sizing."""
+    ctx = make_context("graph")
+    contents = {
+        "Proj.md": "- root\n",
+        "Proj___A.md": "- one\n- two\n",
+        "Proj___A___X.md": "- three\n",
+        "Proj___B.md": "- {{namespace [[proj]]}}\n",
+    }
+    index = make_index(ctx, contents)
+
+    namespaces = LogseqNamespaces(index, dangling_links=set())
+    nodes = namespaces.structure.nodes
+    assert namespaces.structure.root.as_tree() == {"Proj": {"A": {"X": {}}, "B": {}}}
+    assert nodes["proj"].direct_children == 2
+    assert nodes["proj"].descendants == 3
+    assert nodes["proj/a"].descendants == 1
+    assert nodes["proj"].total_bullets == sum(f.info.bullet.bullets for f in index)
+    assert nodes["proj"].total_size == sum(len(c) for c in contents.values())
+    query = namespaces.queries["{{namespace [[proj]]}}"]
+    assert query["size"] == 3
+    assert query["total_size"] == nodes["proj"].total_size
+
+
+def test_namespace_trie_repeated_parts(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that a part repeated at several levels of one page gets a node per level."""
+    ctx = make_context("graph")
+    index = make_index(ctx, {"a___b.md": "- one\n", "a___b___a.md": "- two\n- three\n- four\n"})
+    files = {f.path.name: f for f in index}
+
+    namespaces = LogseqNamespaces(index, dangling_links=set())
+    nodes = namespaces.structure.nodes
+    assert namespaces.structure.root.as_tree() == {"a": {"b": {"a": {}}}}
+    for name in ("a/b", "a/b/a"):
+        assert (nodes[name].size, nodes[name].bullets) == (files[name].info.size.size, files[name].info.bullet.bullets)
+    assert nodes["a/b"].size != nodes["a/b/a"].size
+
+
+def test_parent_depth_conflicts(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that parts appearing at several depths are reported with their parent prefixes."""
+    ctx = make_context("graph")
+    names = ("Archive___2024.md", "Work___Archive.md", "Home___Archive___Old.md", "Work___Notes.md")
+    index = make_index(ctx, dict.fromkeys(names, "- text\n"))
+
+    conflicts = LogseqNamespaces(index, dangling_links=set()).conflicts
+    assert set(conflicts.parent_depth) == {("Archive", 1), ("Archive", 2)}
+    assert conflicts.parent_depth["Archive", 1] == ["Archive/2024"]
+    assert sorted(conflicts.parent_depth["Archive", 2]) == ["Home/Archive/Old", "Work/Archive"]
+    assert conflicts.parent_unique["Archive", 2] == {"Work/Archive", "Home/Archive"}
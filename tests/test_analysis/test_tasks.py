@@ -0,0 +1,56 @@
+"""Tests for LogseqTasks."""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.analysis.tasks import LogseqTasks
+from logseq_analyzer.utils.enums import CritTask
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def test_tasks(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test task markers, priorities, overdue detection and deadline load, ignoring tasks in code."""
+    ctx = make_context("graph")
+    content = (
+        "- TODO [#A] write report\n"
+        "  DEADLINE: <2024-01-10 Wed>\n"
+        "- DOING review\n"
+        "  SCHEDULED: <2024-01-20 Sat .+1w>\n"
+        "- DONE ship [#b]\n"
+        "  DEADLINE: <2024-01-01 Mon>\n"
+        "- LATER plan\n"
+        "  DEADLINE: <2024-01-10 Wed>\n"
+        "- NOW call\n"
+        "  SCHEDULED: <2024-01-12 Fri>\n"
+        "- TODOS is not a marker\n"
+        "- ```markdown\n"
+        "- TODO [#C] example in a code block\n"
+        "  DEADLINE: <2024-01-01 Mon>\n"
+        "```\n"
+        "- `TODO [#C]` inline code\n"
+    )
+    index = make_index(ctx, {"work.md": content})
+    f = index["work"][0]
+
+    assert f.data[CritTask.MARKERS] == ["TODO", "DOING", "DONE", "LATER", "NOW"]
+    assert f.data[CritTask.PRIORITIES] == ["A", "B"]
+
+    now_ts = datetime(2024, 1, 15, tzinfo=UTC).timestamp()
+    tasks = LogseqTasks(index, now_ts)
+    assert tasks.markers["TODO"]["count"] == 1
+    assert list(tasks.priorities) == ["A", "B"]
+    assert tasks.priorities["B"]["found_in"] == {"work": 1}
+    assert tasks.deadline_load == {"2024-01-10": 2}
+    assert tasks.scheduled_load == {"2024-01-12": 1, "2024-01-20": 1}
+    assert [(t["marker"], t["days_past"]) for t in tasks.overdue["work"]] == [("TODO", 5), ("LATER", 5)]
+    assert tasks.scheduled_past == {"work": [{"date": "2024-01-12", "marker": "NOW", "days_past": 3}]}
+    assert tasks.summary["tasks"] == 5
+    assert tasks.summary["open"] == 4
+    assert tasks.summary["closed"] == 1
+    assert tasks.summary["overdue"] == 2
+    assert tasks.summary["scheduled_past"] == 1
@@ -0,0 +1,82 @@
+"""Tests for TextIndex."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logseq_analyzer.analysis.text_index import TextIndex, intersect, tokenize
+from logseq_analyzer.utils.enums import TargetDir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+@pytest.fixture
+def graph(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> tuple[AnalyzerContext, FileIndex, TextIndex]:
+    """Fixture for an indexed graph with two pages."""
+    ctx = make_context("graph")
+    contents = {
+        "Garden.md": "- Planting tomatoes in spring\n- Water the roses daily\n",
+        "Kitchen.md": "- Tomatoes and basil sauce\n- Spring cleaning the oven\n",
+    }
+    index = make_index(ctx, contents)
+    text_index = TextIndex()
+    text_index.sync(index)
+    return ctx, index, text_index
+
+
+def test_tokenize() -> None:
+    """Test tokens are casefolded words."""
+    assert tokenize("Hello, World! [[Page-Ref]]") == ["hello", "world", "page", "ref"]
+
+
+def test_intersect() -> None:
+    """Test the galloping intersection of sorted keys against a set intersection."""
+    large = list(range(0, 3000, 3))
+    for small in ([], [0], [2999], [1, 3, 6, 2000, 2997, 5000], list(range(0, 3000, 7))):
+        assert intersect(small, large) == sorted(set(small) & set(large))
+        assert intersect(large, small) == sorted(set(small) & set(large))
+
+
+def test_boolean_queries(graph: tuple[AnalyzerContext, FileIndex, TextIndex]) -> None:
+    """Test AND, OR and NOT queries."""
+    _, index, text_index = graph
+    assert text_index.search("tomatoes", index) == [("Garden", 1), ("Kitchen", 1)]
+    assert text_index.search("tomatoes spring", index) == [("Garden", 1)]
+    assert text_index.search("roses OR oven", index) == [("Garden", 2), ("Kitchen", 2)]
+    assert text_index.search("tomatoes -basil", index) == [("Garden", 1)]
+    assert text_index.search("tomatoes NOT planting", index) == [("Kitchen", 1)]
+    assert text_index.search("missing", index) == []
+
+
+def test_phrase_queries(graph: tuple[AnalyzerContext, FileIndex, TextIndex]) -> None:
+    """Test phrase queries require consecutive tokens."""
+    _, index, text_index = graph
+    assert text_index.search('"spring cleaning"', index) == [("Kitchen", 2)]
+    assert text_index.search('"cleaning spring"', index) == []
+
+
+def test_incremental_update(
+    graph: tuple[AnalyzerContext, FileIndex, TextIndex], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test modified files replace their postings and deleted files are dropped."""
+    ctx, index, text_index = graph
+    page = ctx.graph_dir / TargetDir.PAGE / "Garden.md"
+    make_index(ctx, {page.name: "- Harvesting pumpkins\n"}, index=index)
+    text_index.add_file(index[page])
+    assert text_index.search("tomatoes", index) == [("Kitchen", 1)]
+    assert text_index.search("pumpkins", index) == [("Garden", 1)]
+
+    index.remove(page)
+    text_index.sync(index)
+    assert text_index.search("pumpkins", index) == []
+    assert text_index.search("tomatoes", index) == [("Kitchen", 1)]
+    assert len(text_index) == 1
+    assert not text_index.retired
+    assert text_index.names == ["Kitchen"]
+    assert text_index.paths == [str(ctx.graph_dir / TargetDir.PAGE / "Kitchen.md")]
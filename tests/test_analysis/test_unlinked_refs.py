@@ -0,0 +1,35 @@
+"""Tests for LogseqUnlinkedReferences."""
+
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.analysis.unlinked_refs import LogseqUnlinkedReferences
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def test_unlinked_references_empty(file_index: FileIndex) -> None:
+    """Test an empty index yields no unlinked references."""
+    assert LogseqUnlinkedReferences(file_index, aliases=set()).unlinked_refs == {}
+
+
+def test_unlinked_references(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that only plain-text, whole-word mentions outside links and code are reported."""
+    ctx = make_context("graph")
+    contents = {
+        "Alpha.md": "alias:: first letter\n- about Alpha itself\n",
+        "Beta.md": "- [[Alpha]] and #alpha are linked\n- `alpha` is code\n- but alpha and First Letter are not\n",
+        "Gamma.md": "- alphabet, beta!\n",
+    }
+    index = make_index(ctx, contents)
+
+    refs = LogseqUnlinkedReferences(index, aliases={"first letter"}).unlinked_refs
+    assert set(refs) == {"Alpha", "first letter", "Beta"}
+    assert refs["Alpha"]["found_in"] == {"Beta": 1}
+    assert refs["first letter"]["found_in"] == {"Beta": 1}
+    assert refs["Beta"]["found_in"] == {"Gamma": 1}
@@ -150,6 +150,40 @@ def test_set_cli_args_missing_required(monkeypatch: pytest.MonkeyPatch, args_ins
         args_instance.set_cli_args()
 
 
+@pytest.mark.parametrize(
+    ("extra", "message"),
+    [
+        (["--compression", "gzip", "--compression-level", "10"], "must be between 0 and 9"),
+        (["--compression", "lzma", "--compression-level", "-1"], "must be between 0 and 9"),
+        (["--compression-level", "3"], "requires --compression"),
+    ],
+)
+def test_set_cli_args_invalid_compression_level(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    args_instance: Args,
+    extra: list[str],
+    message: str,
+) -> None:
+    """Test that out-of-range compression levels are rejected while parsing."""
+    monkeypatch.setattr(sys, "argv", ["script_name", "--graph-folder", "/graph", *extra])
+
+    with pytest.raises(SystemExit):
+        args_instance.set_cli_args()
+    assert message in capsys.readouterr().err
+
+
+def test_set_cli_args_compression_level(monkeypatch: pytest.MonkeyPatch, args_instance: Args) -> None:
+    """Test that an in-range compression level is accepted."""
+    monkeypatch.setattr(
+        sys, "argv", ["script_name", "-g", "/graph", "--compression", "gzip", "--compression-level", "0"]
+    )
+
+    args_instance.set_cli_args()
+
+    assert (args_instance.compression, args_instance.compression_level) == ("gzip", 0)
+
+
 def test_report(args_instance: Args) -> None:
     """Test the report generation."""
     report = args_instance.report[Output.ARGUMENTS]
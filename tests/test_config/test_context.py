@@ -0,0 +1,39 @@
+"""Tests for AnalyzerContext."""
+
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.utils.enums import Constant, Core, FileType, TargetDir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def test_context_derived_settings(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test the settings derived from the configuration."""
+    ctx = make_context("graph")
+    assert ctx.ns_file_sep == Core.NS_FILE_SEP_TRIPLE_LOWBAR
+    assert ctx.journal_dir == TargetDir.JOURNAL
+    assert ctx.graph_dir.name == "graph"
+    assert ctx.file_type_map[TargetDir.PAGE] == (FileType.PAGE, FileType.SUB_PAGE)
+
+
+def test_contexts_are_independent(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that two graphs can be processed side by side without shared state."""
+    ctx_a = make_context("graph_a")
+    ctx_b = make_context("graph_b")
+    index_a = make_index(ctx_a, {"alpha___beta.md": "- [[gamma]]\n"})
+    index_b = make_index(ctx_b, {"gamma.md": "- text\n"})
+
+    assert index_a is not index_b
+    assert "alpha/beta" in index_a
+    assert "alpha/beta" not in index_b
+    assert "gamma" in index_b
+    assert index_a[ctx_a.graph_dir / TargetDir.PAGE / "alpha___beta.md"].path.file_type == FileType.PAGE
+    assert ctx_a.output_dir != ctx_b.output_dir
+    assert ctx_a.cache_file != ctx_b.cache_file
+    assert ctx_a.cache_file.is_relative_to(ctx_a.graph_dir.parent / Constant.CACHE_DIR)
@@ -0,0 +1,82 @@
+"""Tests for ReportBundle."""
+
+import json
+import sqlite3
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.io.bundle import ReportBundle
+from logseq_analyzer.io.manifest import OutputManifest
+from logseq_analyzer.utils.enums import Constant, Format
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.config.context import AnalyzerContext
+
+REPORTS = {
+    "graph": {"all_refs": {"Page A": ["Page B"], "Page B": []}, "orphans": {"Page C"}},
+    "summary_files/general": {"empty": [], "total": 3},
+}
+
+
+def write_bundle(ctx: AnalyzerContext) -> None:
+    """Write the test reports as one bundle over two stages."""
+    for subdir, reports in REPORTS.items():
+        bundle = ReportBundle(ctx)
+        bundle.add(subdir, reports)
+        bundle.write()
+
+
+def test_sqlite_bundle(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that reports are written to one table per family with a catalog."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.SQLITE
+    write_bundle(ctx)
+
+    with closing(sqlite3.connect(ctx.output_dir / f"{Constant.REPORT_BUNDLE}.sqlite")) as con:
+        rows = con.execute('SELECT report, position, name, value FROM "graph" WHERE name = ?', ("Page A",)).fetchall()
+        assert rows == [("all_refs", 0, "Page A", '["Page B"]')]
+        assert con.execute('SELECT value FROM "summary_files_general" WHERE report = ?', ("total",)).fetchall() == [
+            ("3",)
+        ]
+        catalog = con.execute("SELECT family, report, rows FROM report_catalog ORDER BY report").fetchall()
+        assert catalog == [
+            ("graph", "all_refs", 2),
+            ("summary_files_general", "empty", 0),
+            ("graph", "orphans", 1),
+            ("summary_files_general", "total", None),
+        ]
+        indexes = {row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"graph_name", "graph_report"} <= indexes
+
+
+def test_jsonl_bundle(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that reports are appended to one JSON Lines file."""
+    ctx = make_context("graph")
+    ctx.args.report_format = ".jsonl"
+    write_bundle(ctx)
+
+    lines = (ctx.output_dir / f"{Constant.REPORT_BUNDLE}.jsonl").read_text(encoding="utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert rows[0] == {"family": "graph", "report": "all_refs", "position": 0, "name": "Page A", "value": ["Page B"]}
+    assert rows[2] == {"family": "graph", "report": "orphans", "position": 0, "name": "Page C", "value": "Page C"}
+    assert rows[-1]["family"] == "summary_files_general"
+    assert len(rows) == 4
+
+
+def test_jsonl_bundle_replaced_on_rerun(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that with a manifest a re-run replaces the bundle instead of appending to it."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.JSONL
+    for _ in range(2):
+        manifest = OutputManifest(ctx.output_dir)
+        for subdir, reports in REPORTS.items():
+            bundle = ReportBundle(ctx, manifest)
+            bundle.add(subdir, reports)
+            bundle.write()
+        manifest.finalize()
+
+    lines = (ctx.output_dir / f"{Constant.REPORT_BUNDLE}.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+    assert manifest.current[Constant.REPORT_BUNDLE]["count"] == 4
@@ -1,22 +1,24 @@
 """Test Cache class."""
 
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
 from logseq_analyzer.analysis.index import FileIndex
-from logseq_analyzer.io.cache import Cache
-from logseq_analyzer.utils.enums import Constant
+from logseq_analyzer.analysis.text_index import INDEX_VERSION, TextIndex
+from logseq_analyzer.io.cache import Cache, CacheKey
+from logseq_analyzer.utils.enums import TargetDir
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+    from logseq_analyzer.config.context import AnalyzerContext
 
 
 @pytest.fixture
-def cache() -> Generator[Cache]:
-    """Fixture to create a Cache object."""
-    cache = Cache(Path(Constant.CACHE_FILE))
+def cache(make_context: Callable[[str], AnalyzerContext]) -> Generator[Cache]:
+    """Fixture to create a Cache object in the cache file of a graph."""
+    cache = Cache(make_context("graph").cache_file)
     cache.open()
     yield cache
     cache.close(FileIndex())
@@ -26,3 +28,29 @@ def test_cache_initialization(cache: Cache) -> None:
     """Test the initialization of the Cache class."""
     assert cache.cache_path.exists()
     assert cache.cache is not None
+
+
+def test_modification_times_saved_on_close(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that processed files only count as unchanged once the cache was closed with their index."""
+    ctx = make_context("graph")
+    (ctx.graph_dir / TargetDir.PAGE / "page.md").write_text("- text\n", encoding="utf-8")
+    cache = Cache(ctx.cache_file)
+    cache.open()
+    assert [path.name for path in cache.iter_modified_files(ctx)] == ["page.md"]
+    assert CacheKey.MOD_TRACKER not in cache.cache
+    cache.cache.close()
+
+    cache.open()
+    assert [path.name for path in cache.iter_modified_files(ctx)] == ["page.md"]
+    cache.close(FileIndex())
+    cache.open()
+    assert list(cache.iter_modified_files(ctx)) == []
+    cache.close(FileIndex())
+
+
+def test_text_index_in_older_layout_is_rebuilt(cache: Cache) -> None:
+    """Test that a cached full-text index is only reused in the current layout."""
+    cache.cache[CacheKey.TEXT_INDEX] = TextIndex(names=["kept"])
+    assert cache.load_text_index().names == ["kept"]
+    cache.cache[CacheKey.TEXT_INDEX] = TextIndex(names=["stale"], version=INDEX_VERSION - 1)
+    assert cache.load_text_index().names == []
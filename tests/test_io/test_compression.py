@@ -0,0 +1,48 @@
+"""Tests for ReportCompression."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logseq_analyzer.io.compression import ReportCompression, available_compressions
+from logseq_analyzer.io.report_writer import ReportWriter
+from logseq_analyzer.utils.enums import Compression, Format
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+@pytest.mark.parametrize("method", available_compressions())
+def test_compressed_report_roundtrip(make_context: Callable[[str], AnalyzerContext], method: str) -> None:
+    """Test that compressed reports get the codec suffix and read back unchanged."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.JSON
+    ctx.args.compression = method
+    ctx.args.compression_level = 1
+    data = {"page": ["line"] * 1000}
+    ReportWriter("pages", data, "out").write(ctx)
+
+    compression = ReportCompression(method)
+    path = ctx.output_dir / "out" / f"pages.json{compression.suffix}"
+    plain_size = len(ReportCompression.open_read(path).read().encode())
+    assert path.stat().st_size * 10 < plain_size
+    with ReportCompression.open_read(path) as f:
+        assert f.read().startswith('{\n    "page": [\n        "line",')
+
+
+def test_plain_and_invalid_compression(tmp_path: Path) -> None:
+    """Test that no compression writes plain files and unknown methods are rejected."""
+    compression = ReportCompression(Compression.NONE)
+    assert not compression.suffix
+    with compression.open(tmp_path / "report.txt") as f:
+        f.write("text")
+    assert ReportCompression.open_read(tmp_path / "report.txt").read() == "text"
+    with pytest.raises(ValueError, match="Unsupported compression method"):
+        ReportCompression("brotli")
+    with pytest.raises(ValueError, match="Unsupported compression level"):
+        ReportCompression(Compression.GZIP, 10)
+    with pytest.raises(ValueError, match="Unsupported compression level"):
+        ReportCompression(Compression.NONE, 1)
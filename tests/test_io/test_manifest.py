@@ -0,0 +1,141 @@
+"""Tests for OutputManifest."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import logseq_analyzer
+from logseq_analyzer.io.compression import ReportCompression
+from logseq_analyzer.io.filesystem import OutputDirectory
+from logseq_analyzer.io.manifest import OutputManifest
+from logseq_analyzer.io.report_writer import ReportBatch
+from logseq_analyzer.utils.enums import Constant, Format
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    import pytest
+
+    from logseq_analyzer.config.context import AnalyzerContext
+
+# Writes reports built from set iteration order and ranking ties, printing the written and skipped counts.
+REPORT_SCRIPT = """
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from logseq_analyzer.analysis.graph_metrics import LogseqGraphMetrics
+from logseq_analyzer.config.arguments import Args
+from logseq_analyzer.io.manifest import OutputManifest
+from logseq_analyzer.io.report_writer import ReportBatch
+from logseq_analyzer.utils.helpers import sort_dict_by_value
+
+names = {f"page {i}" for i in range(50)}
+refs = {name: {"count": 1, "found_in": {"hub": 1}} for name in names}
+ctx = SimpleNamespace(args=Args(report_format=".json"), output_dir=Path(sys.argv[1]))
+manifest = OutputManifest(ctx.output_dir)
+batch = ReportBatch(ctx, manifest)
+batch.add("graph", LogseqGraphMetrics([], refs).report)
+batch.add("summary", {"names": names, "counts": sort_dict_by_value(dict.fromkeys(names, 1))})
+batch.write()
+manifest.finalize()
+print(json.dumps([manifest.written, manifest.skipped]))
+"""
+
+
+def run_reports(ctx: AnalyzerContext, reports: dict[str, dict[str, Any]]) -> OutputManifest:
+    """Write the reports of one run with a manifest and finalize it."""
+    manifest = OutputManifest(ctx.output_dir)
+    batch = ReportBatch(ctx, manifest)
+    for subdir, subdir_reports in reports.items():
+        batch.add(subdir, subdir_reports)
+    batch.write()
+    manifest.finalize()
+    return manifest
+
+
+def test_manifest_skips_unchanged_and_removes_stale(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that a re-run skips unchanged reports, rewrites changed ones and deletes stale files."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.TXT
+    out = ctx.output_dir
+    first = run_reports(ctx, {"a": {"same": [1, 2], "changed": {"k": 1}}, "old": {"gone": [1]}})
+    assert (first.written, first.skipped) == (3, 0)
+    same_mtime = (out / "a" / "same.txt").stat().st_mtime_ns
+
+    second = run_reports(ctx, {"a": {"same": [1, 2], "changed": {"k": 2}}})
+    assert (second.written, second.skipped) == (1, 1)
+    assert (out / "a" / "same.txt").stat().st_mtime_ns == same_mtime
+    assert "2" in (out / "a" / "changed.txt").read_text(encoding="utf-8")
+    assert not (out / "old").exists()
+    assert set(second.current) == {"a/same", "a/changed"}
+
+    ctx.args.report_format = Format.JSON
+    third = run_reports(ctx, {"a": {"same": [1, 2], "changed": {"k": 2}}})
+    assert third.written == 2
+    assert sorted(p.name for p in (out / "a").iterdir()) == ["changed.json", "same.json"]
+
+
+def test_manifest_never_opens_unchanged_reports(
+    make_context: Callable[[str], AnalyzerContext], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a re-run opens no file for an unchanged report, its HTML data pages included."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.HTML
+    reports = {"html": {"refs": {f"page {i}": [i] for i in range(1200)}, "small": {"a": 1}}}
+    run_reports(ctx, reports)
+    files = sorted(p for p in (ctx.output_dir / "html").rglob("*") if p.is_file())
+    assert len(files) == 5
+    before = [(p.stat().st_ino, p.stat().st_mtime_ns) for p in files]
+
+    opened: list[Path] = []
+    open_report = ReportCompression.open
+
+    def spy(self: ReportCompression, path: Path, *args: Any, **kwargs: Any) -> Any:
+        opened.append(path)
+        return open_report(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(ReportCompression, "open", spy)
+    second = run_reports(ctx, reports)
+    assert (second.written, second.skipped) == (0, 2)
+    assert opened == []
+    assert [(p.stat().st_ino, p.stat().st_mtime_ns) for p in files] == before
+    assert not list(ctx.output_dir.rglob("*.tmp*"))
+
+
+def test_manifest_unchanged_across_processes(tmp_path: Path) -> None:
+    """Test that a run in a process with another hash seed rewrites no report."""
+    out = tmp_path / "output"
+    out.mkdir()
+    repo = Path(logseq_analyzer.__file__).parents[1]
+
+    def run(seed: str) -> list[int]:
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        cmd = [sys.executable, "-c", REPORT_SCRIPT, str(out)]
+        result = subprocess.run(cmd, cwd=repo, env=env, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    written, skipped = run("1")
+    assert written
+    assert skipped == 0
+    assert run("2") == [0, written]
+    assert not list(out.rglob("*.tmp"))
+
+
+def test_output_directory_kept_with_manifest(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that the output directory is only cleaned when it has no manifest."""
+    ctx = make_context("graph")
+    out = ctx.output_dir
+    (out / "report.txt").write_text("report", encoding="utf-8")
+    OutputDirectory(out)
+    assert not (out / "report.txt").exists()
+
+    (out / "report.txt").write_text("report", encoding="utf-8")
+    (out / Constant.OUTPUT_MANIFEST).write_text('{"version": 1, "reports": {}}', encoding="utf-8")
+    OutputDirectory(out)
+    assert (out / "report.txt").exists()
@@ -1,8 +1,24 @@
 """Test the ReportWriter class."""
 
+import json
+import re
+from collections import Counter
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote
+
 import pytest
 
-from logseq_analyzer.io.report_writer import ReportWriter
+from logseq_analyzer.analysis.journals import JournalSets
+from logseq_analyzer.io.html_template import HTML_SCRIPT
+from logseq_analyzer.io.report_writer import ReportBatch, ReportWriter, StreamingJSONEncoder
+from logseq_analyzer.utils.enums import Compression, Format
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
 
 
 @pytest.fixture
@@ -29,3 +45,115 @@ def test_report_writer_init(report_writer: ReportWriter) -> None:
         "key4": {"set_item1", "set_item2"},
     }
     assert report_writer.subdir == "test"
+
+
+def test_report_batch_write(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that a batch writes every report into its pre-created subdirectory."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.TXT
+    batch = ReportBatch(ctx, max_workers=4)
+    batch.add("first", {"a": [1, 2], "b": {}})
+    batch.add("second", {"c": {"x": 1}})
+    batch.write()
+
+    assert not batch.reports
+    assert (ctx.output_dir / "first" / "a.txt").exists()
+    assert (ctx.output_dir / "first" / "(EMPTY) b.txt").exists()
+    assert (ctx.output_dir / "second" / "c.txt").read_text(encoding="utf-8").startswith("c | c.txt")
+
+
+def test_report_batch_aggregates_errors(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that failed writes are collected into one ExceptionGroup after the batch finishes."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.TXT
+    batch = ReportBatch(ctx)
+    batch.add("reports", {"bad1": {"k": 1}, "good": [1], "bad2": {"k": 2}})
+    (ctx.output_dir / "reports" / "bad1.txt").mkdir(parents=True)
+    (ctx.output_dir / "reports" / "bad2.txt").mkdir()
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        batch.write()
+    assert len(exc_info.value.exceptions) == 2
+    assert (ctx.output_dir / "reports" / "good.txt").exists()
+
+
+def test_streaming_json_encoder() -> None:
+    """Test that analyzer types are encoded natively and JSON types match the json module."""
+    plain = {"a": [1, 2.5, None, True], "b": {"c": "é"}, "d": [], "e": {}}
+    encoder = StreamingJSONEncoder()
+    assert "".join(encoder.iterencode(plain)) == json.dumps(plain, indent=4, ensure_ascii=False)
+    assert "".join(StreamingJSONEncoder(indent=None).iterencode(plain)) == json.dumps(plain, ensure_ascii=False)
+
+    data = {
+        ("Archive", 1): {"b", "a"},
+        "counter": Counter({"x": 2}),
+        "when": datetime(2024, 1, 2, tzinfo=UTC),
+        "day": date(2024, 1, 2),
+        "format": Format.JSON,
+        "timeline": JournalSets(existing=[date(2024, 1, 1)]),
+    }
+    decoded = json.loads("".join(encoder.iterencode(data)))
+    assert decoded["('Archive', 1)"] == ["a", "b"]
+    assert decoded["counter"] == {"x": 2}
+    assert decoded["when"] == "2024-01-02T00:00:00+00:00"
+    assert decoded["day"] == "2024-01-02"
+    assert decoded["format"] == "json"
+    assert decoded["timeline"]["existing"] == ["2024-01-01"]
+
+    circular: list[Any] = []
+    circular.append(circular)
+    with pytest.raises(ValueError, match="Circular reference"):
+        "".join(encoder.iterencode(circular))
+
+
+def test_json_report(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test that JSON reports are written for a dotted report format and contain LogseqFile entries."""
+    ctx = make_context("graph")
+    ctx.args.report_format = ".json"
+    f = next(iter(make_index(ctx, {"page.md": "- text\n"})))
+    page = f.path.file
+    ReportWriter("files", {"files": {f}, "data": {f: f.data}}, "json").write(ctx)
+
+    decoded = json.loads((ctx.output_dir / "json" / "files.json").read_text(encoding="utf-8"))
+    assert decoded == {"files": [{"name": "page", "path": str(page)}], "data": {str(page): {}}}
+
+
+def test_paginated_html_report(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that large HTML reports are split into data pages and values are escaped."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.HTML
+    data = {f"page {i}": [i] for i in range(1200)}
+    data["page 0"] = ["</script><b>bold</b>"]
+    ReportWriter("<refs>", data, "html").write(ctx)
+    ReportWriter("small", {"a": 1}, "html").write(ctx)
+
+    out = ctx.output_dir / "html"
+    shell = (out / "<refs>.html").read_text(encoding="utf-8")
+    assert "<title>&lt;refs&gt;</title>" in shell
+    assert '"pages": 3' in shell
+    assert 'id="report-rows">' not in shell
+    pages = sorted(p.name for p in (out / "<refs>.html.data").iterdir())
+    assert pages == ["page-1.js", "page-2.js", "page-3.js"]
+    first = (out / "<refs>.html.data" / "page-1.js").read_text(encoding="utf-8")
+    assert first.startswith('logseqReportPage(1, [["page 0", ["</script><b>bold</b>"]], ["page 1", [1]]')
+    assert first.endswith(");\n")
+
+    small = (out / "small.html").read_text(encoding="utf-8")
+    assert '<script type="application/json" id="report-rows">[["a", 1]]</script>' in small
+    assert not (out / "small.html.data").exists()
+
+
+def test_html_pages_ignore_compression(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that with compression on, the data page URLs of the HTML shell match the files written."""
+    ctx = make_context("graph")
+    ctx.args.report_format = Format.HTML
+    ctx.args.compression = Compression.GZIP
+    ReportWriter("refs", {f"page {i}": i for i in range(600)}, "html").write(ctx)
+
+    out = ctx.output_dir / "html"
+    shell = (out / "refs.html").read_text(encoding="utf-8")
+    meta = json.loads(re.search(r'id="report-meta">(.*?)</script>', shell).group(1))
+    url = re.search(r"script\.src = `(.*?)`", HTML_SCRIPT).group(1)
+    for page in range(1, meta["pages"] + 1):
+        src = url.replace("${meta.dataDir}", meta["dataDir"]).replace("${page}", str(page))
+        assert (out / unquote(src)).read_text(encoding="utf-8").startswith(f"logseqReportPage({page}, ")
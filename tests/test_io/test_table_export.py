@@ -0,0 +1,59 @@
+"""Tests for TableExport."""
+
+import csv
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.io.compression import ReportCompression
+from logseq_analyzer.io.manifest import OutputManifest
+from logseq_analyzer.io.table_export import DATA_COLUMNS, FILE_COLUMNS, TableExport
+from logseq_analyzer.utils.enums import Compression, Format, OutputDir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def test_table_export(make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]) -> None:
+    """Test that the files and file data tables stream one row per file and per data occurrence."""
+    ctx = make_context("graph")
+    contents = {
+        "ns___child.md": "- child\n",
+        "ns___child___ns.md": "- repeated part\n",
+        "work.md": '- TODO plan [[Page A]] #tag\n  DEADLINE: <2024-01-10 Wed>\n- quote "x", y\n',
+    }
+    index = make_index(ctx, contents)
+    ctx.args.table_format = Format.TSV
+    ctx.args.compression = Compression.GZIP
+    manifest = OutputManifest(ctx.output_dir)
+    TableExport(ctx, index, manifest).write()
+
+    table_dir = ctx.output_dir / OutputDir.TABLES
+    with ReportCompression.open_read(table_dir / "files.tsv.gz") as f:
+        files = list(csv.DictReader(f, dialect=csv.excel_tab))
+    assert list(files[0]) == list(FILE_COLUMNS)
+    rows = {row["name"]: row for row in files}
+    assert rows["ns/child"]["namespace_depth"] == "2"
+    assert rows["ns/child"]["is_namespace"] == "True"
+    assert rows["ns/child/ns"]["namespace_depth"] == "3"
+    assert rows["work"]["namespace_depth"] == "1"
+    assert rows["work"]["file_type"] == "page"
+    assert rows["work"]["has_backlinks"] == "True"
+
+    with ReportCompression.open_read(table_dir / "file_data.tsv.gz") as f:
+        reader = csv.reader(f, dialect=csv.excel_tab)
+        assert tuple(next(reader)) == DATA_COLUMNS
+        data = [tuple(row[2:]) for row in reader if row[1] == "work"]
+    assert ("content_page_reference", "0", "Page A", "") in data
+    assert ("task_deadlines", "0", "2024-01-10", "TODO") in data
+    assert manifest.current["tables/files"]["count"] == 3
+    assert manifest.current["tables/file_data"]["file"] == "tables/file_data.tsv.gz"
+
+
+def test_occurrences() -> None:
+    """Test that mappings, sets and pairs become (value, detail) pairs."""
+    assert list(TableExport.occurrences({"id": 1})) == [("id", 1)]
+    assert list(TableExport.occurrences({"b", "a"})) == [("a", None), ("b", None)]
+    assert list(TableExport.occurrences([("2024-01-10", "TODO"), "x"])) == [("2024-01-10", "TODO"), ("x", None)]
+    assert list(TableExport.occurrences(3)) == [(3, None)]
@@ -0,0 +1,27 @@
+"""Unit tests for the AhoCorasick automaton."""
+
+import pytest
+
+from logseq_analyzer.utils.aho_corasick import AhoCorasick
+
+
+@pytest.mark.parametrize(
+    ("patterns", "text", "expected"),
+    [
+        (["he", "she", "his", "hers"], "ushers", [(1, "she"), (2, "he"), (2, "hers")]),
+        (["a", "aa"], "aaa", [(0, "a"), (0, "aa"), (1, "a"), (1, "aa"), (2, "a")]),
+        (["abc"], "xyz", []),
+        (["", "x"], "x", [(0, "x")]),
+        ([], "anything", []),
+    ],
+)
+def test_iter_matches(patterns: list[str], text: str, expected: list[tuple[int, str]]) -> None:
+    """Test that every occurrence of every pattern is reported with its start index."""
+    assert sorted(AhoCorasick(patterns).iter_matches(text)) == sorted(expected)
+
+
+def test_find_all_matches_substring_semantics() -> None:
+    """Test that find_all agrees with a naive substring check."""
+    patterns = ["pic", "picture", "ture", "png", "nope"]
+    text = "../assets/picture.png"
+    assert AhoCorasick(patterns).find_all(text) == {p for p in patterns if p in text}
@@ -0,0 +1,43 @@
+"""Unit tests for date_utilities.py module."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from logseq_analyzer.utils.date_utilities import DateUtilities
+
+
+@pytest.mark.parametrize(
+    ("key", "py_format", "expected"),
+    [
+        ("2024_01_05", "%Y_%m_%d", datetime(2024, 1, 5, tzinfo=UTC)),
+        ("Jan 5, 2024", "%b %#d, %Y", datetime(2024, 1, 5, tzinfo=UTC)),
+        ("Jan 5th, 2024", "%b %#d, %Y", datetime(2024, 1, 5, tzinfo=UTC)),
+        ("august 21st, 2023", "%B %#d, %Y", datetime(2023, 8, 21, tzinfo=UTC)),
+        ("Mon, 01/01/24", "%a, %m/%d/%y", datetime(2024, 1, 1, tzinfo=UTC)),
+        ("2024-060", "%Y-%j", datetime(2024, 2, 29, tzinfo=UTC)),
+        ("Feb 30, 2024", "%b %#d, %Y", None),
+        ("Project Notes", "%b %#d, %Y", None),
+        ("2024_01_05 extra", "%Y_%m_%d", None),
+    ],
+)
+def test_parse_date(key: str, py_format: str, expected: datetime | None) -> None:
+    """Test parsing dates with formats compiled to regexes."""
+    assert DateUtilities.parse_date(key, py_format) == expected
+
+
+def test_parse_date_matches_strptime() -> None:
+    """Test the compiled parser agrees with strptime for plain formats."""
+    py_format = "%Y_%m_%d"
+    for key in ("2020_02_29", "1999_12_31", "2024_7_4"):
+        expected = datetime.strptime(key, py_format).replace(tzinfo=UTC)
+        assert DateUtilities.parse_date(key, py_format) == expected
+
+
+def test_journals_to_datetime_skips_non_dates() -> None:
+    """Test that non-date keys are skipped."""
+    keys = ["Jan 1st, 2024", "Ideas", "Dec 31, 2023"]
+    assert list(DateUtilities.journals_to_datetime(keys, "%b %#d, %Y")) == [
+        datetime(2024, 1, 1, tzinfo=UTC),
+        datetime(2023, 12, 31, tzinfo=UTC),
+    ]
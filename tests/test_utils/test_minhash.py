@@ -0,0 +1,62 @@
+"""Unit tests for minhash.py module."""
+
+from array import array
+
+import pytest
+
+from logseq_analyzer.utils.minhash import MinHashLSH
+
+TEXT = [f"word{i}" for i in range(40)]
+
+
+def test_minhash_identical_and_disjoint() -> None:
+    """Test similarity estimates for identical and unrelated token sequences."""
+    lsh = MinHashLSH()
+    a = lsh.add(TEXT)
+    b = lsh.add(list(TEXT))
+    c = lsh.add([f"other{i}" for i in range(40)])
+    assert lsh.similarity(a, b) == 1.0
+    assert lsh.similarity(a, c) < 0.5
+    assert lsh.clusters() == [[a, b]]
+
+
+def test_minhash_near_duplicates_cluster() -> None:
+    """Test that a small edit still lands in the same cluster."""
+    lsh = MinHashLSH(threshold=0.6)
+    a = lsh.add(TEXT)
+    b = lsh.add([*TEXT[:-1], "tomorrow"])
+    assert lsh.clusters() == [[a, b]]
+    assert len(lsh) == 2
+
+
+def test_minhash_bucket_checks_every_pair() -> None:
+    """Test that two similar items are clustered when the first item of their only shared bucket is unrelated."""
+    lsh = MinHashLSH(threshold=0.75)
+    shared = [1, 2, 3, 4]
+    similar = [200 + i for i in range(28)]
+    variant = [999 + i if i % 4 == 0 else value for i, value in enumerate(similar)]
+    lsh.signatures = [
+        array("I", shared + [100 + i for i in range(28)]),
+        array("I", shared + similar),
+        array("I", shared + variant),
+    ]
+    assert lsh.similarity(0, 1) < 0.75 <= lsh.similarity(1, 2)
+    assert lsh.clusters() == [[1, 2]]
+
+
+def test_minhash_oversized_bucket_is_skipped() -> None:
+    """Test that a bucket larger than max_bucket is counted and not compared."""
+    lsh = MinHashLSH(bands=1, max_bucket=2)
+    for _ in range(3):
+        lsh.add(TEXT)
+    assert lsh.clusters() == []
+    assert lsh.oversized_buckets == 1
+    lsh.max_bucket = 3
+    assert lsh.clusters() == [[0, 1, 2]]
+    assert lsh.oversized_buckets == 0
+
+
+def test_minhash_invalid_layout() -> None:
+    """Test that the signature length must split evenly into bands."""
+    with pytest.raises(ValueError, match="power of two"):
+        MinHashLSH(num_perm=24, bands=8)
@@ -0,0 +1,170 @@
+"""Tests for StageProfiler, MemoryProfiler, CallProfiler and PatternProfiler."""
+
+import pstats
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logseq_analyzer.logseq_file.file import LogseqFile
+from logseq_analyzer.patterns import content, double_curly
+from logseq_analyzer.utils.enums import Constant, CritContent, CritDblCurly, Output, TargetDir
+from logseq_analyzer.utils.profiling import (
+    NULL_TIMER,
+    CallProfiler,
+    MemoryProfiler,
+    PatternProfiler,
+    PatternTimer,
+    StageProfiler,
+    deep_sizeof,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    """Test that a disabled profiler hands out the shared no-op timer."""
+    profiler = StageProfiler()
+    assert profiler.timer("config") is NULL_TIMER
+    with profiler.timer("config"):
+        pass
+    assert not profiler.stages
+    assert profiler.report["parse"] == {"files": 0}
+
+
+def test_stage_timings_and_parse_histogram(tmp_path: Path) -> None:
+    """Test that stages accumulate, parse times are bucketed and the report is written."""
+    profiler = StageProfiler(enabled=True)
+    for _ in range(2):
+        with profiler.timer("write reports"):
+            pass
+    for seconds in (0.00005, 0.0004, 0.0006, 0.02, 2.0):
+        profiler.record_file(seconds)
+
+    assert profiler.stages["write reports"][1] == 2
+    parse = profiler.parse_stats
+    assert parse["files"] == 5
+    assert parse["max"] == 2.0
+    assert parse["p50"] == 0.0006
+    assert parse["histogram"]["<100us"] == 1
+    assert parse["histogram"]["<1ms"] == 2
+    assert parse["histogram"]["<50ms"] == 1
+    assert parse["histogram"][">=1s"] == 1
+    assert "write reports" in profiler.summary()
+    assert profiler.write(tmp_path) == tmp_path / Constant.PROFILE_FILE
+    assert StageProfiler.format_seconds(0.0123) == "12.3ms"
+
+
+def test_memory_profiler_stages_and_objects(tmp_path: Path) -> None:
+    """Test that memory stages record retained and peak memory and shared objects are counted once."""
+    memory = MemoryProfiler(top=3, site_threshold=0)
+    profiler = StageProfiler(memory=memory)
+    assert profiler.enabled
+    memory.start()
+    try:
+        kept = []
+        with profiler.timer("outer"):
+            with profiler.timer("inner"):
+                transient = [str(i) * 10 for i in range(20_000)]
+                del transient
+            kept.extend(str(i) * 10 for i in range(10_000))
+        shared = {"values": list(range(1000))}
+        profiler.measure("first", shared)
+        profiler.measure("second", [shared, kept])
+        report = profiler.report["memory"]
+        summary = profiler.summary()
+        profiler.write(tmp_path)
+    finally:
+        memory.stop()
+
+    stages = report["stages"]
+    assert stages["outer"]["retained"] > 0
+    assert stages["outer"]["peak"] >= stages["inner"]["peak"] > stages["inner"]["retained"]
+    assert 0 < len(stages["outer"]["top_sites"]) <= 3
+    assert stages["outer"]["top_sites"][0]["size_diff"] > 0
+    assert report["objects"]["second"]["size"] > deep_sizeof(kept, set()) > 0
+    assert "Retained" in summary
+    assert MemoryProfiler.format_bytes(-3 * 1024 * 1024) == "-3.0 MiB"
+
+
+def test_deep_sizeof_attributes() -> None:
+    """Test that measured objects break their size down by attribute."""
+    memory = MemoryProfiler()
+    profiler = StageProfiler(enabled=True)
+    memory.measure("profiler", profiler)
+    entry = memory.objects["profiler"]
+    assert entry["size"] >= sum(entry["attributes"].values())
+    assert "stages" in entry["attributes"]
+    memory.measure("again", profiler)
+    assert memory.objects["again"]["size"] == 0
+
+
+def test_call_profiler_writes_stats(tmp_path: Path) -> None:
+    """Test that a cProfile run is saved as a .pstats file and a cumulative-time summary."""
+    disabled = CallProfiler()
+    with disabled.profiling():
+        pass
+    assert disabled.write(tmp_path) == []
+
+    profiler = CallProfiler(enabled=True, top=5)
+    with profiler.profiling():
+        sorted(range(1000), key=str)
+    stats_path, summary_path = profiler.write(tmp_path)
+    assert stats_path == tmp_path / Constant.PSTATS_FILE
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+    assert "cumulative" in summary_path.read_text(encoding="utf-8")
+
+
+def test_pattern_profiler_instruments_and_restores(make_context: Callable[[str], AnalyzerContext]) -> None:
+    """Test that instrumented parsing gives the same data and records per-pattern and per-criterion counters."""
+    ctx = make_context("graph")
+    path = ctx.graph_dir / TargetDir.PAGE / "page.md"
+    path.write_text("- see [[Page A]] #tag\n- {{embed [[Page B]]}}\n- `code`\n", encoding="utf-8")
+    plain = LogseqFile(path)
+    plain.process(ctx)
+
+    profiler = PatternProfiler(enabled=True)
+    with profiler.instrument():
+        assert isinstance(content.TAG, PatternTimer)
+        timed = LogseqFile(path)
+        timed.process(ctx)
+    assert isinstance(content.TAG, re.Pattern)
+    assert all(isinstance(pattern, re.Pattern) for pattern in double_curly.PATTERN_MAP)
+    assert timed.data == plain.data
+
+    report = profiler.report
+    timings = report[Output.PATTERN_TIMINGS]
+    assert (timings["content.PAGE_REFERENCE"]["calls"], timings["content.PAGE_REFERENCE"]["matches"]) == (2, 3)
+    assert timings["content.BULLET"]["calls"] >= 1
+    assert timings["double_curly.ALL"]["scanned_chars"] > 0
+    seconds = [entry["seconds"] for entry in timings.values()]
+    assert seconds == sorted(seconds, reverse=True)
+    criteria = report[Output.PATTERN_CRITERIA_TIMINGS]
+    assert criteria[CritContent.TAG]["patterns"] == ["content.TAG"]
+    assert "double_curly.PAGE_EMBED" in criteria[CritDblCurly.PAGE_EMBEDS]["patterns"]
+
+
+def test_pattern_profiler_one_run_per_process() -> None:
+    """Test that a second pattern profiler is refused while the first is installed."""
+    first = PatternProfiler(enabled=True)
+    second = PatternProfiler(enabled=True)
+    with first.instrument():
+        with pytest.raises(RuntimeError, match="already active"), second.instrument():
+            pass
+        assert isinstance(content.TAG, PatternTimer)
+        assert not second.restore
+    assert isinstance(content.TAG, re.Pattern)
+    with second.instrument():
+        assert isinstance(content.TAG, PatternTimer)
+
+
+def test_disabled_pattern_profiler_leaves_patterns() -> None:
+    """Test that a disabled pattern profiler does not replace any pattern."""
+    profiler = PatternProfiler()
+    with profiler.instrument():
+        assert isinstance(content.TAG, re.Pattern)
+    assert not profiler.timers
@@ -0,0 +1,46 @@
+"""Tests for FileProgress and ConsoleProgress."""
+
+import io
+
+from logseq_analyzer.utils.progress import ConsoleProgress, FileProgress
+
+
+def test_file_progress_throttles_updates() -> None:
+    """Test that updates between discovery and the final one are throttled."""
+    updates: list[tuple[int, str]] = []
+    progress = FileProgress(lambda percent, label: updates.append((percent, label)), 20, 70, max_rate=1e-9)
+    progress.discover(4)
+    for _ in range(4):
+        progress.advance(1024)
+    assert len(updates) == 1
+    progress.finish()
+
+    assert [percent for percent, _ in updates] == [20, 70]
+    assert updates[-1][1].startswith("Processed 4/4 files (4.0 KiB),")
+    stats = progress.stats()
+    assert (stats["processed"], stats["bytes"], stats["eta"]) == (4, 4096, 0)
+
+
+def test_file_progress_percent_and_eta() -> None:
+    """Test the scaled percentage and an unthrottled update per file."""
+    updates: list[int] = []
+    progress = FileProgress(lambda percent, _: updates.append(percent), 0, 100, max_rate=1e9)
+    progress.discover(0)
+    assert progress.percent == 100
+    progress.discover(3)
+    progress.advance()
+    progress.advance()
+    assert updates[-2:] == [33, 66]
+    assert progress.stats()["eta"] is not None
+    assert "ETA" in progress.label()
+
+
+def test_console_progress_rewrites_line() -> None:
+    """Test that the console line is overwritten and ended at 100 percent."""
+    stream = io.StringIO()
+    console = ConsoleProgress(stream)
+    console.update(50, "a longer label")
+    console.update(100, "done")
+    text = stream.getvalue()
+    assert text.startswith("\r[ 50%] a longer label\r[100%] done")
+    assert text.endswith(" \n")
@@ -0,0 +1,55 @@
+"""Tests for SyntheticGraph."""
+
+from typing import TYPE_CHECKING
+
+from logseq_analyzer.utils.enums import Core, CritContent, CritDblCurly, CritDblParen, CritTask, TargetDir
+from logseq_analyzer.utils.synthetic_graph import SyntheticGraph
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from logseq_analyzer.analysis.index import FileIndex
+    from logseq_analyzer.config.context import AnalyzerContext
+
+
+def snapshot(root: Path) -> dict[str, tuple[str, float]]:
+    """Return the content and modification time of every file under a folder."""
+    return {
+        path.relative_to(root).as_posix(): (path.read_text(encoding="utf-8"), path.stat().st_mtime)
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_generation_is_deterministic(tmp_path: Path) -> None:
+    """Test that the same size and seed write the same files and a different seed does not."""
+    first = SyntheticGraph(tmp_path / "a", 300, seed=7).generate()
+    second = SyntheticGraph(tmp_path / "b", 300, seed=7).generate()
+    other = SyntheticGraph(tmp_path / "c", 300, seed=8).generate()
+    assert snapshot(first) == snapshot(second)
+    assert snapshot(first) != snapshot(other)
+    assert len(list((first / TargetDir.JOURNAL).iterdir())) == 60
+    assert len(list((first / TargetDir.PAGE).glob(f"{Core.HLS_PREFIX}*"))) == 3
+    assert any("___" in path.name for path in (first / TargetDir.PAGE).iterdir())
+
+
+def test_generated_pages_cover_the_parsed_criteria(
+    make_context: Callable[[str], AnalyzerContext], make_index: Callable[..., FileIndex]
+) -> None:
+    """Test that parsing the generated pages finds the main kinds of content."""
+    ctx = make_context("graph")
+    SyntheticGraph(ctx.graph_dir, 200).generate()
+    found = set()
+    for f in make_index(ctx):
+        found.update(f.data)
+    assert {
+        CritContent.PAGE_REF,
+        CritContent.TAG,
+        CritContent.BLOCK_IDS,
+        CritDblParen.BLOCK_REFS,
+        CritDblCurly.PAGE_EMBEDS,
+        CritDblCurly.BLOCK_EMBEDS,
+        CritTask.MARKERS,
+        CritTask.DEADLINES,
+    } <= found